@@ -1,14 +1,18 @@
 from .postgres import PostgresBackend
 from .resolve import resolve_backend
 from .sqlite import SQLiteBackend
-from .base import BackendCapabilities, DatabaseBackend, STAGING_SCHEMA, Dialect
+from .base import BackendCapabilities, BucketFingerprint, DatabaseBackend, IndexCostModel, PartitionInfo, STAGING_SCHEMA, Dialect, ViewIndex
 
 __all__ = [
     "BackendCapabilities",
+    "BucketFingerprint",
     "DatabaseBackend",
+    "IndexCostModel",
+    "PartitionInfo",
     "STAGING_SCHEMA",
     "Dialect",
     "PostgresBackend",
     "SQLiteBackend",
     "resolve_backend",
+    "ViewIndex",
 ]
@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import logging
+import threading
+import weakref
 from abc import ABC, abstractmethod
 from contextlib import AbstractContextManager, contextmanager, nullcontext
 from dataclasses import dataclass
@@ -12,10 +15,21 @@ import sqlalchemy.orm as so
 from sqlalchemy.engine import Connection, Engine
 from sqlalchemy.sql.compiler import IdentifierPreparer
 
+from ..helpers.errors import IngestError
+
 if TYPE_CHECKING:
     from ..loaders.data_classes import LoaderContext
+    from ..tables.allocators import BlockIdAllocator, IdAllocator
     from ..tables.typing import CSVTableProtocol
 
+logger = logging.getLogger(__name__)
+
+# Staging ``sa.Table`` objects per model class, keyed by (backend type, staging schema).
+_STAGING_TABLES: "weakref.WeakKeyDictionary[type, dict[tuple[type, str | None], sa.Table]]" = (
+    weakref.WeakKeyDictionary()
+)
+_STAGING_TABLES_LOCK = threading.Lock()
+
 
 @dataclass(frozen=True)
 class BackendCapabilities:
@@ -30,6 +44,111 @@ class BackendCapabilities:
     supports_unlogged_staging: bool = False
     supports_fk_toggle: bool = False
     supports_materialized_views: bool = False
+    supports_table_swap: bool = False
+    supports_partitioning: bool = False
+    supports_concurrent_index_build: bool = False
+    supports_fk_revalidation: bool = False
+    supports_staging_id_fill: bool = False
+    supports_materialized_view_emulation: bool = False
+
+
+@dataclass(frozen=True)
+class IndexCostModel:
+    """
+    Relative cost model used to resolve ``index_strategy="auto"``.
+
+    Keeping indexes costs one index insertion per staging row, which is
+    cheap while the indexes fit in cache (``keep_cost_per_row``) and much
+    dearer once they do not (``uncached_keep_cost_per_row``). Dropping and
+    rebuilding costs a sequential sort over every row the table will hold
+    (``rebuild_cost_per_row``). Costs are in arbitrary, comparable units.
+
+    Targets estimated below ``min_target_rows`` are left to the backend's
+    default strategy, since either choice is cheap at that size.
+    """
+
+    rebuild_cost_per_row: float = 1.0
+    keep_cost_per_row: float = 2.0
+    uncached_keep_cost_per_row: float = 20.0
+    cache_bytes: int = 1 << 30
+    min_target_rows: int = 100_000
+
+    def choose(
+        self,
+        *,
+        staging_rows: int,
+        target_rows: int,
+        index_bytes: int | None = None,
+    ) -> str:
+        """
+        Return ``"keep"`` or ``"drop_rebuild"``, whichever is estimated cheaper.
+
+        ``index_bytes`` is the combined size of the indexes that would be
+        dropped; when unknown they are assumed to fit in cache.
+        """
+        per_row = self.keep_cost_per_row
+        if index_bytes is not None and index_bytes > self.cache_bytes:
+            per_row = self.uncached_keep_cost_per_row
+        keep_cost = staging_rows * per_row
+        rebuild_cost = (target_rows + staging_rows) * self.rebuild_cost_per_row
+        return "drop_rebuild" if rebuild_cost < keep_cost else "keep"
+
+
+@dataclass(frozen=True)
+class PartitionInfo:
+    """
+    A leaf partition of a partitioned target table.
+
+    ``name`` and ``parent`` are ready-to-use SQL references. ``bound`` is
+    the ``FOR VALUES ...`` (or ``DEFAULT``) clause and ``constraint`` the
+    implied partition predicate over unqualified column names, as reported
+    by the database.
+    """
+
+    name: str
+    schema: str
+    relname: str
+    parent: str
+    bound: str
+    constraint: str
+
+
+@dataclass(frozen=True)
+class ViewIndex:
+    """
+    An index declared on a materialized view via ``__mv_indexes__``.
+
+    ``name`` defaults to ``ix_<view>_<columns>`` (``ux_`` when unique).
+    """
+
+    columns: tuple[str, ...]
+    unique: bool = False
+    name: str | None = None
+
+    def name_for(self, view_name: str) -> str:
+        if self.name is not None:
+            return self.name
+        prefix = "ux" if self.unique else "ix"
+        return f"{prefix}_{view_name}_{'_'.join(self.columns)}"
+
+
+@dataclass(frozen=True)
+class BucketFingerprint:
+    """
+    Order-independent content hash of the rows in one primary-key bucket.
+
+    ``bucket`` is ``pk / bucket_size`` (integer division). ``hash_sum`` is
+    the sum of a 32-bit integer derived from each row's hash, so it does
+    not depend on scan order; together with ``rows`` it identifies the
+    bucket's content. Fingerprints are only comparable between databases
+    of the same backend.
+    """
+
+    bucket: int
+    rows: int
+    hash_sum: int
+    min_pk: int
+    max_pk: int
 
 
 class Dialect(str, Enum):
@@ -103,6 +222,38 @@ class DatabaseBackend(ABC):
             self.staging_name_for_table(tablename), self.staging_schema, self.identifier_preparer
         )
 
+    def staging_columns(self, table_cls: Type["CSVTableProtocol"]) -> list[sa.Column]:
+        """
+        Return the columns of the staging table for ``table_cls``.
+
+        The default mirrors every target column as a nullable column of the
+        same type. Backends whose staging DDL differs override this so that
+        :meth:`staging_table_for` matches what :meth:`create_staging_table`
+        builds.
+        """
+        return [sa.Column(col.name, col.type.copy(), nullable=True) for col in table_cls.__table__.columns]
+
+    def staging_table_for(self, table_cls: Type["CSVTableProtocol"]) -> sa.Table:
+        """
+        Return the staging ``sa.Table`` for ``table_cls`` without touching the database.
+
+        The table is built from the model's columns via
+        :meth:`staging_columns` and memoised per model class, backend type
+        and staging schema, so repeated loads do not reflect the catalog.
+        """
+        key = (type(self), self.staging_schema)
+        with _STAGING_TABLES_LOCK:
+            per_class = _STAGING_TABLES.setdefault(table_cls, {})
+            table = per_class.get(key)
+            if table is None:
+                table = per_class[key] = sa.Table(
+                    self.staging_name_for_table(table_cls.__tablename__),
+                    sa.MetaData(),  # throwaway — keeps staging table out of Base.metadata
+                    *self.staging_columns(table_cls),
+                    schema=self.staging_schema,
+                )
+            return table
+
     @property
     @abstractmethod
     def name(self) -> str:
@@ -132,18 +283,73 @@ class DatabaseBackend(ABC):
         """Default index strategy used when callers request ``auto``."""
         return "drop_rebuild"
 
-    def resolve_index_strategy(self, index_strategy: str) -> str:
+    def resolve_index_strategy(
+        self,
+        index_strategy: str,
+        *,
+        table_cls: Type["CSVTableProtocol"] | None = None,
+        session: so.Session | None = None,
+        staging_rows: int | None = None,
+        cost_model: IndexCostModel | None = None,
+    ) -> str:
         """
         Resolve a caller-facing index strategy to a concrete backend choice.
+
+        When ``"auto"`` is requested with a table, session and staging row
+        count, the target's estimated size and index footprint are fed to
+        ``cost_model`` (or a default :class:`IndexCostModel`). Without
+        those inputs, or when the target's size cannot be estimated or is
+        below the model's ``min_target_rows``, ``default_index_strategy``
+        is used.
         """
         valid = {"auto", "drop_rebuild", "keep"}
         if index_strategy not in valid:
             raise ValueError(
                 f"Unknown index_strategy '{index_strategy}'. Expected one of: {sorted(valid)}"
             )
-        if index_strategy == "auto":
+        if index_strategy != "auto":
+            return index_strategy
+        if table_cls is None or session is None or staging_rows is None:
             return self.default_index_strategy
-        return index_strategy
+
+        model = cost_model or IndexCostModel()
+        table_name = table_cls.__tablename__
+        if not table_cls.__table__.indexes:
+            return self.default_index_strategy
+        target_rows = self.estimate_row_count(session, table_name)
+        if target_rows is None or target_rows < model.min_target_rows:
+            logger.info(
+                f"Table `{table_name}`: index_strategy=auto -> {self.default_index_strategy} "
+                f"(backend default; estimated target rows={target_rows}, staging rows={staging_rows})."
+            )
+            return self.default_index_strategy
+
+        index_bytes = self.index_size_bytes(session, table_name)
+        resolved = model.choose(
+            staging_rows=staging_rows, target_rows=target_rows, index_bytes=index_bytes
+        )
+        logger.info(
+            f"Table `{table_name}`: index_strategy=auto -> {resolved} "
+            f"(estimated target rows={target_rows}, staging rows={staging_rows}, "
+            f"index bytes={index_bytes}, indexes={len(table_cls.__table__.indexes)})."
+        )
+        return resolved
+
+    def estimate_row_count(self, session: so.Session, table_name: str) -> int | None:
+        """
+        Return the planner's row estimate for ``table_name`` without scanning it.
+
+        ``None`` means no estimate is available.
+        """
+        return None
+
+    def index_size_bytes(self, session: so.Session, table_name: str) -> int | None:
+        """
+        Return the combined on-disk size of the table's non-primary-key indexes.
+
+        ``None`` means the size cannot be determined on this backend.
+        """
+        return None
 
     def _require_capability(self, capability_name: str, feature_name: str) -> None:
         """
@@ -181,6 +387,275 @@ class DatabaseBackend(ABC):
         """
         return [c.name for c in table_cls.__table__.columns if c.computed is None]
 
+    def row_hash_column(
+        self,
+        table_cls: Type["CSVTableProtocol"],
+    ) -> str | None:
+        """
+        Return the opt-in row-hash column declared via ``__row_hash_column__``.
+
+        Returns ``None`` when the table does not maintain a row hash.
+        """
+        name = getattr(table_cls, "__row_hash_column__", None)
+        if name is None:
+            return None
+        if name not in table_cls.__table__.columns:
+            raise ValueError(
+                f"Table `{table_cls.__tablename__}`: __row_hash_column__ {name!r} "
+                "is not a column on the table"
+            )
+        return name
+
+    def _content_column_names(
+        self,
+        table_cls: Type["CSVTableProtocol"],
+    ) -> list[str]:
+        """
+        Return the columns that contribute to a row hash.
+
+        This is every insertable column except the row-hash column itself,
+        in table order so that hashes are stable across loads.
+        """
+        hash_col = self.row_hash_column(table_cls)
+        return [c for c in self._insertable_column_names(table_cls) if c != hash_col]
+
+    def row_hash_sql(self, column_refs: list[str]) -> str:
+        """
+        Return a SQL expression hashing the supplied column references.
+
+        ``column_refs`` are already quoted (and optionally alias-qualified).
+        The expression must be deterministic for equal inputs on the same
+        backend; hashes are not comparable across backends.
+        """
+        raise NotImplementedError(f"Backend '{self.name}' does not support SQL row hashing")
+
+    def staging_row_hash_sql(self, table_cls: Type["CSVTableProtocol"], alias: str | None = None) -> str:
+        """
+        Return the row-hash expression over the staging row's content columns.
+
+        Merges compute the hash in the statement that writes the row, so
+        staging is never rewritten just to fill the hash column.
+        """
+        preparer = self.identifier_preparer
+        prefix = f"{alias}." if alias else ""
+        return self.row_hash_sql(
+            [f"{prefix}{preparer.quote_identifier(c)}" for c in self._content_column_names(table_cls)]
+        )
+
+    def _staging_select_list(
+        self,
+        table_cls: Type["CSVTableProtocol"],
+        columns: list[str],
+        alias: str | None = None,
+    ) -> str:
+        """
+        Return the SELECT list copying ``columns`` from staging, with the
+        row-hash column (if declared) derived from the content columns.
+        """
+        preparer = self.identifier_preparer
+        hash_col = self.row_hash_column(table_cls)
+        prefix = f"{alias}." if alias else ""
+        return ", ".join(
+            self.staging_row_hash_sql(table_cls, alias) if c == hash_col
+            else f"{prefix}{preparer.quote_identifier(c)}"
+            for c in columns
+        )
+
+    def hash_to_int_sql(self, hash_sql: str) -> str:
+        """
+        Return a SQL expression turning a hex row hash into a non-negative
+        32-bit integer, used to sum hashes order-independently.
+        """
+        raise NotImplementedError(f"Backend '{self.name}' does not support SQL row hashing")
+
+    def register_session_functions(self, session: so.Session) -> None:
+        """
+        Make sure any SQL functions the backend relies on exist on the
+        session's connection. The default is a no-op.
+        """
+
+    def _fingerprint_parts(
+        self,
+        table_cls: Type["CSVTableProtocol"],
+        use_stored_hash: bool,
+    ) -> tuple[str, str]:
+        preparer = self.identifier_preparer
+        pk_col = self._sync_range_column(table_cls, [c.name for c in table_cls.__table__.primary_key.columns])
+        if pk_col is None:
+            raise ValueError(
+                f"Table `{table_cls.__tablename__}`: bucketed fingerprints require a single integer primary key"
+            )
+        if use_stored_hash:
+            hash_col = self.row_hash_column(table_cls)
+            if hash_col is None:
+                raise ValueError(
+                    f"Table `{table_cls.__tablename__}` does not declare __row_hash_column__"
+                )
+            hash_sql = f"t.{preparer.quote_identifier(hash_col)}"
+        else:
+            hash_sql = self.row_hash_sql(
+                [f"t.{preparer.quote_identifier(c)}" for c in self._content_column_names(table_cls)]
+            )
+        return f"t.{preparer.quote_identifier(pk_col)}", hash_sql
+
+    def bucket_fingerprints(
+        self,
+        table_cls: Type["CSVTableProtocol"],
+        session: so.Session,
+        table_ref: str,
+        *,
+        bucket_size: int,
+        use_stored_hash: bool = False,
+    ) -> list[BucketFingerprint]:
+        """
+        Compute one :class:`BucketFingerprint` per primary-key bucket in SQL.
+
+        Row hashes are computed in the database (or read from the stored
+        row-hash column with ``use_stored_hash``) and aggregated with
+        ``COUNT`` and ``SUM`` in a single grouped scan.
+        """
+        if bucket_size < 1:
+            raise ValueError("bucket_size must be a positive integer")
+        self.register_session_functions(session)
+        pk_ref, hash_sql = self._fingerprint_parts(table_cls, use_stored_hash)
+        rows = session.execute(
+            sa.text(
+                f"SELECT {pk_ref} / :bucket_size AS bucket, COUNT(*),"
+                f" SUM({self.hash_to_int_sql(hash_sql)}), MIN({pk_ref}), MAX({pk_ref})"
+                f" FROM {table_ref} t GROUP BY {pk_ref} / :bucket_size ORDER BY 1"
+            ),
+            {"bucket_size": bucket_size},
+        ).all()
+        return [
+            BucketFingerprint(int(b), int(n), int(total or 0), int(lo), int(hi))
+            for b, n, total, lo, hi in rows
+        ]
+
+    def row_fingerprints(
+        self,
+        table_cls: Type["CSVTableProtocol"],
+        session: so.Session,
+        table_ref: str,
+        *,
+        bucket: int,
+        bucket_size: int,
+        use_stored_hash: bool = False,
+    ) -> dict[int, str]:
+        """
+        Return ``{pk: row hash}`` for the rows of one bucket.
+
+        The bucket is translated back into a primary-key range so the scan
+        can use the primary key index.
+        """
+        if bucket_size < 1:
+            raise ValueError("bucket_size must be a positive integer")
+        self.register_session_functions(session)
+        pk_ref, hash_sql = self._fingerprint_parts(table_cls, use_stored_hash)
+        # Integer division truncates towards zero, so bucket 0 spans both signs.
+        if bucket > 0:
+            low, high = bucket * bucket_size - 1, (bucket + 1) * bucket_size
+        elif bucket < 0:
+            low, high = (bucket - 1) * bucket_size, bucket * bucket_size + 1
+        else:
+            low, high = -bucket_size, bucket_size
+        rows = session.execute(
+            sa.text(
+                f"SELECT {pk_ref}, {hash_sql} FROM {table_ref} t"
+                f" WHERE {pk_ref} > :low AND {pk_ref} < :high ORDER BY 1"
+            ),
+            {"low": low, "high": high},
+        ).all()
+        return {int(pk): str(h) for pk, h in rows}
+
+    def update_row_hashes(
+        self,
+        table_cls: Type["CSVTableProtocol"],
+        session: so.Session,
+        table_ref: str,
+        *,
+        only_missing: bool = False,
+    ) -> None:
+        """
+        Recompute the row-hash column in SQL for every row of ``table_ref``.
+
+        ``table_ref`` is a quoted table reference shaped like the target
+        (the target itself or its staging table). With ``only_missing`` only
+        rows whose hash is currently ``NULL`` are updated, which is how an
+        existing target is backfilled after the column is introduced.
+        """
+        hash_col = self.row_hash_column(table_cls)
+        if hash_col is None:
+            raise ValueError(
+                f"Table `{table_cls.__tablename__}` does not declare __row_hash_column__"
+            )
+        self.register_session_functions(session)
+        preparer = self.identifier_preparer
+        hash_ref = preparer.quote_identifier(hash_col)
+        expr = self.row_hash_sql(
+            [preparer.quote_identifier(c) for c in self._content_column_names(table_cls)]
+        )
+        where = f" WHERE {hash_ref} IS NULL" if only_missing else ""
+        session.execute(sa.text(f"UPDATE {table_ref} SET {hash_ref} = {expr}{where}"))
+
+    def classify_staging_rows(
+        self,
+        table_cls: Type["CSVTableProtocol"],
+        session: so.Session,
+        target_name: str,
+        pk_cols: list[str],
+    ) -> dict[str, int]:
+        """
+        Classify staging rows against the target using the row-hash column.
+
+        Staging hashes are computed in the query, so the staging table is
+        only read. Target rows with a ``NULL`` hash (loaded before the
+        column was introduced) count as changed.
+
+        Returns
+        -------
+        dict[str, int]
+            Counts keyed by ``new``, ``changed``, ``unchanged`` and
+            ``deleted`` (target rows with no matching staging PK).
+        """
+        hash_col = self.row_hash_column(table_cls)
+        if hash_col is None:
+            raise ValueError(
+                f"Table `{table_cls.__tablename__}` does not declare __row_hash_column__"
+            )
+        self.register_session_functions(session)
+        preparer = self.identifier_preparer
+        staging_ref = self.qualified_staging_name(table_cls.__tablename__)
+        target_ref = preparer.quote_identifier(target_name)
+        hash_ref = preparer.quote_identifier(hash_col)
+        staged_hash = self.staging_row_hash_sql(table_cls, "s")
+        first_pk = preparer.quote_identifier(pk_cols[0])
+        pk_join = " AND ".join(
+            f't.{preparer.quote_identifier(c)} = s.{preparer.quote_identifier(c)}' for c in pk_cols
+        )
+
+        new, changed, unchanged = session.execute(
+            sa.text(
+                f'SELECT'
+                f' COALESCE(SUM(CASE WHEN t.{first_pk} IS NULL THEN 1 ELSE 0 END), 0),'
+                f' COALESCE(SUM(CASE WHEN t.{first_pk} IS NOT NULL'
+                f' AND (t.{hash_ref} IS NULL OR t.{hash_ref} <> {staged_hash}) THEN 1 ELSE 0 END), 0),'
+                f' COALESCE(SUM(CASE WHEN t.{hash_ref} = {staged_hash} THEN 1 ELSE 0 END), 0)'
+                f' FROM {staging_ref} s LEFT JOIN {target_ref} t ON {pk_join}'
+            )
+        ).one()
+        deleted = session.execute(
+            sa.text(
+                f'SELECT COUNT(*) FROM {target_ref} t'
+                f' WHERE NOT EXISTS (SELECT 1 FROM {staging_ref} s WHERE {pk_join})'
+            )
+        ).scalar_one()
+        return {
+            "new": int(new),
+            "changed": int(changed),
+            "unchanged": int(unchanged),
+            "deleted": int(deleted),
+        }
+
     @abstractmethod
     def create_staging_table(
         self,
@@ -197,6 +672,52 @@ class DatabaseBackend(ABC):
     ) -> None:
         """Drop a staging table if it exists."""
 
+    def truncate_staging_table(
+        self,
+        table_cls: Type["CSVTableProtocol"],
+        session: so.Session,
+    ) -> None:
+        """
+        Empty the staging table so it can be reused by the next load.
+
+        The default issues ``DELETE FROM`` and commits.
+        """
+        session.execute(sa.text(f"DELETE FROM {self.qualified_staging_name(table_cls.__tablename__)}"))
+        session.commit()
+
+    def prepare_staging_ids(
+        self,
+        table_cls: Type["CSVTableProtocol"],
+        session: so.Session,
+        id_column: str,
+    ) -> None:
+        """
+        Allow ``id_column`` to be staged as NULL so missing surrogate keys
+        can be filled after the load.
+
+        The default is a no-op: staging columns are already nullable.
+        """
+
+    def fill_staging_ids(
+        self,
+        table_cls: Type["CSVTableProtocol"],
+        session: so.Session,
+        id_column: str,
+        *,
+        allocator: "IdAllocator | BlockIdAllocator | None" = None,
+        sequence: str | None = None,
+    ) -> int:
+        """
+        Fill missing ``id_column`` values in the staging table server-side.
+
+        Used when rows reach staging without passing through a loader
+        (fast-path COPY) or when keys come from a database sequence.
+        Exactly one of ``allocator`` or ``sequence`` is expected; returns
+        the number of keys assigned.
+        """
+        self._require_capability("supports_staging_id_fill", "server-side surrogate key assignment")
+        return 0
+
     def load_staging_fast(
         self,
         loader_context: "LoaderContext",
@@ -269,6 +790,320 @@ class DatabaseBackend(ABC):
     ) -> None:
         """Insert all staging rows into the target table."""
 
+    def null_safe_distinct_sql(self, left: str, right: str) -> str:
+        """Return a predicate that is true when ``left`` and ``right`` differ, treating NULLs as equal."""
+        return f"{left} IS DISTINCT FROM {right}"
+
+    def _sync_range_column(
+        self,
+        table_cls: Type["CSVTableProtocol"],
+        pk_cols: list[str],
+    ) -> str | None:
+        """Return the PK column sync batches are keyed on, or ``None`` if ranges do not apply."""
+        if len(pk_cols) != 1:
+            return None
+        column = table_cls.__table__.columns[pk_cols[0]]
+        try:
+            python_type = column.type.python_type
+        except NotImplementedError:
+            return None
+        return pk_cols[0] if python_type is int else None
+
+    def merge_sync(
+        self,
+        table_cls: Type["CSVTableProtocol"],
+        session: so.Session,
+        target_name: str,
+        pk_cols: list[str],
+        *,
+        merge_batch_size: int | None = None,
+        delete_missing: bool = True,
+        allow_empty: bool = False,
+    ) -> dict[str, int]:
+        """
+        Make the target match staging: delete missing, update changed, insert new.
+
+        Changed rows are detected with the ``__row_hash_column__`` when the
+        table declares one (the staging side is hashed inside the
+        statements), and otherwise by a null-safe comparison of every
+        content column. With ``delete_missing=False`` target rows absent
+        from staging are kept, which is how ``replace`` merges hashed
+        tables without rewriting unchanged rows.
+
+        With ``merge_batch_size`` and a single integer primary key, the
+        three statements run per page of that many staged keys (keyset
+        pagination, ``WHERE pk > last ORDER BY pk LIMIT n``), committing
+        after each page so no single transaction touches the whole table.
+        Composite or non-integer keys are synced in one pass.
+
+        An empty staging table would delete every target row, which is far
+        more often a truncated or missing snapshot than an intended purge,
+        so it is refused unless ``allow_empty`` is set.
+
+        Returns
+        -------
+        dict[str, int]
+            Affected row counts keyed by ``deleted``, ``updated`` and
+            ``inserted``.
+
+        Raises
+        ------
+        IngestError
+            If ``delete_missing`` is set, staging is empty and
+            ``allow_empty`` is not.
+        """
+        preparer = self.identifier_preparer
+        staging_ref = self.qualified_staging_name(table_cls.__tablename__)
+        target_ref = preparer.quote_identifier(target_name)
+        if delete_missing and not allow_empty:
+            staged = session.execute(sa.text(f"SELECT 1 FROM {staging_ref} LIMIT 1")).scalar()
+            if staged is None:
+                raise IngestError(
+                    f"Table `{target_name}`: staging is empty, so sync would delete every row; "
+                    "pass allow_empty=True to empty the table on purpose"
+                )
+        insertable_cols = self._insertable_column_names(table_cls)
+        cols_str = ", ".join(preparer.quote_identifier(c) for c in insertable_cols)
+        select_str = self._staging_select_list(table_cls, insertable_cols, "s")
+        pk_join = " AND ".join(
+            f't.{preparer.quote_identifier(c)} = s.{preparer.quote_identifier(c)}' for c in pk_cols
+        )
+
+        hash_col = self.row_hash_column(table_cls)
+        if hash_col is not None:
+            self.register_session_functions(session)
+            hash_ref = preparer.quote_identifier(hash_col)
+            changed = f"(t.{hash_ref} IS NULL OR t.{hash_ref} <> {self.staging_row_hash_sql(table_cls, 's')})"
+        else:
+            content_cols = [c for c in insertable_cols if c not in pk_cols]
+            changed = " OR ".join(
+                self.null_safe_distinct_sql(
+                    f"t.{preparer.quote_identifier(c)}", f"s.{preparer.quote_identifier(c)}"
+                )
+                for c in content_cols
+            ) or "1 = 0"
+            changed = f"({changed})"
+
+        set_clause = ", ".join(
+            f"{preparer.quote_identifier(c)} = {self._staging_select_list(table_cls, [c], 's')}"
+            for c in insertable_cols
+            if c not in pk_cols
+        )
+
+        counts = {"deleted": 0, "updated": 0, "inserted": 0}
+
+        def _run(t_range: str, s_range: str, params: dict[str, int]) -> None:
+            statements: list[tuple[str, str]] = [
+                (
+                    "inserted",
+                    f'INSERT INTO {target_ref} ({cols_str})'
+                    f' SELECT {select_str} FROM {staging_ref} s'
+                    f' WHERE NOT EXISTS (SELECT 1 FROM {target_ref} t WHERE {pk_join}){s_range}',
+                ),
+            ]
+            if delete_missing:
+                statements.insert(0, (
+                    "deleted",
+                    f'DELETE FROM {target_ref} AS t'
+                    f' WHERE NOT EXISTS (SELECT 1 FROM {staging_ref} s WHERE {pk_join}){t_range}',
+                ))
+            if set_clause:
+                # Runs before the insert so freshly inserted rows are not re-compared.
+                statements.insert(len(statements) - 1, (
+                    "updated",
+                    f'UPDATE {target_ref} AS t SET {set_clause}'
+                    f' FROM {staging_ref} s WHERE {pk_join} AND {changed}{s_range}',
+                ))
+            for key, sql in statements:
+                result = session.execute(sa.text(sql), params)
+                rowcount = getattr(result, "rowcount", 0)
+                if isinstance(rowcount, int) and rowcount > 0:
+                    counts[key] += rowcount
+
+        range_col = self._sync_range_column(table_cls, pk_cols) if merge_batch_size else None
+        if range_col is None or merge_batch_size is None:
+            _run("", "", {})
+            return counts
+
+        # Keyset pagination over staging: each batch covers the next
+        # ``merge_batch_size`` staged keys, so sparse keys never produce
+        # empty batches. Target-only keys between batches fall into the
+        # range of the batch that follows them.
+        range_ref = preparer.quote_identifier(range_col)
+        last: int | None = None
+        while True:
+            after = "" if last is None else f" WHERE {range_ref} > :last"
+            params: dict[str, int] = {"n": merge_batch_size} if last is None else {"n": merge_batch_size, "last": last}
+            upper = session.execute(
+                sa.text(
+                    f'SELECT MAX(k) FROM (SELECT {range_ref} AS k FROM {staging_ref}{after}'
+                    f' ORDER BY {range_ref} LIMIT :n) page'
+                ),
+                params,
+            ).scalar()
+            if upper is None:
+                break
+            params = {"upper": int(upper)} if last is None else {"upper": int(upper), "last": last}
+            lower = "" if last is None else " AND {a}.{col} > :last"
+            page = lower + " AND {a}.{col} <= :upper"
+            _run(page.format(a="t", col=range_ref), page.format(a="s", col=range_ref), params)
+            session.commit()
+            last = int(upper)
+
+        if delete_missing:
+            # Target rows past the last staged key have no staging match at all.
+            tail = "" if last is None else f" WHERE {range_ref} > :last"
+            result = session.execute(
+                sa.text(f"DELETE FROM {target_ref}{tail}"),
+                {"last": last} if last is not None else {},
+            )
+            rowcount = getattr(result, "rowcount", 0)
+            if isinstance(rowcount, int) and rowcount > 0:
+                counts["deleted"] += rowcount
+            session.commit()
+        return counts
+
+    def merge_swap(
+        self,
+        table_cls: Type["CSVTableProtocol"],
+        session: so.Session,
+        target_name: str,
+        pk_cols: list[str],
+        *,
+        merge_batch_size: int | None = None,
+    ) -> None:
+        """
+        Replace the target wholesale with a freshly built copy of staging.
+
+        Backends that support it build and index a new table from staging,
+        then rename it over the target in a short transaction.
+        """
+        self._require_capability("supports_table_swap", "swap-in table loads")
+
+    def partitions_for(
+        self,
+        session: so.Session,
+        target_name: str,
+    ) -> list[PartitionInfo]:
+        """
+        Return the leaf partitions of ``target_name``.
+
+        An empty list means the target is not partitioned (or the backend
+        has no notion of partitioning) and merges treat it as a flat table.
+        """
+        return []
+
+    def merge_replace_partitions(
+        self,
+        table_cls: Type["CSVTableProtocol"],
+        session: so.Session,
+        target_name: str,
+        pk_cols: list[str],
+        *,
+        merge_batch_size: int | None = None,
+    ) -> None:
+        """
+        Rebuild every partition that staging rows fall into, replacing its contents.
+
+        Partitions without staging rows are left untouched.
+        """
+        self._require_capability("supports_partitioning", "partition-level reloads")
+
+    def configure_index_build(
+        self,
+        conn: Connection,
+        *,
+        maintenance_work_mem: str | None = None,
+        max_parallel_maintenance_workers: int | None = None,
+    ) -> None:
+        """
+        Apply per-transaction settings before a ``CREATE INDEX`` on ``conn``.
+
+        The default implementation ignores the settings.
+        """
+
+    def check_foreign_keys(
+        self,
+        table_cls: Type["CSVTableProtocol"],
+        session: so.Session,
+        target_name: str,
+        pk_cols: list[str],
+    ) -> dict[str, int]:
+        """
+        Count merged rows that violate the model's declared foreign keys.
+
+        Only target rows whose primary key is present in staging are
+        checked, so the cost follows the size of the delta rather than the
+        table. Rows with a ``NULL`` in any FK column are skipped, matching
+        ``MATCH SIMPLE`` semantics.
+
+        Returns
+        -------
+        dict[str, int]
+            Violation counts keyed by constraint name, one entry per
+            declared foreign key (zero when the constraint holds).
+        """
+        from ..helpers.sql import qualify_identifier
+
+        preparer = self.identifier_preparer
+        staging_ref = self.qualified_staging_name(table_cls.__tablename__)
+        target_ref = preparer.quote_identifier(target_name)
+        pk_join = " AND ".join(
+            f't.{preparer.quote_identifier(c)} = s.{preparer.quote_identifier(c)}' for c in pk_cols
+        )
+
+        results: dict[str, int] = {}
+        for fk in sorted(table_cls.__table__.foreign_key_constraints, key=lambda c: str(c.name)):
+            local_cols = [e.parent.name for e in fk.elements]
+            remote_cols = [e.column.name for e in fk.elements]
+            referred = fk.referred_table
+            referred_ref = qualify_identifier(referred.name, referred.schema, preparer)
+            not_null = " AND ".join(f"t.{preparer.quote_identifier(c)} IS NOT NULL" for c in local_cols)
+            match = " AND ".join(
+                f"r.{preparer.quote_identifier(rc)} = t.{preparer.quote_identifier(lc)}"
+                for lc, rc in zip(local_cols, remote_cols)
+            )
+            name = str(fk.name) if fk.name else f"{target_name}({', '.join(local_cols)}) -> {referred.name}"
+            results[name] = int(
+                session.execute(
+                    sa.text(
+                        f"SELECT COUNT(*) FROM {target_ref} t JOIN {staging_ref} s ON {pk_join}"
+                        f" WHERE {not_null}"
+                        f" AND NOT EXISTS (SELECT 1 FROM {referred_ref} r WHERE {match})"
+                    )
+                ).scalar_one()
+            )
+        return results
+
+    def revalidate_foreign_keys(
+        self,
+        session: so.Session,
+        target_name: str,
+        *,
+        workers: int = 1,
+    ) -> dict[str, float]:
+        """
+        Re-create the target's foreign keys as ``NOT VALID`` and validate them.
+
+        Returns validation time in seconds per constraint.
+        """
+        self._require_capability("supports_fk_revalidation", "foreign key revalidation")
+        return {}
+
+    def id_block_transaction(self, engine: Engine) -> AbstractContextManager[Connection]:
+        """
+        Return a transaction in which an ID block can be leased atomically.
+
+        The default is an ordinary ``engine.begin()`` transaction; the
+        ``UPDATE`` on the allocation row takes a row lock, which serialises
+        concurrent leases.
+        """
+        return engine.begin()
+
+    def insert_ignore(self, table: sa.Table) -> sa.Insert:
+        """Return an ``INSERT`` that silently skips rows conflicting on the primary key."""
+        raise NotImplementedError(f"Backend '{self.name}' does not support insert-or-ignore")
+
     def merge_context(
         self,
         table_cls: Type["CSVTableProtocol"],
@@ -315,13 +1150,52 @@ class DatabaseBackend(ABC):
         bind: "Engine | Connection",
         name: str,
         selectable: sa.sql.Select[Any],
+        *,
+        indexes: tuple[ViewIndex, ...] = (),
     ) -> None:
-        """Create a materialized view for the supplied selectable."""
+        """Create a materialized view for the supplied selectable, with ``indexes``."""
+
+    def create_view_indexes(
+        self,
+        conn: Connection,
+        name: str,
+        indexes: tuple[ViewIndex, ...],
+    ) -> None:
+        """Create the declared indexes of view ``name`` if they do not exist."""
+        preparer = self.identifier_preparer
+        for index in indexes:
+            cols = ", ".join(preparer.quote(c) for c in index.columns)
+            conn.execute(
+                sa.text(
+                    f"CREATE {'UNIQUE ' if index.unique else ''}INDEX IF NOT EXISTS "
+                    f"{preparer.quote(index.name_for(name))} ON {preparer.quote(name)} ({cols})"
+                )
+            )
 
     @abstractmethod
     def refresh_materialized_view(
         self,
         bind: "Engine | Connection",
         name: str,
+        *,
+        concurrently: bool = False,
     ) -> None:
-        """Refresh a materialized view."""
+        """
+        Refresh a materialized view.
+
+        With ``concurrently`` the refresh does not block readers; the view
+        must have a unique index (see :meth:`has_unique_index`).
+        """
+
+    def has_unique_index(
+        self,
+        bind: "Engine | Connection",
+        name: str,
+    ) -> bool:
+        """
+        Return whether ``name`` has a unique index that allows a concurrent
+        materialized view refresh.
+
+        The default is ``False``.
+        """
+        return False
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from contextlib import AbstractContextManager, contextmanager
+from time import perf_counter
 from typing import TYPE_CHECKING, Any
 
 import sqlalchemy as sa
@@ -9,20 +10,40 @@ import sqlalchemy.orm as so
 from sqlalchemy.dialects import postgresql
 from sqlalchemy.sql.compiler import IdentifierPreparer
 
-from .base import BackendCapabilities, DatabaseBackend, Dialect
+from ..helpers.errors import IngestError
+from .base import BackendCapabilities, DatabaseBackend, Dialect, PartitionInfo, ViewIndex
 
 if TYPE_CHECKING:
     from sqlalchemy.engine import Connection, Engine
 
     from ..loaders.data_classes import LoaderContext
+    from ..tables.allocators import BlockIdAllocator, IdAllocator
     from ..tables.typing import CSVTableProtocol
 
 _VALID_PG_REPLICATION_ROLES = frozenset({"origin", "local", "replica"})
 
 
+def _sql_literal_text(sql: str) -> str:
+    """Escape catalog-generated SQL (e.g. ``'2024-01-01'::date``) for use in ``sa.text``."""
+    return sql.replace(":", "\\:")
+
+
 class PostgresBackend(DatabaseBackend):
-    def __init__(self, *, staging_schema: str | None = None) -> None:
+    def __init__(
+        self,
+        *,
+        staging_schema: str | None = None,
+        lock_timeout_ms: int | None = 5000,
+    ) -> None:
         super().__init__(staging_schema=staging_schema)
+        if lock_timeout_ms is not None and lock_timeout_ms < 0:
+            raise ValueError(f"lock_timeout_ms must be non-negative or None, got {lock_timeout_ms}")
+        self.lock_timeout_ms = lock_timeout_ms
+
+    def _set_lock_timeout(self, session: so.Session) -> None:
+        """Bound how long the current transaction waits for an ``ACCESS EXCLUSIVE`` lock."""
+        if self.lock_timeout_ms is not None:
+            session.execute(sa.text(f"SET LOCAL lock_timeout = '{int(self.lock_timeout_ms)}ms'"))
 
     @staticmethod
     def staging_name_for_table(tablename: str) -> str:
@@ -47,8 +68,44 @@ class PostgresBackend(DatabaseBackend):
             supports_unlogged_staging=True,
             supports_fk_toggle=True,
             supports_materialized_views=True,
+            supports_table_swap=True,
+            supports_partitioning=True,
+            supports_concurrent_index_build=True,
+            supports_fk_revalidation=True,
+            supports_staging_id_fill=True,
         )
 
+    def estimate_row_count(self, session: so.Session, table_name: str) -> int | None:
+        # reltuples is -1 until the table has been vacuumed or analysed.
+        estimate = session.execute(
+            sa.text("SELECT reltuples FROM pg_class WHERE oid = to_regclass(:table)"),
+            {"table": self.identifier_preparer.quote_identifier(table_name)},
+        ).scalar()
+        if estimate is None or estimate < 0:
+            return None
+        return int(estimate)
+
+    def index_size_bytes(self, session: so.Session, table_name: str) -> int | None:
+        size = session.execute(
+            sa.text(
+                "SELECT COALESCE(SUM(pg_relation_size(indexrelid)), 0) FROM pg_index"
+                " WHERE indrelid = to_regclass(:table) AND NOT indisprimary"
+            ),
+            {"table": self.identifier_preparer.quote_identifier(table_name)},
+        ).scalar()
+        return None if size is None else int(size)
+
+    def staging_columns(self, table_cls: type["CSVTableProtocol"]) -> list[sa.Column]:
+        # Mirrors create_staging_table: LIKE keeps nullability, computed columns are dropped
+        # and an identity _rownum is appended.
+        columns = [
+            sa.Column(col.name, col.type.copy(), nullable=col.nullable)
+            for col in table_cls.__table__.columns
+            if col.computed is None
+        ]
+        columns.append(sa.Column("_rownum", sa.BigInteger, sa.Identity(always=True, cache=1000), nullable=False))
+        return columns
+
     def create_staging_table(
         self,
         table_cls: type["CSVTableProtocol"],
@@ -89,6 +146,86 @@ class PostgresBackend(DatabaseBackend):
     ) -> None:
         session.execute(sa.text(f'DROP TABLE IF EXISTS {self.qualified_staging_name(table_cls.__tablename__)}'))
 
+    def truncate_staging_table(
+        self,
+        table_cls: type["CSVTableProtocol"],
+        session: so.Session,
+    ) -> None:
+        # RESTART IDENTITY resets _rownum so pagination ranges start from 1 again
+        session.execute(
+            sa.text(f"TRUNCATE TABLE {self.qualified_staging_name(table_cls.__tablename__)} RESTART IDENTITY")
+        )
+        session.commit()
+
+    def row_hash_sql(self, column_refs: list[str]) -> str:
+        return f"md5(ROW({', '.join(column_refs)})::text)"
+
+    def hash_to_int_sql(self, hash_sql: str) -> str:
+        return f"('x' || substr({hash_sql}, 1, 8))::bit(32)::bigint"
+
+    def prepare_staging_ids(
+        self,
+        table_cls: type["CSVTableProtocol"],
+        session: so.Session,
+        id_column: str,
+    ) -> None:
+        # LIKE copies NOT NULL from the PK; drop it so COPY accepts rows without a key.
+        staging_ref = self.qualified_staging_name(table_cls.__tablename__)
+        session.execute(
+            sa.text(
+                f"ALTER TABLE {staging_ref} ALTER COLUMN {self.identifier_preparer.quote_identifier(id_column)}"
+                f" DROP NOT NULL"
+            )
+        )
+        session.commit()
+
+    def fill_staging_ids(
+        self,
+        table_cls: type["CSVTableProtocol"],
+        session: so.Session,
+        id_column: str,
+        *,
+        allocator: "IdAllocator | BlockIdAllocator | None" = None,
+        sequence: str | None = None,
+    ) -> int:
+        if (allocator is None) == (sequence is None):
+            raise ValueError("fill_staging_ids needs exactly one of allocator or sequence")
+
+        staging_ref = self.qualified_staging_name(table_cls.__tablename__)
+        id_ref = self.identifier_preparer.quote_identifier(id_column)
+
+        if allocator is None:
+            # nextval() hands out a block per statement; sequence CACHE controls contention.
+            result = session.execute(
+                sa.text(
+                    f"UPDATE {staging_ref} SET {id_ref} = nextval(CAST(:sequence AS regclass))"
+                    f" WHERE {id_ref} IS NULL"
+                ),
+                {"sequence": sequence},
+            )
+            session.commit()
+            return int(result.rowcount or 0)
+
+        missing = session.execute(
+            sa.text(f"SELECT COUNT(*) FROM {staging_ref} WHERE {id_ref} IS NULL")
+        ).scalar_one()
+        if not missing:
+            return 0
+
+        # One reserved block, numbered in staging order via _rownum.
+        block = allocator.reserve(int(missing))
+        session.execute(
+            sa.text(
+                f"UPDATE {staging_ref} AS s SET {id_ref} = :start - 1 + n.rn"
+                f" FROM (SELECT _rownum, row_number() OVER (ORDER BY _rownum) AS rn"
+                f" FROM {staging_ref} WHERE {id_ref} IS NULL) AS n"
+                f" WHERE s._rownum = n._rownum"
+            ),
+            {"start": block.start},
+        )
+        session.commit()
+        return int(missing)
+
     def load_staging_fast(
         self,
         loader_context: "LoaderContext",
@@ -143,6 +280,55 @@ class PostgresBackend(DatabaseBackend):
         safe_state = self._normalize_fk_check_state(previous_state)
         session.execute(sa.text(f"SET session_replication_role = '{safe_state}'"))
 
+    def partitions_for(
+        self,
+        session: so.Session,
+        target_name: str,
+    ) -> list[PartitionInfo]:
+        target_param = {"target": self.identifier_preparer.quote_identifier(target_name)}
+        strategy = session.execute(
+            sa.text(
+                "SELECT partstrat FROM pg_partitioned_table"
+                " WHERE partrelid = to_regclass(:target)"
+            ),
+            target_param,
+        ).scalar()
+        if strategy is None:
+            return []
+        rows = session.execute(
+            sa.text(
+                "SELECT c.oid::regclass::text, n.nspname, c.relname, i.inhparent::regclass::text,"
+                " pg_get_expr(c.relpartbound, c.oid), pg_get_partition_constraintdef(c.oid)"
+                " FROM pg_partition_tree(to_regclass(:target)) t"
+                " JOIN pg_class c ON c.oid = t.relid"
+                " JOIN pg_namespace n ON n.oid = c.relnamespace"
+                " JOIN pg_inherits i ON i.inhrelid = c.oid"
+                " WHERE t.isleaf ORDER BY c.relname"
+            ),
+            target_param,
+        ).all()
+        return [
+            PartitionInfo(
+                name=name, schema=schema, relname=relname, parent=parent,
+                bound=bound, constraint=constraint or "true",
+            )
+            for name, schema, relname, parent, bound, constraint in rows
+        ]
+
+    def _partition_row_counts(
+        self,
+        session: so.Session,
+        staging_ref: str,
+        partitions: list[PartitionInfo],
+    ) -> tuple[int, list[int]]:
+        """Return the staging row total and per-partition row counts in one scan."""
+        sums = ", ".join(
+            f"COALESCE(SUM(CASE WHEN {_sql_literal_text(p.constraint)} THEN 1 ELSE 0 END), 0)"
+            for p in partitions
+        )
+        row = session.execute(sa.text(f"SELECT COUNT(*), {sums} FROM {staging_ref}")).one()
+        return int(row[0]), [int(v) for v in row[1:]]
+
     def merge_replace(
         self,
         table_cls: type["CSVTableProtocol"],
@@ -159,17 +345,27 @@ class PostgresBackend(DatabaseBackend):
             f't.{preparer.quote_identifier(c)} = s.{preparer.quote_identifier(c)}' for c in pk_cols
         )
 
-        non_paginated_replace = sa.text(
-            f'DELETE FROM {target_ref} t USING {staging_ref} s WHERE {pk_join}'
-        )
+        # A join against a partitioned parent cannot prune, so deletes are
+        # issued per leaf against only the staging rows routed to it.
+        targets: list[tuple[str, str]] = [(target_ref, staging_ref)]
+        partitions = self.partitions_for(session, target_name)
+        if partitions:
+            _, counts = self._partition_row_counts(session, staging_ref, partitions)
+            targets = [
+                (p.name, f"(SELECT * FROM {staging_ref} WHERE {_sql_literal_text(p.constraint)})")
+                for p, count in zip(partitions, counts)
+                if count
+            ]
 
         if merge_batch_size is None:
-            session.execute(non_paginated_replace)
+            for delete_ref, source in targets:
+                session.execute(sa.text(f'DELETE FROM {delete_ref} t USING {source} s WHERE {pk_join}'))
             return
 
         total = session.execute(sa.text(f'SELECT COUNT(*) FROM {staging_ref}')).scalar_one()
         if total <= merge_batch_size:
-            session.execute(non_paginated_replace)
+            for delete_ref, source in targets:
+                session.execute(sa.text(f'DELETE FROM {delete_ref} t USING {source} s WHERE {pk_join}'))
             return
 
         staging_name = self.staging_name_for_table(table_cls.__tablename__)
@@ -177,18 +373,89 @@ class PostgresBackend(DatabaseBackend):
         session.execute(sa.text(f'CREATE INDEX IF NOT EXISTS {idx_ref} ON {staging_ref} (_rownum)'))
         session.commit()
 
-        start = 0
-        while start < total:
-            end = start + merge_batch_size
+        for delete_ref, source in targets:
+            start = 0
+            while start < total:
+                end = start + merge_batch_size
+                session.execute(
+                    sa.text(
+                        f'DELETE FROM {delete_ref} t USING {source} s'
+                        f' WHERE {pk_join} AND s._rownum > :start AND s._rownum <= :end'
+                    ),
+                    {"start": start, "end": end},
+                )
+                session.commit()
+                start = end
+
+    def merge_replace_partitions(
+        self,
+        table_cls: type["CSVTableProtocol"],
+        session: so.Session,
+        target_name: str,
+        pk_cols: list[str],
+        *,
+        merge_batch_size: int | None = None,
+    ) -> None:
+        """
+        Rebuild each partition touched by staging offline and attach it in place.
+
+        For every leaf partition that receives staging rows, a new table is
+        created with ``LIKE <partition> INCLUDING ALL``, filled from the
+        staging rows routed to it, and given a ``CHECK`` matching the
+        partition bound so ``ATTACH PARTITION`` can skip its validation scan.
+        A short transaction, bounded by ``lock_timeout_ms``, then detaches and
+        drops the old partition and attaches the new one under the old name. Existing rows in a rebuilt
+        partition that are absent from staging are discarded; other
+        partitions are untouched.
+        """
+        preparer = self.identifier_preparer
+        staging_ref = self.qualified_staging_name(table_cls.__tablename__)
+        partitions = self.partitions_for(session, target_name)
+        if not partitions:
+            raise ValueError(
+                f"Table `{target_name}` is not partitioned; cannot use merge strategy 'replace_partitions'"
+            )
+
+        total, counts = self._partition_row_counts(session, staging_ref, partitions)
+        if sum(counts) != total:
+            raise ValueError(
+                f"Table `{target_name}`: {total - sum(counts)} staging rows do not fall into any "
+                "existing partition; create the partition before loading"
+            )
+
+        insertable_cols = self._insertable_column_names(table_cls)
+        cols_str = ", ".join(preparer.quote_identifier(c) for c in insertable_cols)
+        select_str = self._staging_select_list(table_cls, insertable_cols)
+        for partition, count in zip(partitions, counts):
+            if not count:
+                continue
+            predicate = _sql_literal_text(partition.constraint)
+            schema_ref = preparer.quote_identifier(partition.schema)
+            new_name = f"_load_{partition.relname}"[:63]
+            new_ref = f"{schema_ref}.{preparer.quote_identifier(new_name)}"
+            check_ref = preparer.quote_identifier(f"{new_name}_bound"[:63])
+
+            session.execute(sa.text(f"DROP TABLE IF EXISTS {new_ref}"))
+            session.execute(sa.text(f"CREATE TABLE {new_ref} (LIKE {partition.name} INCLUDING ALL)"))
             session.execute(
-                sa.text(
-                    f'DELETE FROM {target_ref} t USING {staging_ref} s'
-                    f' WHERE {pk_join} AND s._rownum > :start AND s._rownum <= :end'
-                ),
-                {"start": start, "end": end},
+                sa.text(f"INSERT INTO {new_ref} ({cols_str}) SELECT {select_str} FROM {staging_ref} WHERE {predicate}")
             )
+            session.execute(sa.text(f"ALTER TABLE {new_ref} ADD CONSTRAINT {check_ref} CHECK ({predicate})"))
+            session.execute(sa.text(f"ANALYZE {new_ref}"))
+            session.commit()
+
+            self._set_lock_timeout(session)
+            session.execute(sa.text(f"ALTER TABLE {partition.parent} DETACH PARTITION {partition.name}"))
+            session.execute(sa.text(f"DROP TABLE {partition.name}"))
+            session.execute(
+                sa.text(f"ALTER TABLE {new_ref} RENAME TO {preparer.quote_identifier(partition.relname)}")
+            )
+            renamed_ref = f"{schema_ref}.{preparer.quote_identifier(partition.relname)}"
+            session.execute(
+                sa.text(f"ALTER TABLE {partition.parent} ATTACH PARTITION {renamed_ref} {_sql_literal_text(partition.bound)}")
+            )
+            session.execute(sa.text(f"ALTER TABLE {renamed_ref} DROP CONSTRAINT {check_ref}"))
             session.commit()
-            start = end
 
     def merge_upsert(
         self,
@@ -204,11 +471,12 @@ class PostgresBackend(DatabaseBackend):
         target_ref = preparer.quote_identifier(target_name)
         insertable_cols = self._insertable_column_names(table_cls)
         cols_str = ", ".join(preparer.quote_identifier(c) for c in insertable_cols)
+        select_str = self._staging_select_list(table_cls, insertable_cols)
         conflict_cols = ", ".join(preparer.quote_identifier(c) for c in pk_cols)
 
         non_paginated_upsert = sa.text(
             f'INSERT INTO {target_ref} ({cols_str})'
-            f' SELECT {cols_str} FROM {staging_ref}'
+            f' SELECT {select_str} FROM {staging_ref}'
             f' ON CONFLICT ({conflict_cols}) DO NOTHING'
         )
 
@@ -232,7 +500,7 @@ class PostgresBackend(DatabaseBackend):
             session.execute(
                 sa.text(
                     f'INSERT INTO {target_ref} ({cols_str})'
-                    f' SELECT {cols_str} FROM {staging_ref}'
+                    f' SELECT {select_str} FROM {staging_ref}'
                     f' WHERE _rownum > :start AND _rownum <= :end'
                     f' ON CONFLICT ({conflict_cols}) DO NOTHING'
                 ),
@@ -254,10 +522,11 @@ class PostgresBackend(DatabaseBackend):
         target_ref = preparer.quote_identifier(target_name)
         insertable_cols = self._insertable_column_names(table_cls)
         cols_str = ", ".join(preparer.quote_identifier(c) for c in insertable_cols)
+        select_str = self._staging_select_list(table_cls, insertable_cols)
 
         non_paginated_insert = sa.text(
             f'INSERT INTO {target_ref} ({cols_str})'
-            f' SELECT {cols_str} FROM {staging_ref}'
+            f' SELECT {select_str} FROM {staging_ref}'
         )
 
         if merge_batch_size is None:
@@ -284,7 +553,7 @@ class PostgresBackend(DatabaseBackend):
             session.execute(
                 sa.text(
                     f'INSERT INTO {target_ref} ({cols_str})'
-                    f' SELECT {cols_str} FROM {staging_ref}'
+                    f' SELECT {select_str} FROM {staging_ref}'
                     f' WHERE _rownum > :start AND _rownum <= :end'
                 ),
                 {"start": start, "end": end},
@@ -292,6 +561,322 @@ class PostgresBackend(DatabaseBackend):
             session.commit()
             start = end
 
+    def merge_swap(
+        self,
+        table_cls: type["CSVTableProtocol"],
+        session: so.Session,
+        target_name: str,
+        pk_cols: list[str],
+        *,
+        merge_batch_size: int | None = None,
+    ) -> None:
+        """
+        Swap a freshly built copy of staging in place of the target.
+
+        The copy is created with ``LIKE ... INCLUDING ALL EXCLUDING
+        INDEXES``, filled from staging, then indexed and analysed while
+        readers continue to use the old table. A single short transaction
+        then takes an ``ACCESS EXCLUSIVE`` lock, renames the old table away
+        and the copy in, moves serial sequence ownership, and re-creates
+        inbound and outbound foreign keys as ``NOT VALID``. Afterwards the
+        old table is dropped, index/constraint names are restored, and the
+        foreign keys are validated without blocking writers. A constraint
+        that fails validation stays ``NOT VALID`` and is reported with
+        ``IngestError`` once the others have been checked; the swap itself
+        is kept.
+
+        The swap transaction sets ``lock_timeout`` to the backend's
+        ``lock_timeout_ms`` first, so a long-running reader makes the swap
+        fail instead of queueing every other query behind the lock request.
+
+        Grants, triggers, policies and publication membership are not
+        copied. Targets that are partitioned or referenced by views are
+        rejected, because views would keep pointing at the old table.
+        """
+        preparer = self.identifier_preparer
+        staging_ref = self.qualified_staging_name(table_cls.__tablename__)
+        target_param = {"target": preparer.quote_identifier(target_name)}
+
+        relation = session.execute(
+            sa.text(
+                "SELECT c.oid, c.relkind, n.nspname, quote_ident(n.nspname) || '.' || quote_ident(c.relname)"
+                " FROM pg_class c"
+                " JOIN pg_namespace n ON n.oid = c.relnamespace"
+                " WHERE c.oid = CAST(:target AS regclass)"
+            ),
+            target_param,
+        ).one()
+        # The last column matches how pg_get_indexdef() renders the table name.
+        target_oid, relkind, schema, indexdef_target = relation
+        if relkind != "r":
+            raise ValueError(
+                f"Table `{target_name}`: merge strategy 'swap' only supports plain tables (relkind={relkind!r})"
+            )
+        dependent_views = session.execute(
+            sa.text(
+                "SELECT DISTINCT v.oid::regclass::text FROM pg_depend d"
+                " JOIN pg_rewrite r ON r.oid = d.objid"
+                " JOIN pg_class v ON v.oid = r.ev_class"
+                " WHERE d.classid = 'pg_rewrite'::regclass"
+                " AND d.refobjid = CAST(:target AS regclass) AND v.oid <> d.refobjid"
+            ),
+            target_param,
+        ).scalars().all()
+        if dependent_views:
+            raise ValueError(
+                f"Table `{target_name}`: merge strategy 'swap' cannot be used while views depend on it "
+                f"({', '.join(sorted(dependent_views))}); use 'replace' or 'sync' instead"
+            )
+
+        schema_ref = preparer.quote_identifier(schema)
+        target_ref = f"{schema_ref}.{preparer.quote_identifier(target_name)}"
+        new_name = f"_swap_{target_name}"[:63]
+        old_name = f"_old_{target_name}"[:63]
+        new_ref = f"{schema_ref}.{preparer.quote_identifier(new_name)}"
+        old_ref = f"{schema_ref}.{preparer.quote_identifier(old_name)}"
+
+        constraints = session.execute(
+            sa.text(
+                "SELECT quote_ident(conname), pg_get_constraintdef(oid) FROM pg_constraint"
+                " WHERE conrelid = CAST(:target AS regclass) AND contype IN ('p', 'u', 'x')"
+            ),
+            target_param,
+        ).all()
+        plain_indexes = session.execute(
+            sa.text(
+                "SELECT quote_ident(ic.relname), pg_get_indexdef(i.indexrelid), i.indexrelid"
+                " FROM pg_index i JOIN pg_class ic ON ic.oid = i.indexrelid"
+                " WHERE i.indrelid = CAST(:target AS regclass)"
+                " AND NOT EXISTS (SELECT 1 FROM pg_constraint c WHERE c.conindid = i.indexrelid"
+                " AND c.conrelid = i.indrelid)"
+            ),
+            target_param,
+        ).all()
+        outbound_fks = session.execute(
+            sa.text(
+                "SELECT quote_ident(conname), pg_get_constraintdef(oid) FROM pg_constraint"
+                " WHERE conrelid = CAST(:target AS regclass) AND contype = 'f'"
+            ),
+            target_param,
+        ).all()
+        inbound_fks = session.execute(
+            sa.text(
+                "SELECT conrelid::regclass::text, quote_ident(conname), pg_get_constraintdef(oid)"
+                " FROM pg_constraint WHERE confrelid = CAST(:target AS regclass)"
+                " AND conrelid <> confrelid AND contype = 'f'"
+            ),
+            target_param,
+        ).all()
+        owned_sequences = session.execute(
+            sa.text(
+                "SELECT a.attname, d.objid::regclass::text, d.deptype FROM pg_depend d"
+                " JOIN pg_class s ON s.oid = d.objid AND s.relkind = 'S'"
+                " JOIN pg_attribute a ON a.attrelid = d.refobjid AND a.attnum = d.refobjsubid"
+                " WHERE d.classid = 'pg_class'::regclass AND d.refobjid = CAST(:target AS regclass)"
+                " AND d.deptype IN ('a', 'i')"
+            ),
+            target_param,
+        ).all()
+
+        # Build phase: readers keep using the old table throughout.
+        insertable_cols = self._insertable_column_names(table_cls)
+        cols_str = ", ".join(preparer.quote_identifier(c) for c in insertable_cols)
+        select_str = self._staging_select_list(table_cls, insertable_cols)
+        session.execute(sa.text(f"DROP TABLE IF EXISTS {new_ref}"))
+        # Left behind only if a previous swap died between its swap and cleanup phases.
+        session.execute(sa.text(f"DROP TABLE IF EXISTS {old_ref}"))
+        session.execute(
+            sa.text(f"CREATE TABLE {new_ref} (LIKE {target_ref} INCLUDING ALL EXCLUDING INDEXES)")
+        )
+        session.execute(
+            sa.text(f"INSERT INTO {new_ref} ({cols_str}) SELECT {select_str} FROM {staging_ref}")
+        )
+
+        renames: list[str] = []
+        for i, (con_name, con_def) in enumerate(constraints):
+            tmp_name = preparer.quote_identifier(f"_swap_{target_oid}_c{i}")
+            session.execute(
+                sa.text(_sql_literal_text(f"ALTER TABLE {new_ref} ADD CONSTRAINT {tmp_name} {con_def}"))
+            )
+            renames.append(f"ALTER TABLE {target_ref} RENAME CONSTRAINT {tmp_name} TO {con_name}")
+        for idx_name, idx_def, idx_oid in plain_indexes:
+            tmp_name = preparer.quote_identifier(f"_swap_{idx_oid}")
+            prefix = f" INDEX {idx_name} ON {indexdef_target} "
+            if prefix not in idx_def:
+                raise RuntimeError(
+                    f"Table `{target_name}`: cannot rebuild index {idx_name} for swap from definition {idx_def!r}"
+                )
+            idx_sql = idx_def.replace(prefix, f" INDEX {tmp_name} ON {new_ref} ", 1)
+            session.execute(sa.text(_sql_literal_text(idx_sql)))
+            renames.append(f"ALTER INDEX {schema_ref}.{tmp_name} RENAME TO {idx_name}")
+
+        new_table_param = {"table": new_ref}
+        for col_name, seq_ref, deptype in owned_sequences:
+            if deptype == "i":
+                # The copy owns a fresh identity sequence; carry the old position forward.
+                session.execute(
+                    sa.text(
+                        f"SELECT setval(pg_get_serial_sequence(:table, :column), GREATEST("
+                        f"(SELECT last_value FROM {seq_ref}),"
+                        f" (SELECT COALESCE(MAX({preparer.quote_identifier(col_name)}), 1) FROM {new_ref})))"
+                    ),
+                    {**new_table_param, "column": col_name},
+                )
+        session.execute(sa.text(f"ANALYZE {new_ref}"))
+        session.commit()
+
+        # Swap phase: one short transaction under ACCESS EXCLUSIVE.
+        self._set_lock_timeout(session)
+        session.execute(sa.text(f"LOCK TABLE {target_ref} IN ACCESS EXCLUSIVE MODE"))
+        for child_ref, fk_name, _ in inbound_fks:
+            session.execute(sa.text(f"ALTER TABLE {child_ref} DROP CONSTRAINT {fk_name}"))
+        session.execute(
+            sa.text(f"ALTER TABLE {target_ref} RENAME TO {preparer.quote_identifier(old_name)}")
+        )
+        session.execute(
+            sa.text(f"ALTER TABLE {new_ref} RENAME TO {preparer.quote_identifier(target_name)}")
+        )
+        for col_name, seq_ref, deptype in owned_sequences:
+            if deptype == "a":
+                session.execute(
+                    sa.text(
+                        f"ALTER SEQUENCE {seq_ref} OWNED BY {target_ref}.{preparer.quote_identifier(col_name)}"
+                    )
+                )
+        to_validate: list[tuple[str, str]] = []
+        for fk_name, fk_def in outbound_fks:
+            session.execute(
+                sa.text(_sql_literal_text(f"ALTER TABLE {target_ref} ADD CONSTRAINT {fk_name} {fk_def} NOT VALID"))
+            )
+            to_validate.append((fk_name, f"ALTER TABLE {target_ref} VALIDATE CONSTRAINT {fk_name}"))
+        for child_ref, fk_name, fk_def in inbound_fks:
+            session.execute(
+                sa.text(_sql_literal_text(f"ALTER TABLE {child_ref} ADD CONSTRAINT {fk_name} {fk_def} NOT VALID"))
+            )
+            to_validate.append((fk_name, f"ALTER TABLE {child_ref} VALIDATE CONSTRAINT {fk_name}"))
+        session.commit()
+
+        # Cleanup phase: the old table and temporary names go first, so a
+        # failing VALIDATE (SHARE UPDATE EXCLUSIVE only) cannot leave them behind.
+        session.execute(sa.text(f"DROP TABLE {old_ref}"))
+        for statement in renames:
+            session.execute(sa.text(statement))
+        session.commit()
+
+        errors: dict[str, Exception] = {}
+        for fk_name, statement in to_validate:
+            try:
+                session.execute(sa.text(statement))
+                session.commit()
+            except Exception as exc:
+                session.rollback()
+                errors[fk_name] = exc
+        if errors:
+            raise IngestError(
+                f"Table `{target_name}`: swapped in, but foreign key validation failed for "
+                f"{sorted(errors)}; the constraints are left NOT VALID"
+            ) from next(iter(errors.values()))
+
+    def configure_index_build(
+        self,
+        conn: Connection,
+        *,
+        maintenance_work_mem: str | None = None,
+        max_parallel_maintenance_workers: int | None = None,
+    ) -> None:
+        # is_local=true scopes the settings to the rebuild transaction so
+        # they never leak onto pooled connections.
+        if maintenance_work_mem is not None:
+            conn.execute(
+                sa.text("SELECT set_config('maintenance_work_mem', :value, true)"),
+                {"value": str(maintenance_work_mem)},
+            )
+        if max_parallel_maintenance_workers is not None:
+            if max_parallel_maintenance_workers < 0:
+                raise ValueError("max_parallel_maintenance_workers must be >= 0")
+            conn.execute(
+                sa.text("SELECT set_config('max_parallel_maintenance_workers', :value, true)"),
+                {"value": str(int(max_parallel_maintenance_workers))},
+            )
+
+    def revalidate_foreign_keys(
+        self,
+        session: so.Session,
+        target_name: str,
+        *,
+        workers: int = 1,
+    ) -> dict[str, float]:
+        """
+        Re-add every FK on the target as ``NOT VALID``, then ``VALIDATE`` it.
+
+        Swapping each constraint for a ``NOT VALID`` copy is a brief catalog
+        change; ``VALIDATE CONSTRAINT`` then scans the table holding only a
+        ``SHARE UPDATE EXCLUSIVE`` lock, so it does not block reads or
+        writes. With ``workers > 1`` and an engine-bound session,
+        constraints are validated concurrently on separate connections.
+        A failing constraint is left ``NOT VALID`` and the error is raised
+        after the remaining validations finish.
+        """
+        preparer = self.identifier_preparer
+        target_ref = preparer.quote_identifier(target_name)
+        fks = session.execute(
+            sa.text(
+                "SELECT quote_ident(conname), pg_get_constraintdef(oid) FROM pg_constraint"
+                " WHERE conrelid = to_regclass(:target) AND contype = 'f' ORDER BY conname"
+            ),
+            {"target": target_ref},
+        ).all()
+        if not fks:
+            return {}
+        for fk_name, fk_def in fks:
+            session.execute(
+                sa.text(
+                    f"ALTER TABLE {target_ref} DROP CONSTRAINT {fk_name},"
+                    f" ADD CONSTRAINT {fk_name} {_sql_literal_text(fk_def)} NOT VALID"
+                )
+            )
+        session.commit()
+
+        def _validate(conn: Connection | so.Session, fk_name: str) -> float:
+            started = perf_counter()
+            conn.execute(sa.text(f"ALTER TABLE {target_ref} VALIDATE CONSTRAINT {fk_name}"))
+            conn.commit()
+            return perf_counter() - started
+
+        timings: dict[str, float] = {}
+        errors: dict[str, Exception] = {}
+        bind = session.get_bind()
+        if workers > 1 and len(fks) > 1 and isinstance(bind, sa.Engine) and not bind.dialect.is_async:
+            from concurrent.futures import ThreadPoolExecutor
+
+            def _validate_on_own_connection(fk_name: str) -> float:
+                with bind.connect() as conn:
+                    return _validate(conn, fk_name)
+
+            with ThreadPoolExecutor(max_workers=min(workers, len(fks))) as pool:
+                futures = {name: pool.submit(_validate_on_own_connection, name) for name, _ in fks}
+                for name, future in futures.items():
+                    try:
+                        timings[name] = future.result()
+                    except Exception as exc:
+                        errors[name] = exc
+        else:
+            for name, _ in fks:
+                try:
+                    timings[name] = _validate(session, name)
+                except Exception as exc:
+                    session.rollback()
+                    errors[name] = exc
+        if errors:
+            first = next(iter(errors.values()))
+            raise IngestError(
+                f"Table `{target_name}`: foreign key validation failed for {sorted(errors)}"
+            ) from first
+        return timings
+
+    def insert_ignore(self, table: sa.Table) -> sa.Insert:
+        return postgresql.insert(table).on_conflict_do_nothing()
+
     def merge_context(
         self,
         table_cls: type["CSVTableProtocol"],
@@ -304,23 +889,50 @@ class PostgresBackend(DatabaseBackend):
         bind: Engine | Connection,
         name: str,
         selectable: sa.sql.Select[Any],
+        *,
+        indexes: tuple[ViewIndex, ...] = (),
     ) -> None:
         from ..mappers.materialised_view_mixin import CreateMaterializedView
 
         with self._as_connection(bind) as conn:
             conn.execute(CreateMaterializedView(name, selectable))
+            self.create_view_indexes(conn, name, indexes)
 
     def refresh_materialized_view(
         self,
         bind: Engine | Connection,
         name: str,
+        *,
+        concurrently: bool = False,
     ) -> None:
         with self._as_connection(bind) as conn:
             safe_name = name
             dialect = getattr(conn, "dialect", None)
             if dialect is not None:
                 safe_name = dialect.identifier_preparer.quote(name)
-            conn.execute(sa.text(f"REFRESH MATERIALIZED VIEW {safe_name};"))
+            mode = "CONCURRENTLY " if concurrently else ""
+            conn.execute(sa.text(f"REFRESH MATERIALIZED VIEW {mode}{safe_name};"))
+
+    def has_unique_index(
+        self,
+        bind: Engine | Connection,
+        name: str,
+    ) -> bool:
+        # CONCURRENTLY needs a valid unique index on plain columns with no WHERE clause.
+        with self._as_connection(bind) as conn:
+            return bool(
+                conn.execute(
+                    sa.text(
+                        "SELECT EXISTS ("
+                        " SELECT 1 FROM pg_index"
+                        " WHERE indrelid = to_regclass(:name)"
+                        " AND indisunique AND indisvalid AND indpred IS NULL"
+                        " AND NOT (0 = ANY(indkey::int2[]))"
+                        ")"
+                    ),
+                    {"name": name},
+                ).scalar()
+            )
 
     @contextmanager
     def engine_with_replica_role(self, engine: "Engine"):
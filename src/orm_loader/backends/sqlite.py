@@ -1,10 +1,12 @@
 from __future__ import annotations
 
+import hashlib
 import logging
 import sqlite3
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
-from contextlib import AbstractContextManager
+from contextlib import AbstractContextManager, contextmanager
+from collections.abc import Generator
 
 import sqlalchemy as sa
 import sqlalchemy.orm as so
@@ -13,7 +15,7 @@ from sqlalchemy.dialects import sqlite as sqlite_dialect
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.sql.compiler import IdentifierPreparer
 
-from .base import BackendCapabilities, DatabaseBackend, Dialect
+from .base import BackendCapabilities, DatabaseBackend, Dialect, ViewIndex
 
 if TYPE_CHECKING:
     from sqlalchemy.engine import Connection, Engine
@@ -25,6 +27,35 @@ logger = logging.getLogger(__name__)
 VALID_SQLITE_JOURNAL_MODES = frozenset(
     {"DELETE", "TRUNCATE", "PERSIST", "MEMORY", "WAL", "OFF"}
 )
+ROW_HASH_FUNCTION = "orm_loader_row_hash"
+HASH_INT_FUNCTION = "orm_loader_hash_int"
+MV_DEFINITIONS_TABLE = "_orm_loader_materialized_views"
+
+
+def _sqlite_hash_int(hex_hash: str | None) -> int | None:
+    """Leading 32 bits of a hex row hash, registered as a SQLite SQL function."""
+    return None if hex_hash is None else int(hex_hash[:8], 16)
+
+
+def _sqlite_row_hash(*values: Any) -> str:
+    """
+    Deterministic row hash registered as a SQLite SQL function.
+
+    Values are rendered to text (``NULL`` as ``\\N``, blobs as hex) and
+    joined with the ASCII unit separator before hashing, so adjacent
+    columns cannot run together.
+    """
+    parts: list[str] = []
+    for value in values:
+        if value is None:
+            parts.append("\\N")
+        elif isinstance(value, bytes):
+            parts.append(value.hex())
+        elif isinstance(value, float):
+            parts.append(repr(value))
+        else:
+            parts.append(str(value))
+    return hashlib.md5("\x1f".join(parts).encode("utf-8")).hexdigest()
 
 
 class SQLiteBackend(DatabaseBackend):
@@ -98,12 +129,29 @@ class SQLiteBackend(DatabaseBackend):
             supports_unlogged_staging=False,
             supports_fk_toggle=True,
             supports_materialized_views=False,
+            supports_materialized_view_emulation=True,
         )
 
     @property
     def default_index_strategy(self) -> str:
         return "keep"
 
+    def estimate_row_count(self, session: so.Session, table_name: str) -> int | None:
+        # sqlite_stat1 only exists once ANALYZE has run; the first field of
+        # every row for a table (per index, or idx NULL) is its row count.
+        has_stats = session.execute(
+            text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'sqlite_stat1'")
+        ).scalar()
+        if not has_stats:
+            return None
+        stat = session.execute(
+            text("SELECT stat FROM sqlite_stat1 WHERE tbl = :table LIMIT 1"),
+            {"table": table_name},
+        ).scalar()
+        if not stat:
+            return None
+        return int(str(stat).split()[0])
+
     def create_staging_table(
         self,
         table_cls: type["CSVTableProtocol"],
@@ -111,14 +159,7 @@ class SQLiteBackend(DatabaseBackend):
     ) -> None:
         staging_name = self.staging_name_for_table(table_cls.__tablename__)
         session.execute(sa.text(f'DROP TABLE IF EXISTS {self.identifier_preparer.quote_identifier(staging_name)};'))
-
-        metadata = sa.MetaData()
-        staging_columns = [
-            sa.Column(col.name, col.type, nullable=True)
-            for col in table_cls.__table__.columns
-        ]
-        staging_table = sa.Table(staging_name, metadata, *staging_columns)
-        metadata.create_all(bind=session.connection(), tables=[staging_table])
+        self.staging_table_for(table_cls).create(bind=session.connection())
         session.commit()
 
     def drop_staging_table(
@@ -129,6 +170,27 @@ class SQLiteBackend(DatabaseBackend):
         staging_ref = self.identifier_preparer.quote_identifier(self.staging_name_for_table(table_cls.__tablename__))
         session.execute(sa.text(f'DROP TABLE IF EXISTS {staging_ref}'))
 
+    @staticmethod
+    def register_functions(dbapi_connection: Any) -> None:
+        """Register the SQL functions this backend relies on with a sqlite3 connection."""
+        dbapi_connection.create_function(
+            ROW_HASH_FUNCTION, -1, _sqlite_row_hash, deterministic=True
+        )
+        dbapi_connection.create_function(
+            HASH_INT_FUNCTION, 1, _sqlite_hash_int, deterministic=True
+        )
+
+    def register_session_functions(self, session: so.Session) -> None:
+        # Connections created outside install_engine_hooks() have no hash
+        # function yet; registering is idempotent and cheap.
+        self.register_functions(session.connection().connection.driver_connection)
+
+    def hash_to_int_sql(self, hash_sql: str) -> str:
+        return f"{HASH_INT_FUNCTION}({hash_sql})"
+
+    def row_hash_sql(self, column_refs: list[str]) -> str:
+        return f"{ROW_HASH_FUNCTION}({', '.join(column_refs)})"
+
     def disable_fk_check(self, session: so.Session) -> str | int:
         previous_state = session.execute(text("PRAGMA foreign_keys")).scalar()
         session.execute(text("PRAGMA foreign_keys = OFF"))
@@ -208,11 +270,14 @@ class SQLiteBackend(DatabaseBackend):
         target_ref = preparer.quote_identifier(target_name)
         insertable_cols = self._insertable_column_names(table_cls)
         cols_str = ", ".join(preparer.quote_identifier(c) for c in insertable_cols)
+        select_str = self._staging_select_list(table_cls, insertable_cols)
+        if self.row_hash_column(table_cls) is not None:
+            self.register_session_functions(session)
         session.execute(
             sa.text(
                 f"""
                 INSERT OR IGNORE INTO {target_ref} ({cols_str})
-                SELECT {cols_str} FROM {staging_ref};
+                SELECT {select_str} FROM {staging_ref};
                 """
             )
         )
@@ -230,15 +295,50 @@ class SQLiteBackend(DatabaseBackend):
         target_ref = preparer.quote_identifier(target_name)
         insertable_cols = self._insertable_column_names(table_cls)
         cols_str = ", ".join(preparer.quote_identifier(c) for c in insertable_cols)
+        select_str = self._staging_select_list(table_cls, insertable_cols)
+        if self.row_hash_column(table_cls) is not None:
+            self.register_session_functions(session)
         session.execute(
             sa.text(
                 f"""
                 INSERT INTO {target_ref} ({cols_str})
-                SELECT {cols_str} FROM {staging_ref};
+                SELECT {select_str} FROM {staging_ref};
                 """
             )
         )
 
+    def null_safe_distinct_sql(self, left: str, right: str) -> str:
+        # ``IS NOT`` predates ``IS DISTINCT FROM`` (3.39) and has the same semantics.
+        return f"{left} IS NOT {right}"
+
+    def insert_ignore(self, table: sa.Table) -> sa.Insert:
+        return sqlite_dialect.insert(table).on_conflict_do_nothing()
+
+    @contextmanager
+    def _immediate_transaction(self, bind: "Engine | Connection") -> Generator[Connection, None, None]:
+        # pysqlite does not open a transaction before DDL, so an explicit
+        # BEGIN IMMEDIATE on an autocommit connection is the only way to make
+        # a DDL sequence atomic (and to take the write lock up front). A
+        # caller's connection gets a SAVEPOINT instead, which SQLite also
+        # uses to open a transaction when none is active yet.
+        if not isinstance(bind, sa.Engine):
+            with bind.begin_nested():
+                yield bind
+            return
+        with bind.connect() as conn:
+            conn = conn.execution_options(isolation_level="AUTOCOMMIT")
+            conn.exec_driver_sql("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except BaseException:
+                conn.exec_driver_sql("ROLLBACK")
+                raise
+            conn.exec_driver_sql("COMMIT")
+
+    def id_block_transaction(self, engine: Engine) -> AbstractContextManager[Connection]:
+        # BEGIN IMMEDIATE means two processes cannot read the same high-water mark.
+        return self._immediate_transaction(engine)
+
     def merge_context(
         self,
         table_cls: type["CSVTableProtocol"],
@@ -251,15 +351,87 @@ class SQLiteBackend(DatabaseBackend):
         bind: "Engine | Connection",
         name: str,
         selectable: sa.sql.Select[Any],
+        *,
+        indexes: tuple[ViewIndex, ...] = (),
     ) -> None:
-        self._require_capability("supports_materialized_views", "materialized views")
+        # Emulated: the view is a plain table built from the select, whose SQL
+        # is kept in MV_DEFINITIONS_TABLE so refreshes can rebuild it.
+        self._require_capability("supports_materialized_view_emulation", "materialized views")
+        preparer = self.identifier_preparer
+        definition = str(selectable.compile(dialect=sqlite_dialect.dialect(), compile_kwargs={"literal_binds": True}))
+        with self._immediate_transaction(bind) as conn:
+            conn.execute(
+                text(
+                    f"CREATE TABLE IF NOT EXISTS {preparer.quote(MV_DEFINITIONS_TABLE)} "
+                    "(name TEXT PRIMARY KEY, definition TEXT NOT NULL)"
+                )
+            )
+            exists = conn.execute(
+                text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"), {"name": name}
+            ).scalar()
+            stored = conn.execute(
+                text(f"SELECT definition FROM {preparer.quote(MV_DEFINITIONS_TABLE)} WHERE name = :name"),
+                {"name": name},
+            ).scalar()
+            # A table with no stored definition was not built here and is left alone.
+            if not exists or (stored is not None and stored != definition):
+                if exists:
+                    logger.info(f"Materialized view `{name}`: Definition changed; rebuilding.")
+                    conn.execute(text(f"DROP TABLE {preparer.quote(name)}"))
+                conn.execute(
+                    text(
+                        f"INSERT OR REPLACE INTO {preparer.quote(MV_DEFINITIONS_TABLE)} (name, definition) "
+                        "VALUES (:name, :definition)"
+                    ),
+                    {"name": name, "definition": definition},
+                )
+                conn.exec_driver_sql(f"CREATE TABLE {preparer.quote(name)} AS {definition}")
+            self.create_view_indexes(conn, name, indexes)
 
     def refresh_materialized_view(
         self,
         bind: "Engine | Connection",
         name: str,
+        *,
+        concurrently: bool = False,
     ) -> None:
-        self._require_capability("supports_materialized_views", "materialized views")
+        # Build-and-rename in one transaction: readers see either the old or
+        # the new contents, so ``concurrently`` needs no special handling.
+        self._require_capability("supports_materialized_view_emulation", "materialized views")
+        preparer = self.identifier_preparer
+        view_ref = preparer.quote(name)
+        build_ref = preparer.quote(f"_orm_loader_mv_build_{name}")
+        with self._immediate_transaction(bind) as conn:
+            has_definitions = conn.execute(
+                text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"),
+                {"name": MV_DEFINITIONS_TABLE},
+            ).scalar()
+            definition = None
+            if has_definitions:
+                definition = conn.execute(
+                    text(f"SELECT definition FROM {preparer.quote(MV_DEFINITIONS_TABLE)} WHERE name = :name"),
+                    {"name": name},
+                ).scalar()
+            if definition is None:
+                raise ValueError(f"Materialized view '{name}' has not been created on this database")
+
+            index_ddl = conn.execute(
+                text("SELECT sql FROM sqlite_master WHERE type = 'index' AND tbl_name = :name AND sql IS NOT NULL"),
+                {"name": name},
+            ).scalars().all()
+            # Legacy rename skips re-parsing views that reference the table
+            # while it is briefly missing.
+            legacy = conn.exec_driver_sql("PRAGMA legacy_alter_table").scalar()
+            conn.exec_driver_sql("PRAGMA legacy_alter_table = ON")
+            try:
+                conn.execute(text(f"DROP TABLE IF EXISTS {build_ref}"))
+                conn.exec_driver_sql(f"CREATE TABLE {build_ref} AS {definition}")
+                conn.execute(text(f"DROP TABLE {view_ref}"))
+                conn.execute(text(f"ALTER TABLE {build_ref} RENAME TO {view_ref}"))
+            finally:
+                conn.exec_driver_sql(f"PRAGMA legacy_alter_table = {'ON' if legacy else 'OFF'}")
+            for ddl in index_ddl:
+                conn.exec_driver_sql(ddl)
 
     def configure_dbapi_connection(self, dbapi_connection:  sa.engine.interfaces.DBAPIConnection) -> None:
         if dbapi_connection.__class__.__module__.startswith("sqlite3"):
@@ -270,6 +442,7 @@ class SQLiteBackend(DatabaseBackend):
             if self.defer_foreign_keys:
                 cursor.execute("PRAGMA defer_foreign_keys = ON;")
             cursor.close()
+            self.register_functions(dbapi_connection)
 
     def install_engine_hooks(self, engine: "Engine") -> None:
         @event.listens_for(engine, "connect")
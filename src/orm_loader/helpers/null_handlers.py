@@ -7,6 +7,15 @@ def normalise_null(value: Any) -> Any | None:
     if value is None:
         return None
 
+    # exact builtin types first: avoids pd.isna for the common cases
+    value_type = type(value)
+    if value_type is int or value_type is bool:
+        return value
+    if value_type is float:
+        return None if value != value else value
+    if value_type is str:
+        return None if value.strip().lower() in _NULL_STRINGS else value
+
     # pandas / numpy NaN
     try:
         if pd.isna(value):
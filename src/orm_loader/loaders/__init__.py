@@ -1,10 +1,11 @@
 from .loader_interface import LoaderInterface, PandasLoader, ParquetLoader
-from .data_classes import LoaderContext, TableCastingStats
+from .data_classes import ChunkSizing, LoaderContext, TableCastingStats
 from .loading_helpers import infer_delim, infer_encoding, quick_load_pg
 
 __all__ = [
     "LoaderInterface", 
     "LoaderContext", 
+    "ChunkSizing",
     "PandasLoader",
     "TableCastingStats",
     "infer_delim",
@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+import logging
+import multiprocessing
+import pickle
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, Callable, Iterable, Iterator, TYPE_CHECKING
+
+import pandas as pd
+import pyarrow as pa
+
+from .data.converters import _COLUMN_CAST_RULES
+
+if TYPE_CHECKING:
+    from .data_classes import LoaderInterface, TableCastingStats
+    from ..tables.typing import CSVTableProtocol
+
+logger = logging.getLogger(__name__)
+
+"""
+Process-Pool Casting
+====================
+
+Runs a loader's casting step in worker processes, so Python-level cast
+rules and fallback parsers use more than one core.
+
+Arrow tables travel to and from the workers as Arrow IPC streams; pandas
+chunks are pickled. Each worker re-registers the parent's column cast
+rules on start-up and returns the casting statistics for its chunk,
+which the caller merges.
+
+Workers are started with ``forkserver`` (``spawn`` where it is not
+available) rather than the platform default: forking a parent that
+already runs driver, pipeline or Arrow threads can deadlock the child.
+"""
+
+
+def _mp_context() -> multiprocessing.context.BaseContext:
+    methods = multiprocessing.get_all_start_methods()
+    return multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+
+
+def _to_ipc(table: pa.Table) -> bytes:
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
+
+
+def _from_ipc(payload: bytes) -> pa.Table:
+    return pa.ipc.open_stream(payload).read_all()
+
+
+def _pack(data: pd.DataFrame | pa.Table | pa.RecordBatch) -> tuple[bool, Any]:
+    if isinstance(data, pa.RecordBatch):
+        data = pa.Table.from_batches([data])
+    if isinstance(data, pa.Table):
+        return True, _to_ipc(data)
+    return False, data
+
+
+def _unpack(is_arrow: bool, payload: Any) -> pd.DataFrame | pa.Table:
+    return _from_ipc(payload) if is_arrow else payload
+
+
+def _init_worker(rules: dict[tuple[str, str], Callable[[Any], Any]]) -> None:
+    _COLUMN_CAST_RULES.update(rules)
+
+
+def _cast_in_worker(
+    loader: type[LoaderInterface],
+    tableclass: type[CSVTableProtocol],
+    is_arrow: bool,
+    payload: Any,
+) -> tuple[bool, Any, TableCastingStats]:
+    out, stats = loader.cast_chunk(_unpack(is_arrow, payload), tableclass)
+    return (*_pack(out), stats)
+
+
+def _check_picklable(
+    tableclass: type[CSVTableProtocol],
+    rules: dict[tuple[str, str], Callable[[Any], Any]],
+    start_method: str,
+) -> None:
+    try:
+        pickle.dumps(tableclass)
+    except Exception as exc:
+        raise ValueError(
+            f"Table class {tableclass.__qualname__} cannot be sent to worker processes "
+            f"(start method {start_method!r}); define it at module level"
+        ) from exc
+    for (table_name, column_name), rule in rules.items():
+        try:
+            pickle.dumps(rule)
+        except Exception as exc:
+            raise ValueError(
+                f"Cast rule for {table_name}.{column_name} cannot be sent to worker processes "
+                f"(start method {start_method!r}); register a module-level "
+                "function instead of a lambda or closure"
+            ) from exc
+
+
+def cast_in_processes(
+    loader: type[LoaderInterface],
+    tableclass: type[CSVTableProtocol],
+    chunks: Iterable[pd.DataFrame | pa.Table | pa.RecordBatch],
+    *,
+    workers: int,
+    stats: TableCastingStats,
+) -> Iterator[pd.DataFrame | pa.Table]:
+    """
+    Cast ``chunks`` with ``loader.cast_chunk`` on ``workers`` processes.
+
+    Results are yielded in input order, with at most two chunks per
+    worker in flight. Each chunk's casting statistics are merged into
+    ``stats``.
+    """
+    rules = dict(_COLUMN_CAST_RULES)
+    context = _mp_context()
+    _check_picklable(tableclass, rules, context.get_start_method())
+
+    in_flight: deque[Future] = deque()
+    with ProcessPoolExecutor(
+        max_workers=workers, mp_context=context, initializer=_init_worker, initargs=(rules,)
+    ) as pool:
+
+        def _collect() -> pd.DataFrame | pa.Table:
+            is_arrow, payload, chunk_stats = in_flight.popleft().result()
+            stats.merge(chunk_stats)
+            return _unpack(is_arrow, payload)
+
+        try:
+            for chunk in chunks:
+                in_flight.append(pool.submit(_cast_in_worker, loader, tableclass, *_pack(chunk)))
+                if len(in_flight) >= 2 * workers:
+                    yield _collect()
+            while in_flight:
+                yield _collect()
+        finally:
+            for future in in_flight:
+                future.cancel()
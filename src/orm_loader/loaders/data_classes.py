@@ -1,4 +1,5 @@
-from typing import Any, Type, List, Dict, TYPE_CHECKING
+import asyncio
+from typing import Any, Type, List, Dict, Iterator, TYPE_CHECKING
 from dataclasses import dataclass, field
 import sqlalchemy as sa
 import sqlalchemy.orm as so
@@ -7,9 +8,12 @@ import pandas as pd
 import pyarrow as pa
 from logging import getLogger
 
+from .loading_helpers import pipeline_chunks, rows_for_budget
+
 logger = getLogger(__name__)
 
 if TYPE_CHECKING:
+    from ..tables.allocators import IdAllocator, BlockIdAllocator
     from ..tables.typing import CSVTableProtocol
 
 def _clean_nulls(v):
@@ -36,6 +40,19 @@ No file I/O or database-specific loading logic is implemented here.
 """
 
 
+@dataclass
+class ChunkSizing:
+    """
+    Chunk sizes a loader chose from ``LoaderContext.memory_budget_mb``.
+
+    Filled in once the first rows of the file have been measured; fields
+    stay ``None`` when no budget is set.
+    """
+    bytes_per_row: float | None = None
+    rows: int | None = None
+    block_size: int | None = None
+
+
 @dataclass(frozen=True)
 class LoaderContext:
 
@@ -64,6 +81,35 @@ class LoaderContext:
     staging_schema
         Schema the staging table lives in, passed to resolve_backend() so
         every backend resolution within this load shares the same schema.
+    id_allocator
+        Optional allocator used to fill missing surrogate keys batch by
+        batch; each batch reserves one block and fills it with an arange.
+    id_column
+        Column that receives surrogate keys. Required when ``id_allocator``
+        or ``id_sequence`` is set.
+    id_sequence
+        Database sequence used to fill missing keys in the staging table
+        after the load (PostgreSQL).
+    offload_parsing
+        Read, cast and dedupe each chunk on a worker thread, awaiting it
+        from the event loop. Set when the session runs on an async engine,
+        so parsing never blocks the loop.
+    pipeline_depth
+        Number of chunks prepared ahead on a background thread while the
+        previous chunk is written. ``0`` reads, casts and writes strictly
+        in turn.
+    pipeline_memory_mb
+        Upper bound, in MiB, on the prepared chunks held in memory at once
+        when pipelining.
+    cast_workers
+        Number of worker processes that cast chunks to the model's types.
+        ``1`` casts in the loading process.
+    memory_budget_mb
+        Memory, in MiB, one chunk may use while it is cast and written.
+        Chunk sizes are derived from the bytes per row of the first rows
+        read, capped by ``chunksize`` when both are given.
+    chunk_sizing
+        The sizes chosen under ``memory_budget_mb``, for inspection.
     """
     tableclass: Type["CSVTableProtocol"]
     session: so.Session
@@ -75,6 +121,15 @@ class LoaderContext:
     dedupe: bool = True
     quote_mode: str = "auto"
     staging_schema: str | None = None
+    id_allocator: "IdAllocator | BlockIdAllocator | None" = None
+    id_column: str | None = None
+    id_sequence: str | None = None
+    offload_parsing: bool = False
+    pipeline_depth: int = 0
+    pipeline_memory_mb: float | None = None
+    cast_workers: int = 1
+    memory_budget_mb: float | None = None
+    chunk_sizing: ChunkSizing = field(default_factory=ChunkSizing)
 
 class LoaderInterface:
 
@@ -88,9 +143,113 @@ class LoaderInterface:
     - optional normalisation
     - loading into a staging table
 
-    Concrete loaders must implement ``orm_file_load`` and ``dedupe``.
+    Concrete loaders implement ``prepared_chunks`` and ``dedupe``; the
+    default ``orm_file_load`` writes each prepared chunk to staging.
+
+    Attributes
+    ----------
+    chunk_sizing
+        Sizes chosen under ``memory_budget_mb`` by the last ``load_csv``
+        that used this loader instance, or ``None`` before any such load.
     """
 
+    chunk_sizing: ChunkSizing | None = None
+
+    @classmethod
+    def prepared_chunks(cls, ctx: LoaderContext) -> Iterator[pd.DataFrame]:
+        """
+        Yield DataFrames ready to be written to the staging table.
+
+        Implementations read, normalise, dedupe and cast the file here,
+        without touching the database.
+        """
+        raise NotImplementedError
+
+    @classmethod
+    def cast_to_model(cls, data: Any, ctx: LoaderContext) -> Any:
+        """
+        Cast one chunk to the model's column types, logging any failures.
+        """
+        out, stats = cls.cast_chunk(data, ctx.tableclass)
+        cls._log_cast_failures(stats)
+        return out
+
+    @classmethod
+    def cast_chunk(cls, data: Any, tableclass: Type["CSVTableProtocol"]) -> tuple[Any, "TableCastingStats"]:
+        """
+        Cast one chunk to the model's column types.
+
+        Returns the cast chunk and its casting statistics. Must not rely on
+        the session, so it can run in a worker process.
+        """
+        raise NotImplementedError
+
+    @classmethod
+    def _log_cast_failures(cls, stats: "TableCastingStats") -> None:
+        for col, col_stats in stats.columns.items():
+            logger.warning(f"CAST {stats.table_name}.{col}: {col_stats.count} failures. Examples: {col_stats.examples}")
+
+    @classmethod
+    def _cast_chunks(cls, chunks: Iterator[Any], ctx: LoaderContext) -> Iterator[Any]:
+        if ctx.cast_workers <= 1:
+            for chunk in chunks:
+                yield cls.cast_to_model(chunk, ctx)
+            return
+
+        from .cast_workers import cast_in_processes
+
+        stats = TableCastingStats(table_name=ctx.tableclass.__tablename__)
+        yield from cast_in_processes(cls, ctx.tableclass, chunks, workers=ctx.cast_workers, stats=stats)
+        cls._log_cast_failures(stats)
+
+    @classmethod
+    def _size_chunks(
+        cls,
+        ctx: LoaderContext,
+        probe: pd.DataFrame,
+        *,
+        line_bytes: float | None = None,
+    ) -> ChunkSizing:
+        """
+        Derive chunk sizes from the in-memory size of ``probe`` rows.
+
+        ``line_bytes`` (average bytes per line on disk) additionally sizes
+        the byte-based read block of the Arrow CSV reader.
+        """
+        sizing = ctx.chunk_sizing
+        sizing.bytes_per_row = float(probe.memory_usage(deep=True).sum()) / max(len(probe), 1)
+        rows = rows_for_budget(sizing.bytes_per_row, ctx.memory_budget_mb)  # ty: ignore[invalid-argument-type]
+        sizing.rows = min(rows, ctx.chunksize) if ctx.chunksize else rows
+        if line_bytes is not None:
+            sizing.block_size = int(sizing.rows * line_bytes)
+        logger.info(
+            f"Sized chunks for {ctx.path.name}: {sizing.rows} rows"
+            + (f", {sizing.block_size} byte read blocks" if sizing.block_size else "")
+            + f" (~{sizing.bytes_per_row:.0f} bytes/row in memory, budget {ctx.memory_budget_mb} MiB)"
+        )
+        return sizing
+
+    @classmethod
+    def _iter_prepared(cls, ctx: LoaderContext) -> Iterator[pd.DataFrame]:
+        chunks = cls.prepared_chunks(ctx)
+        if ctx.pipeline_depth > 0:
+            budget = ctx.pipeline_memory_mb
+            chunks = pipeline_chunks(
+                chunks,
+                depth=ctx.pipeline_depth,
+                memory_budget_bytes=int(budget * 1024 * 1024) if budget else None,
+            )
+        if not ctx.offload_parsing:
+            yield from chunks
+            return
+
+        # Running inside AsyncSession.run_sync: await each chunk from a worker
+        # thread so the event loop keeps serving other loads while we parse.
+        from sqlalchemy.util import await_only
+
+        while (chunk := await_only(asyncio.to_thread(next, chunks, None))) is not None:
+            yield chunk
+
     @classmethod
     def orm_file_load(cls, ctx: LoaderContext) -> int:
         """
@@ -106,7 +265,14 @@ class LoaderInterface:
         int
             Number of rows loaded.
         """
-        raise NotImplementedError
+        total = 0
+        for chunk in cls._iter_prepared(ctx):
+            total += cls._load_chunk(
+                staging_cls=ctx.staging_table,
+                session=ctx.session,
+                dataframe=chunk,
+            )
+        return total
 
     @classmethod
     def _load_chunk(
@@ -188,6 +354,13 @@ class ColumnCastingStats:
         if len(self.examples) < example_limit:
             self.examples.append(value)
 
+    def merge(self, other: "ColumnCastingStats", example_limit: int = 3):
+        """
+        Add the failures recorded in ``other`` to this column.
+        """
+        self.count += other.count
+        self.examples.extend(other.examples[: max(example_limit - len(self.examples), 0)])
+
 @dataclass
 class TableCastingStats:
     """
@@ -222,6 +395,13 @@ class TableCastingStats:
         Whether any casting failures occurred.
         """
         return self.total_failures > 0
+
+    def merge(self, other: "TableCastingStats", example_limit: int = 3):
+        """
+        Fold another chunk's (or worker's) statistics into these.
+        """
+        for column, stats in other.columns.items():
+            self.columns.setdefault(column, ColumnCastingStats()).merge(stats, example_limit=example_limit)
     
     def to_dict(self) -> dict[str, dict[str, Any]]:
         """
@@ -1,5 +1,6 @@
 from __future__ import annotations
-from typing import Any, Iterable, Type, TYPE_CHECKING
+from contextlib import closing
+from typing import Any, Iterable, Iterator, Type, TYPE_CHECKING
 import csv as _csv
 import pandas as pd
 import logging
@@ -8,7 +9,18 @@ import pyarrow.dataset as ds
 import pyarrow.compute as pc
 from functools import reduce
 from .data_classes import LoaderContext, TableCastingStats, LoaderInterface
-from .loading_helpers import infer_delim, infer_encoding, conservative_load_parquet, arrow_drop_duplicates, resolve_quote_mode
+from .loading_helpers import (
+    infer_delim,
+    infer_encoding,
+    conservative_load_parquet,
+    arrow_drop_duplicates,
+    resolve_quote_mode,
+    assign_ids_pandas,
+    assign_ids_arrow,
+    estimate_line_bytes,
+    MIN_CSV_BLOCK_SIZE,
+    PROBE_ROWS,
+)
 from .data import perform_cast, cast_arrow_column
 from ..helpers import IngestError
 
@@ -86,18 +98,26 @@ class PandasLoader(LoaderInterface):
         return df.copy()
 
     @classmethod
-    def cast_to_model(cls, data: pd.DataFrame | pa.Table, ctx: LoaderContext) -> Any:
+    def _log_cast_failures(cls, stats: TableCastingStats) -> None:
+        for col, col_stats in stats.columns.items():
+            logger.warning(f"CAST {stats.table_name}.{col}: {col_stats.count} row(s) failed. Examples: {col_stats.examples}")
+
+    @classmethod
+    def cast_chunk(
+        cls,
+        data: pd.DataFrame | pa.Table,
+        tableclass: Type[CSVTableProtocol],
+    ) -> tuple[pd.DataFrame, TableCastingStats]:
         if not isinstance(data, pd.DataFrame):
             df = data.to_pandas()
         else:
             df = data
-        if df.empty:
-            return df
-        
-        table_name = ctx.tableclass.__tablename__
+        table_name = tableclass.__tablename__
         stats = TableCastingStats(table_name=table_name)
+        if df.empty:
+            return df, stats
 
-        model_columns = ctx.tableclass.model_columns()
+        model_columns = tableclass.model_columns()
         for col_name, sa_col in model_columns.items():
             if col_name not in df.columns:
                 continue
@@ -111,8 +131,8 @@ class PandasLoader(LoaderInterface):
                 )
             )
 
-        _require_columns_present(ctx.tableclass, df.columns)
-        required_cols = list(ctx.tableclass.required_columns())
+        _require_columns_present(tableclass, df.columns)
+        required_cols = list(tableclass.required_columns())
 
         if required_cols:
             null_mask = df[required_cols].isna()
@@ -127,16 +147,28 @@ class PandasLoader(LoaderInterface):
                     )
             # Drop rows violating required constraints
             df = df.loc[~null_mask.any(axis=1)]
-        if stats.has_failures():
-            for col, col_stats in stats.columns.items():
-                logger.warning(f"CAST {table_name}.{col}: {col_stats.count} row(s) failed. Examples: {col_stats.examples}")
 
-        return df
+        return df, stats
     
     @classmethod
-    def orm_file_load(cls, ctx: LoaderContext) -> int:
+    def _budgeted_chunks(cls, reader: Any, ctx: LoaderContext) -> Iterator[pd.DataFrame]:
+        # The reader starts at PROBE_ROWS; the first chunk sets the size of the rest.
+        try:
+            chunk = reader.get_chunk()
+        except StopIteration:
+            return
+        rows = cls._size_chunks(ctx, chunk).rows
+        while True:
+            yield chunk
+            try:
+                chunk = reader.get_chunk(rows)
+            except StopIteration:
+                return
+
+    @classmethod
+    def prepared_chunks(cls, ctx: LoaderContext) -> Iterator[pd.DataFrame]:
         """
-        Load a file into a staging table, delegating chunking to pandas.
+        Read and prepare a file for staging, delegating chunking to pandas.
 
         If chunksize is None, pandas returns a single DataFrame, which we
         normalise to a one-element iterator for unified processing.
@@ -158,33 +190,34 @@ class PandasLoader(LoaderInterface):
                 ctx.path,
                 delimiter=delimiter,
                 dtype=str,
-                chunksize=ctx.chunksize,
+                chunksize=PROBE_ROWS if ctx.memory_budget_mb else ctx.chunksize,
                 encoding=encoding,
                 quoting=quoting,
             )
         except pd.errors.EmptyDataError:
             logger.info(f"File {ctx.path.name} is empty — skipping load for {ctx.tableclass.__tablename__}")
-            return 0
+            return
         
         logger.info(f"Detected encoding {encoding} for file {ctx.path.name}")
         logger.info(f"Detected delimiter '{delimiter}' for file {ctx.path.name}")       
         logger.info(f"Loading with chunksize '{ctx.chunksize}' for file {ctx.path.name}")       
         chunks = (reader,) if isinstance(reader, pd.DataFrame) else reader
-
-        total = 0
-        for i, chunk in enumerate(chunks):
-            logger.debug(f"Processing chunk {i} with {len(chunk)} rows for {ctx.tableclass.__tablename__}")
-            chunk = _normalise_columns(chunk)
-            if ctx.dedupe:
-                chunk = cls.dedupe(chunk, ctx)
-            if ctx.normalise:
-                chunk = cls.cast_to_model(chunk, ctx)
-            total += cls._load_chunk(
-                staging_cls=ctx.staging_table,
-                session=ctx.session,
-                dataframe=chunk
-            )
-        return total
+        if ctx.memory_budget_mb:
+            chunks = cls._budgeted_chunks(reader, ctx)
+
+        def _parsed() -> Iterator[pd.DataFrame]:
+            for i, chunk in enumerate(chunks):
+                logger.debug(f"Processing chunk {i} with {len(chunk)} rows for {ctx.tableclass.__tablename__}")
+                chunk = _normalise_columns(chunk)
+                if ctx.id_allocator is not None and ctx.id_column:
+                    # Keys are filled before dedupe so rows with a missing key
+                    # are not collapsed into one on the null PK.
+                    chunk = assign_ids_pandas(chunk, ctx.id_column, ctx.id_allocator)
+                if ctx.dedupe:
+                    chunk = cls.dedupe(chunk, ctx)
+                yield chunk
+
+        yield from cls._cast_chunks(_parsed(), ctx) if ctx.normalise else _parsed()
 
 class ParquetLoader(LoaderInterface):
 
@@ -193,13 +226,17 @@ class ParquetLoader(LoaderInterface):
     """
 
     @classmethod
-    def cast_to_model(cls, data: pa.Table, ctx: LoaderContext) -> pa.Table:
-        if data.num_rows == 0:
-            return data
-        
-        table_name = ctx.tableclass.__tablename__
+    def cast_chunk(
+        cls,
+        data: pa.Table,
+        tableclass: Type[CSVTableProtocol],
+    ) -> tuple[pa.Table, TableCastingStats]:
+        table_name = tableclass.__tablename__
         stats = TableCastingStats(table_name=table_name)
-        model_columns = ctx.tableclass.model_columns()
+        if data.num_rows == 0:
+            return data, stats
+
+        model_columns = tableclass.model_columns()
         arrays: dict[str, pa.Array] = {}
         for col_name, sa_col in model_columns.items():
             if col_name not in data.schema.names:
@@ -213,8 +250,8 @@ class ParquetLoader(LoaderInterface):
             )
 
         out = pa.table(arrays)
-        _require_columns_present(ctx.tableclass, out.schema.names)
-        required_cols = list(ctx.tableclass.required_columns())
+        _require_columns_present(tableclass, out.schema.names)
+        required_cols = list(tableclass.required_columns())
 
         if required_cols:
             masks = [pc.is_valid(out[c]) for c in required_cols]            # type: ignore
@@ -230,11 +267,7 @@ class ParquetLoader(LoaderInterface):
 
             out = out.filter(valid_mask)
 
-        if stats.has_failures():
-            for col, col_stats in stats.columns.items():
-                logger.warning(f"CAST {table_name}.{col}: {col_stats.count} failures. Examples: {col_stats.examples}")
-
-        return out
+        return out, stats
 
     @classmethod
     def dedupe(cls, data: pa.Table, ctx: LoaderContext) -> pa.Table:
@@ -255,28 +288,48 @@ class ParquetLoader(LoaderInterface):
     @classmethod
     def _scan_batches(cls, ctx: LoaderContext):
         suffix = ctx.path.suffix.lower()
-        model_columns = ctx.tableclass.model_columns()
-        wanted_cols = list(model_columns.keys())
+        wanted_cols = list(ctx.tableclass.csv_columns().keys())
         logger.info(f"Scanning batches for {ctx.tableclass.__tablename__}")
         if suffix == ".parquet":
             dataset = ds.dataset(ctx.path, format="parquet")
-            yield from dataset.to_batches(batch_size=ctx.chunksize or 64_000)
+            batch_size = ctx.chunksize or 64_000
+            if ctx.memory_budget_mb:
+                probe = dataset.head(PROBE_ROWS)
+                if probe.num_rows:
+                    batch_size = cls._size_chunks(ctx, probe.to_pandas()).rows
+            yield from dataset.to_batches(batch_size=batch_size)
 
         elif suffix in {".csv", ".tsv"}:
-            yield from conservative_load_parquet(ctx.path, wanted_cols=wanted_cols, chunksize=ctx.chunksize)
+            block_size = None
+            if ctx.memory_budget_mb:
+                # Read one small block to measure rows, then start over with blocks sized to the budget.
+                with closing(conservative_load_parquet(ctx.path, wanted_cols, block_size=MIN_CSV_BLOCK_SIZE)) as probes:
+                    probe = next(probes, None)
+                if probe is not None and probe.num_rows:
+                    block_size = cls._size_chunks(
+                        ctx, probe.to_pandas(), line_bytes=estimate_line_bytes(ctx.path)
+                    ).block_size
+            yield from conservative_load_parquet(
+                ctx.path, wanted_cols=wanted_cols, chunksize=ctx.chunksize, block_size=block_size
+            )
         else:
             raise ValueError(f"Unsupported file type: {ctx.path}")
 
 
     @classmethod
-    def orm_file_load(cls, ctx: LoaderContext) -> int:
-        total = 0
-        for record_batch in cls._scan_batches(ctx):
-            if record_batch.num_rows == 0:
-                continue
-            data: pa.Table | pa.RecordBatch = record_batch
-            if ctx.normalise:
-                data = cls.cast_to_model(data, ctx=ctx)
+    def prepared_chunks(cls, ctx: LoaderContext) -> Iterator[pd.DataFrame]:
+        def _scanned() -> Iterator[pa.Table | pa.RecordBatch]:
+            for record_batch in cls._scan_batches(ctx):
+                if record_batch.num_rows == 0:
+                    continue
+                data: pa.Table | pa.RecordBatch = record_batch
+                if ctx.id_allocator is not None and ctx.id_column:
+                    # Filled before dedupe for the same reason as PandasLoader.
+                    batch_table = pa.Table.from_batches([record_batch]) if isinstance(record_batch, pa.RecordBatch) else record_batch
+                    data = assign_ids_arrow(batch_table, ctx.id_column, ctx.id_allocator)
+                yield data
+
+        for data in cls._cast_chunks(_scanned(), ctx) if ctx.normalise else _scanned():
             if ctx.dedupe:
                 data = cls.dedupe(data, ctx)
 
@@ -285,13 +338,6 @@ class ParquetLoader(LoaderInterface):
             else:
                 df = data 
             if df.empty:
-                
                 continue
 
-            total += cls._load_chunk(
-                staging_cls=ctx.staging_table,
-                session=ctx.session,
-                dataframe=df,
-            )
-
-        return total
\ No newline at end of file
+            yield df
\ No newline at end of file
@@ -1,5 +1,6 @@
 from __future__ import annotations
 from pathlib import Path
+import asyncio
 import chardet
 import csv as _csv
 import re
@@ -10,13 +11,24 @@ import pyarrow as pa
 import pyarrow.compute as pc
 import pyarrow.csv as pv
 import io
-
+import mmap
+import queue
+import threading
+from typing import TYPE_CHECKING, Iterator
+import numpy as np
+import pandas as pd
+
+from ..helpers.null_handlers import _NULL_STRINGS
 from ..helpers.sql import qualify_identifier
 
+if TYPE_CHECKING:
+    from ..tables.allocators import IdAllocator, BlockIdAllocator
+
 _SAFE_ENCODING = re.compile(r'^[A-Za-z][A-Za-z0-9_-]*$')
 
 logger = logging.getLogger(__name__)
-COPY_BLOCK_SIZE = 8192
+#: Bytes handed to ``copy.write`` per call when streaming a memory-mapped file.
+COPY_MMAP_BLOCK_SIZE = 4 << 20
 
 """
 Loader Helper Functions
@@ -33,48 +45,85 @@ Includes helpers for:
 These helpers are intentionally low-level and stateless.
 """
 
-class NormalisedCSVStream(io.RawIOBase):
-    def __init__(self, f, encoding: str, delimiter: str):
-        self._f = f
-        self._encoding = encoding
-        self._delimiter = delimiter
-        self._sent_header = False
-        self._buffer = b""
-        self._eof = False
 
-    def readable(self):
-        return True
+def _rewrite_header(raw: bytes, encoding: str, delimiter: str) -> bytes:
+    header = raw.decode(encoding)
+    newline = check_line_ending(header)
+    cols = header.rstrip(newline).split(delimiter)
+    lowered = [c.strip().strip('"').lower().replace('_hash', '') for c in cols]
+    return (delimiter.join(lowered) + "\n").encode(encoding)
 
-    def read(self, size=-1):
-        if self._eof:
-            return b""
 
-        out = bytearray()
-
-        # Send rewritten header once
-        if not self._sent_header:
-            header = self._f.readline().decode(self._encoding)
-            newline = check_line_ending(header)
-            cols = header.rstrip(newline).split(self._delimiter)
-            lowered = [c.strip().strip('"').lower().replace('_hash', '') for c in cols]
-            new_header = (self._delimiter.join(lowered) + "\n").encode(self._encoding)
-            out.extend(new_header)
-            self._sent_header = True
-
-        while size < 0 or len(out) < size:
-            chunk = self._f.read(8192)
-            if not chunk:
-                self._eof = True
-                break
+class MappedCSVSource:
+    """
+    Memory-mapped ``COPY`` source for a local CSV file.
 
-            # Normalize CRLF/CR to LF per chunk
-            chunk = chunk.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
-            out.extend(chunk)
+    Yields the rewritten header, then the body as ``memoryview`` slices of
+    ``block_size`` bytes taken straight from the mapping. Line endings are
+    only translated to LF when the header ends in CR or CRLF; LF files are
+    passed through without copying. Use as a context manager and finish
+    writing before it closes, since the slices borrow the mapping.
+    """
 
-            if size > 0 and len(out) >= size:
-                break
+    def __init__(self, path: Path, encoding: str, delimiter: str, block_size: int = COPY_MMAP_BLOCK_SIZE):
+        self._path = path
+        self._encoding = encoding
+        self._delimiter = delimiter
+        self._block_size = block_size
+        self._file = None
+        self._mm: mmap.mmap | None = None
+
+    def __enter__(self) -> "MappedCSVSource":
+        self._file = open(self._path, "rb")
+        if self._path.stat().st_size:
+            self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        if self._mm is not None:
+            try:
+                self._mm.close()
+            except BufferError:
+                # A slice is still referenced; the mapping closes when it is collected.
+                logger.debug(f"Deferring unmap of {self._path.name}: buffer still in use")
+            self._mm = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _header_end(self) -> int:
+        mm = self._mm
+        assert mm is not None
+        nl = mm.find(b"\n")
+        cr = mm.find(b"\r", 0, nl + 1 if nl != -1 else len(mm))
+        if cr != -1:
+            return cr + 2 if mm[cr + 1:cr + 2] == b"\n" else cr + 1
+        return nl + 1 if nl != -1 else len(mm)
+
+    def blocks(self) -> Iterator[bytes | memoryview]:
+        """Yield the header followed by the file body in large blocks."""
+        mm = self._mm
+        if mm is None:
+            return
+        start = self._header_end()
+        header = mm[:start]
+        yield _rewrite_header(header, self._encoding, self._delimiter)
+
+        translate = header.endswith(b"\r") or header.endswith(b"\r\n")
+        size = len(mm)
+        pos = start
+        with memoryview(mm) as view:
+            while pos < size:
+                end = min(pos + self._block_size, size)
+                if not translate:
+                    yield view[pos:end]
+                else:
+                    # Keep a CRLF pair together so it is not turned into two newlines.
+                    if end < size and mm[end - 1:end] == b"\r" and mm[end:end + 1] == b"\n":
+                        end += 1
+                    yield mm[pos:end].replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+                pos = end
 
-        return bytes(out)
 
 def infer_encoding(file):
     with open(file, 'rb') as infile:
@@ -217,7 +266,177 @@ def arrow_drop_duplicates(
     return deduped
 
 
-def conservative_load_parquet(path: Path, wanted_cols: list[str], chunksize: int | None = None) -> pa.Table:
+def _string_null_mask(values: pd.Series) -> pd.Series:
+    mask = values.isna()
+    if values.dtype == object or pd.api.types.is_string_dtype(values):
+        lowered = values.astype("string").str.strip().str.lower()
+        mask = mask | lowered.isin(_NULL_STRINGS).fillna(False).astype(bool)
+    return mask
+
+
+def assign_ids_pandas(df: pd.DataFrame, column: str, allocator: "IdAllocator | BlockIdAllocator") -> pd.DataFrame:
+    """
+    Fill missing values of ``column`` from a single reserved block.
+
+    Rows whose key is null (or a null-like string) receive consecutive IDs
+    from one ``allocator.reserve(n)`` call, assigned with ``numpy.arange``.
+    A missing column is added and filled for every row. Existing keys are
+    left untouched.
+    """
+    if df.empty:
+        return df
+    if column not in df.columns:
+        df = df.assign(**{column: pd.NA})
+    mask = _string_null_mask(df[column])
+    n = int(mask.sum())
+    if n == 0:
+        return df
+    block = allocator.reserve(n)
+    if df[column].dtype != object:
+        df = df.astype({column: object})
+    df.loc[mask, column] = np.arange(block.start, block.stop, dtype=np.int64)
+    return df
+
+
+def assign_ids_arrow(table: pa.Table, column: str, allocator: "IdAllocator | BlockIdAllocator") -> pa.Table:
+    """
+    Arrow counterpart of :func:`assign_ids_pandas`.
+
+    Missing keys are replaced with ``pc.replace_with_mask`` over an arange
+    from one reserved block, cast to the column's current Arrow type so
+    raw string batches and already-cast integer batches are both handled.
+    """
+    if table.num_rows == 0:
+        return table
+    if column not in table.schema.names:
+        block = allocator.reserve(table.num_rows)
+        return table.append_column(column, pa.array(np.arange(block.start, block.stop, dtype=np.int64)))
+
+    idx = table.schema.get_field_index(column)
+    arr = table[column].combine_chunks()
+    mask = pc.is_null(arr)
+    if pa.types.is_string(arr.type) or pa.types.is_large_string(arr.type):
+        lowered = pc.utf8_lower(pc.utf8_trim_whitespace(arr))                       # type: ignore
+        is_null_like = pc.is_in(lowered, value_set=pa.array(sorted(_NULL_STRINGS)))  # type: ignore
+        mask = pc.or_(mask, pc.fill_null(is_null_like, False))                    # type: ignore
+    n = pc.sum(mask).as_py() or 0                                                  # type: ignore
+    if n == 0:
+        return table
+    block = allocator.reserve(n)
+    ids = pa.array(np.arange(block.start, block.stop, dtype=np.int64)).cast(arr.type)
+    filled = pc.replace_with_mask(arr, mask, ids)                                  # type: ignore
+    return table.set_column(idx, table.schema.field(idx), filled)
+
+
+#: Copies of a chunk assumed alive at once while it is cast and written
+#: (raw, cast and insert parameters); ``memory_budget_mb`` is divided by it.
+MEMORY_BUDGET_HEADROOM = 3
+#: Rows read to measure bytes per row before sizing chunks.
+PROBE_ROWS = 1_000
+#: Smallest Arrow CSV read block; also the block size when no chunk size is given.
+MIN_CSV_BLOCK_SIZE = 64_000
+
+
+def rows_for_budget(bytes_per_row: float, memory_budget_mb: float) -> int:
+    """Return how many rows of ``bytes_per_row`` fit the budget, allowing for headroom."""
+    budget = memory_budget_mb * 1024 * 1024
+    return max(int(budget / (max(bytes_per_row, 1.0) * MEMORY_BUDGET_HEADROOM)), 1)
+
+
+def estimate_line_bytes(path: Path, sample_bytes: int = 1 << 20) -> float:
+    """Return the average on-disk bytes per line over the first ``sample_bytes`` of ``path``."""
+    with open(path, "rb") as f:
+        sample = f.read(sample_bytes)
+    return len(sample) / max(sample.count(b"\n"), 1)
+
+
+_PIPELINE_DONE = object()
+
+
+def pipeline_chunks(
+    chunks: Iterator[pd.DataFrame],
+    *,
+    depth: int,
+    memory_budget_bytes: int | None = None,
+) -> Iterator[pd.DataFrame]:
+    """
+    Prepare ``chunks`` on a background thread while the caller writes.
+
+    At most ``depth`` prepared chunks wait in the queue. With
+    ``memory_budget_bytes`` the producer also pauses while the chunks it
+    has handed over (queued, or still being written by the caller) exceed
+    the budget; a single chunk larger than the budget is still let through.
+    Errors raised while preparing are re-raised in the caller, and closing
+    the iterator early stops the producer.
+    """
+    if depth < 1:
+        raise ValueError(f"Pipeline depth must be at least 1, got {depth}")
+
+    pending: queue.Queue = queue.Queue(maxsize=depth)
+    stop = threading.Event()
+    budget = threading.Condition()
+    in_flight = 0
+
+    def _put(item) -> bool:
+        while not stop.is_set():
+            try:
+                pending.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _produce() -> None:
+        nonlocal in_flight
+        try:
+            for chunk in chunks:
+                size = int(chunk.memory_usage(deep=True).sum()) if memory_budget_bytes else 0
+                with budget:
+                    if memory_budget_bytes:
+                        budget.wait_for(
+                            lambda: stop.is_set() or in_flight == 0 or in_flight + size <= memory_budget_bytes
+                        )
+                    in_flight += size
+                if not _put((chunk, size)):
+                    return
+        except BaseException as exc:
+            _put(exc)
+            return
+        _put(_PIPELINE_DONE)
+
+    producer = threading.Thread(target=_produce, name="orm-loader-pipeline", daemon=True)
+    producer.start()
+    try:
+        while (item := pending.get()) is not _PIPELINE_DONE:
+            if isinstance(item, BaseException):
+                raise item
+            chunk, size = item
+            yield chunk
+            # The caller has finished writing this chunk, so its memory is free.
+            with budget:
+                in_flight -= size
+                budget.notify_all()
+    finally:
+        stop.set()
+        with budget:
+            budget.notify_all()
+        producer.join()
+
+
+def conservative_load_parquet(
+    path: Path,
+    wanted_cols: list[str],
+    chunksize: int | None = None,
+    *,
+    block_size: int | None = None,
+) -> pa.Table:
+    """
+    Yield record batches of a delimited text file read with PyArrow.
+
+    Arrow reads CSV in byte-sized blocks, so ``chunksize`` (rows) is
+    turned into a ``block_size`` from the file's average line length.
+    Pass ``block_size`` to set the bytes per block directly.
+    """
     delimiter = infer_delim(path)
     encoding = infer_encoding(path)["encoding"]
     convert_opts = pv.ConvertOptions(
@@ -235,13 +454,13 @@ def conservative_load_parquet(path: Path, wanted_cols: list[str], chunksize: int
         quote_char=False,
         invalid_row_handler=_invalid_row_handler
     )
+    if block_size is None:
+        block_size = int(chunksize * estimate_line_bytes(path)) if chunksize else MIN_CSV_BLOCK_SIZE
     read_opts = pv.ReadOptions(
-        block_size=chunksize or 64_000,
+        block_size=max(block_size, MIN_CSV_BLOCK_SIZE),
         encoding=encoding,
         use_threads=True,
     )
-    if chunksize:
-        read_opts.block_size = chunksize
     with pv.open_csv(
         path,
         read_options=read_opts,
@@ -315,21 +534,23 @@ def quick_load_pg(
 
     logger.info(f"Bulk loading {table_ref} via COPY (encoding={encoding}, delimiter={delimiter})")
 
-    cur = raw_conn.cursor()
+    copy_sql = f'''
+        COPY {table_ref} ({_cols_sql})
+        FROM STDIN
+        WITH (
+            {copy_options}
+        )
+        '''
     try:
-        with open(path, "rb") as f:
-            stream = NormalisedCSVStream(f, encoding=encoding, delimiter=delimiter)
-            with cur.copy(
-                f'''
-                COPY {table_ref} ({_cols_sql})
-                FROM STDIN
-                WITH (
-                    {copy_options}
-                )
-                '''
-            ) as copy:
-                while data := stream.read(COPY_BLOCK_SIZE):
-                    copy.write(data)
+        if session.get_bind().dialect.is_async:
+            # Under AsyncSession.run_sync the DB-API connection is an adapter
+            # around psycopg's AsyncConnection; drive its COPY from the event
+            # loop instead of blocking it.
+            from sqlalchemy.util import await_only
+
+            await_only(_copy_async(raw_conn.driver_connection, copy_sql, path, encoding, delimiter))
+        else:
+            _copy_sync(raw_conn, copy_sql, path, encoding, delimiter)
         session.flush()
         total = session.execute(sa.text(f'SELECT COUNT(*) FROM {table_ref}')).scalar_one()
         return total
@@ -337,5 +558,30 @@ def quick_load_pg(
         logger.error(f"Error during bulk load via COPY: {e}")
         session.rollback()
         raise
+
+
+def _copy_sync(raw_conn, copy_sql: str, path: Path, encoding: str, delimiter: str) -> None:
+    cur = raw_conn.cursor()
+    try:
+        # The source closes after the COPY block, once every slice is written.
+        with MappedCSVSource(path, encoding=encoding, delimiter=delimiter) as source, \
+                cur.copy(copy_sql) as copy:
+            _write_blocks(copy, source)
     finally:
         cur.close()
+
+
+def _write_blocks(copy, source: MappedCSVSource) -> None:
+    # Kept separate so no slice outlives the call and the mapping can close.
+    for block in source.blocks():
+        copy.write(block)
+
+
+async def _copy_async(conn, copy_sql: str, path: Path, encoding: str, delimiter: str) -> None:
+    """COPY through a psycopg ``AsyncConnection``, reading the file on a worker thread."""
+    async with conn.cursor() as cur:
+        with MappedCSVSource(path, encoding=encoding, delimiter=delimiter) as source:
+            blocks = source.blocks()
+            async with cur.copy(copy_sql) as copy:
+                while (block := await asyncio.to_thread(next, blocks, None)) is not None:
+                    await copy.write(block)
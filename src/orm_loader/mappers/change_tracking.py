@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+import logging
+from contextlib import contextmanager
+from typing import Iterable, Iterator
+
+import sqlalchemy as sa
+
+from ..backends.resolve import resolve_backend
+
+logger = logging.getLogger(__name__)
+
+"""
+Change Tracking
+===============
+
+Small metadata tables used to skip materialized view refreshes whose
+inputs have not changed.
+
+``_orm_loader_table_versions`` holds one change counter per table (or
+materialized view), bumped whenever a load modifies it.
+``_orm_loader_mv_watermarks`` records, per view and input, the counter
+value the view was last refreshed against. A view is fresh when every
+input's counter still matches its watermark.
+"""
+
+#: Name of the table holding one change counter per tracked table.
+TABLE_VERSIONS_TABLE = "_orm_loader_table_versions"
+#: Name of the table holding the input versions each view was refreshed at.
+MV_WATERMARKS_TABLE = "_orm_loader_mv_watermarks"
+
+_metadata = sa.MetaData()
+
+_table_versions = sa.Table(
+    TABLE_VERSIONS_TABLE,
+    _metadata,
+    sa.Column("name", sa.String(255), primary_key=True),
+    sa.Column("version", sa.BigInteger, nullable=False),
+)
+
+_mv_watermarks = sa.Table(
+    MV_WATERMARKS_TABLE,
+    _metadata,
+    sa.Column("mv_name", sa.String(255), primary_key=True),
+    sa.Column("source", sa.String(255), primary_key=True),
+    sa.Column("version", sa.BigInteger, nullable=False),
+)
+
+
+@contextmanager
+def _begin(bind: "sa.engine.Connection | sa.engine.Engine") -> Iterator[sa.engine.Connection]:
+    if isinstance(bind, sa.Engine):
+        with bind.begin() as conn:
+            yield conn
+    else:
+        yield bind
+
+
+def ensure_tracking_tables(bind: "sa.engine.Connection | sa.engine.Engine") -> None:
+    """Create the change counter and watermark tables if they do not exist."""
+    with _begin(bind) as conn:
+        for table in (_table_versions, _mv_watermarks):
+            conn.execute(sa.schema.CreateTable(table, if_not_exists=True))
+
+
+def bump_table_version(bind: "sa.engine.Connection | sa.engine.Engine", name: str) -> int:
+    """
+    Increment the change counter of ``name`` and return its new value.
+
+    Counters start at 0 for tables that have never been bumped.
+    """
+    ensure_tracking_tables(bind)
+    backend = resolve_backend(bind)
+    with _begin(bind) as conn:
+        conn.execute(backend.insert_ignore(_table_versions).values(name=name, version=0))
+        conn.execute(
+            sa.update(_table_versions)
+            .where(_table_versions.c.name == name)
+            .values(version=_table_versions.c.version + 1)
+        )
+        version = conn.execute(
+            sa.select(_table_versions.c.version).where(_table_versions.c.name == name)
+        ).scalar_one()
+    logger.debug(f"Table `{name}`: change counter is now {version}")
+    return version
+
+
+def table_versions(bind: "sa.engine.Connection | sa.engine.Engine", names: Iterable[str]) -> dict[str, int]:
+    """Return the current change counter of each name; untracked names report 0."""
+    names = list(names)
+    versions = dict.fromkeys(names, 0)
+    if not names:
+        return versions
+    with _begin(bind) as conn:
+        rows = conn.execute(
+            sa.select(_table_versions.c.name, _table_versions.c.version)
+            .where(_table_versions.c.name.in_(names))
+        ).all()
+    versions.update({name: version for name, version in rows})
+    return versions
+
+
+def mv_watermarks(bind: "sa.engine.Connection | sa.engine.Engine", mv_name: str) -> dict[str, int]:
+    """Return the input versions ``mv_name`` was last refreshed against."""
+    with _begin(bind) as conn:
+        rows = conn.execute(
+            sa.select(_mv_watermarks.c.source, _mv_watermarks.c.version)
+            .where(_mv_watermarks.c.mv_name == mv_name)
+        ).all()
+    return {source: version for source, version in rows}
+
+
+def record_refresh(
+    bind: "sa.engine.Connection | sa.engine.Engine",
+    mv_name: str,
+    versions: dict[str, int],
+) -> int:
+    """
+    Record that ``mv_name`` now reflects ``versions`` of its inputs.
+
+    Only the given inputs are updated, so a partial (incremental) update
+    leaves the other inputs' watermarks alone. The view's own change
+    counter is bumped so views that depend on it become stale; the new
+    counter is returned.
+    """
+    ensure_tracking_tables(bind)
+    with _begin(bind) as conn:
+        for source, version in versions.items():
+            conn.execute(
+                sa.delete(_mv_watermarks)
+                .where(_mv_watermarks.c.mv_name == mv_name, _mv_watermarks.c.source == source)
+            )
+            conn.execute(sa.insert(_mv_watermarks).values(mv_name=mv_name, source=source, version=version))
+        return bump_table_version(conn, mv_name)
+
+
+def is_fresh(current: dict[str, int], watermarks: dict[str, int]) -> bool:
+    """
+    Return whether a view refreshed at ``watermarks`` is up to date with
+    the ``current`` input versions.
+
+    A view with no inputs is never considered fresh, and neither is one
+    with an input at version 0: that input has never been bumped, so its
+    changes are not tracked and cannot be ruled out.
+    """
+    return bool(current) and all(
+        version and watermarks.get(name) == version for name, version in current.items()
+    )
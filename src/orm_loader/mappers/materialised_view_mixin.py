@@ -1,9 +1,22 @@
 from sqlalchemy.ext import compiler
 from sqlalchemy.schema import DDLElement
 import sqlalchemy as sa
+import sqlalchemy.orm as so
+import logging
+import weakref
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from time import perf_counter
 from typing import Any
 from collections import defaultdict, deque
+from sqlalchemy.sql.util import find_tables
+from ..backends.base import ViewIndex
 from ..backends.resolve import resolve_backend
+from .change_tracking import _begin, ensure_tracking_tables, is_fresh, mv_watermarks, record_refresh, table_versions
+
+logger = logging.getLogger(__name__)
+
+# Maximum bound parameters per delta statement; keeps well under SQLite's limit.
+_DELTA_PARAM_LIMIT = 5000
 
 class CreateMaterializedView(DDLElement):
     """
@@ -65,6 +78,7 @@ class MaterializedViewMixin:
     - ``__mv_name__``: the name of the materialized view
     - ``__mv_select__``: a SQLAlchemy Select defining the view contents
     - optionally, ``__mv_dependencies__``: names of tables or materialized views this MV depends on
+    - optionally, ``__mv_indexes__``: ``ViewIndex`` entries created on the view
 
     This mixin does not define ORM mappings; it is intended for schema-level
     helpers used during migrations, setup, or administrative workflows.
@@ -158,6 +172,7 @@ class MaterializedViewMixin:
     __mv_name__: str
     __mv_select__: sa.sql.Select[Any]
     __mv_dependencies__: set[str] = set()
+    __mv_indexes__: tuple[ViewIndex, ...] = ()
 
     @classmethod
     def create_mv(cls, bind: "sa.engine.Connection | sa.engine.Engine") -> None:
@@ -172,8 +187,10 @@ class MaterializedViewMixin:
         Notes
         -----
         The underlying SQL is emitted via a custom DDL element and executed
-        through the resolved backend. With the built-in backends, this means
-        PostgreSQL. Unsupported backends raise ``NotImplementedError``.
+        through the resolved backend. On PostgreSQL this is a native
+        materialized view; SQLite emulates one with a table built from the
+        select. Indexes in ``__mv_indexes__`` are created on either.
+        Unsupported backends raise ``NotImplementedError``.
 
 
         Examples
@@ -200,10 +217,15 @@ class MaterializedViewMixin:
         ```
         """
         backend = resolve_backend(bind)
-        backend.create_materialized_view(bind, cls.__mv_name__, cls.__mv_select__)
+        backend.create_materialized_view(bind, cls.__mv_name__, cls.__mv_select__, indexes=cls.__mv_indexes__)
 
     @classmethod
-    def refresh_mv(cls, bind: "sa.engine.Connection | sa.engine.Engine") -> None:
+    def refresh_mv(
+        cls,
+        bind: "sa.engine.Connection | sa.engine.Engine",
+        *,
+        concurrently: bool | None = False,
+    ) -> None:
         """
         Refresh the contents of the materialized view.
 
@@ -211,12 +233,16 @@ class MaterializedViewMixin:
         ----------
         bind
             A SQLAlchemy Engine or Connection used to execute the refresh.
+        concurrently
+            Refresh without blocking readers (``REFRESH ... CONCURRENTLY``),
+            which requires a unique index on the view. ``None`` uses a
+            concurrent refresh only when such an index exists.
 
         Notes
         -----
-        This method issues a backend-specific refresh statement. With the
-        built-in backends, materialized views are PostgreSQL-only.
-        Concurrent refresh semantics are not handled here.
+        This method issues a backend-specific refresh statement. SQLite
+        rebuilds the emulated view into a new table and renames it into
+        place in one transaction.
 
         Examples
         --------
@@ -226,9 +252,246 @@ class MaterializedViewMixin:
         ```
         """
         backend = resolve_backend(bind)
-        backend.refresh_materialized_view(bind, cls.__mv_name__)
+        if concurrently is None:
+            concurrently = backend.has_unique_index(bind, cls.__mv_name__)
+        backend.refresh_materialized_view(bind, cls.__mv_name__, concurrently=concurrently)
         
 
+# Held weakly so test-local or discarded view classes drop out once unreferenced.
+_INCREMENTAL_MVS: "weakref.WeakSet[type[IncrementalMaterializedViewMixin]]" = weakref.WeakSet()
+
+
+class IncrementalMaterializedViewMixin(MaterializedViewMixin):
+
+    """
+    `IncrementalMaterializedViewMixin`
+
+    Opt-in incremental maintenance for aggregate-shaped materialized views.
+
+    The view is stored as a regular table named ``__mv_name__`` and kept
+    up to date group by group: after a merge into one of its source
+    tables, only the groups touched by the merged rows are deleted and
+    recomputed from ``__mv_select__``. A full :meth:`refresh_mv` is still
+    available and rebuilds every group.
+
+    Classes using this mixin must additionally define:
+
+    - ``__mv_group_by__``: output columns of ``__mv_select__`` that identify
+      one row of the view (its grouping key)
+    - ``__mv_delta_columns__``: for each source table, the source column
+      that feeds each grouping column
+
+    ``__mv_select__`` must be a plain aggregate over ``__mv_group_by__``;
+    window functions or row numbers across groups cannot be maintained
+    incrementally.
+
+    Examples
+    --------
+    ```python
+    class DailyObservationCountsMV(Base, IncrementalMaterializedViewMixin):
+
+        __mv_name__ = "mv_daily_observation_counts"
+        __mv_select__ = daily_counts_select
+        __mv_group_by__ = ("observation_date", "concept_id")
+        __mv_delta_columns__ = {
+            "observation": {
+                "observation_date": "observation_date",
+                "concept_id": "observation_concept_id",
+            },
+        }
+        __mv_dependencies__ = {"observation"}
+    ```
+
+    ``Observation.load_csv(session, path, incremental_mvs=True)`` then
+    updates the view from the rows it merged.
+    """
+    __mv_group_by__: tuple[str, ...] = ()
+    __mv_delta_columns__: dict[str, dict[str, str]] = {}
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        delta_columns = cls.__dict__.get("__mv_delta_columns__")
+        if not delta_columns:
+            return
+        for source, mapping in delta_columns.items():
+            missing = sorted(set(cls.__mv_group_by__) - set(mapping))
+            if missing:
+                raise ValueError(
+                    f"{cls.__name__}: __mv_delta_columns__['{source}'] does not map group column(s) {missing}"
+                )
+        # A redefinition of the same view over the same tables replaces the earlier one.
+        sources = cls._source_tables()
+        for existing in list(_INCREMENTAL_MVS):
+            if existing.__mv_name__ == cls.__mv_name__ and sources & existing._source_tables():
+                _INCREMENTAL_MVS.discard(existing)
+        _INCREMENTAL_MVS.add(cls)
+
+    @classmethod
+    def _source_tables(cls) -> set[sa.Table]:
+        return {t for t in find_tables(cls.__mv_select__, include_aliases=True) if isinstance(t, sa.Table)}
+
+    @classmethod
+    def _mv_table(cls) -> sa.TableClause:
+        return sa.table(cls.__mv_name__, *[sa.column(c.name) for c in cls.__mv_select__.selected_columns])
+
+    @classmethod
+    def create_mv(cls, bind: "sa.engine.Connection | sa.engine.Engine") -> None:
+        """
+        Create the backing table from ``__mv_select__`` if it does not exist,
+        with a unique index over ``__mv_group_by__`` and any ``__mv_indexes__``.
+        """
+        group_index = ViewIndex(tuple(cls.__mv_group_by__), unique=True, name=f"ux_{cls.__mv_name__}_group")
+        indexes = (group_index, *cls.__mv_indexes__) if cls.__mv_group_by__ else cls.__mv_indexes__
+        with _begin(bind) as conn:
+            preparer = conn.dialect.identifier_preparer
+            compiled = str(cls.__mv_select__.compile(dialect=conn.dialect, compile_kwargs={"literal_binds": True}))
+            # Escape colons so literals such as times are not read as bind parameters.
+            conn.execute(
+                sa.text(
+                    f"CREATE TABLE IF NOT EXISTS {preparer.quote(cls.__mv_name__)} AS "
+                    + compiled.replace(":", "\\:")
+                )
+            )
+            resolve_backend(conn).create_view_indexes(conn, cls.__mv_name__, indexes)
+
+    @classmethod
+    def refresh_mv(
+        cls,
+        bind: "sa.engine.Connection | sa.engine.Engine",
+        *,
+        concurrently: bool | None = False,
+    ) -> None:
+        """
+        Recompute every group in one transaction.
+
+        Parameters
+        ----------
+        bind
+            A SQLAlchemy Engine or Connection used to execute the refresh.
+        concurrently
+            Like ``REFRESH ... CONCURRENTLY``, only rows that differ from
+            ``__mv_select__`` are deleted and inserted, so unchanged rows are
+            never locked or rewritten. ``False`` deletes and reinserts every
+            row. ``None`` refreshes concurrently when the view has a unique
+            index over ``__mv_group_by__``, which :meth:`create_mv` creates.
+        """
+        table = cls._mv_table()
+        if concurrently is None:
+            concurrently = bool(cls.__mv_group_by__)
+        with _begin(bind) as conn:
+            if not concurrently:
+                conn.execute(sa.delete(table))
+                conn.execute(sa.insert(table).from_select(list(table.c.keys()), cls.__mv_select__))
+                return
+            source = cls.__mv_select__.subquery()
+            same_row = sa.and_(*[table.c[name].is_not_distinct_from(source.c[name]) for name in table.c.keys()])
+            conn.execute(sa.delete(table).where(~sa.exists().where(same_row)))
+            conn.execute(
+                sa.insert(table).from_select(
+                    list(table.c.keys()),
+                    sa.select(*source.c).where(~sa.exists().where(same_row).correlate(source)),
+                )
+            )
+
+    @classmethod
+    def _group_predicate(cls, columns: list[Any], groups: list[tuple]) -> Any:
+        plain = [g for g in groups if None not in g]
+        with_nulls = [g for g in groups if None in g]
+        clauses = []
+        if plain:
+            if len(columns) == 1:
+                clauses.append(columns[0].in_([g[0] for g in plain]))
+            else:
+                clauses.append(sa.tuple_(*columns).in_(plain))
+        for group in with_nulls:
+            clauses.append(sa.and_(*[col.is_not_distinct_from(v) for col, v in zip(columns, group)]))
+        return sa.or_(*clauses)
+
+    @classmethod
+    def affected_groups(
+        cls,
+        session: so.Session,
+        source_cls: type,
+        staging_table: sa.Table,
+        *,
+        merge_strategy: str = "replace",
+    ) -> set[tuple] | None:
+        """
+        Return the grouping keys a merge of ``staging_table`` into
+        ``source_cls`` will touch.
+
+        Must be called before the merge: keys are read both from the
+        staged rows and from the target rows they replace, so groups a row
+        moves out of are recomputed as well. With ``sync`` the target rows
+        absent from staging (which the merge deletes) are included.
+        Returns ``None`` when the strategy replaces whole tables or
+        partitions and a full refresh is needed instead.
+        """
+        if merge_strategy in {"swap", "replace_partitions"}:
+            return None
+
+        target = source_cls.__table__
+        mapping = cls.__mv_delta_columns__[target.name]
+        source_cols = [mapping[g] for g in cls.__mv_group_by__]
+        pk_names = [c.name for c in target.primary_key.columns]
+        matches_staging = sa.and_(*[target.c[pk] == staging_table.c[pk] for pk in pk_names])
+
+        queries = [
+            sa.select(*[staging_table.c[c] for c in source_cols]),
+            sa.select(*[target.c[c] for c in source_cols]).where(sa.exists().where(matches_staging)),
+        ]
+        if merge_strategy == "sync":
+            queries.append(
+                sa.select(*[target.c[c] for c in source_cols]).where(~sa.exists().where(matches_staging))
+            )
+        return {tuple(row) for row in session.execute(sa.union(*queries)).all()}
+
+    @classmethod
+    def apply_delta(cls, bind: "sa.engine.Connection | sa.engine.Engine", groups: set[tuple]) -> int:
+        """
+        Delete and recompute the given groups of the view.
+
+        Returns the number of groups processed.
+        """
+        if not groups:
+            return 0
+        table = cls._mv_table()
+        source = cls.__mv_select__.subquery()
+        target_cols = [table.c[g] for g in cls.__mv_group_by__]
+        source_cols = [source.c[g] for g in cls.__mv_group_by__]
+        ordered = list(groups)
+        batch = max(1, _DELTA_PARAM_LIMIT // max(1, len(cls.__mv_group_by__)))
+
+        with _begin(bind) as conn:
+            for start in range(0, len(ordered), batch):
+                chunk = ordered[start:start + batch]
+                conn.execute(sa.delete(table).where(cls._group_predicate(target_cols, chunk)))
+                conn.execute(
+                    sa.insert(table).from_select(
+                        list(table.c.keys()),
+                        sa.select(*source.c).where(cls._group_predicate(source_cols, chunk)),
+                    )
+                )
+        return len(groups)
+
+
+def incremental_views_for(table: sa.Table) -> list[type[IncrementalMaterializedViewMixin]]:
+    """
+    Return the incremental materialized views fed by ``table``.
+
+    A view qualifies when ``__mv_delta_columns__`` maps the table's name and
+    ``__mv_select__`` reads from this very ``Table`` object, so views built
+    over a same-named table in another metadata are not picked up.
+    """
+    return sorted(
+        (
+            view for view in list(_INCREMENTAL_MVS)
+            if table.name in view.__mv_delta_columns__ and table in view._source_tables()
+        ),
+        key=lambda view: view.__mv_name__,
+    )
+
+
 def resolve_mv_refresh_order(mv_classes: list[type[MaterializedViewMixin]]) -> list[type]:
     """
     `resolve_mv_refresh_order`
@@ -278,13 +541,88 @@ def resolve_mv_refresh_order(mv_classes: list[type[MaterializedViewMixin]]) -> l
     return [name_to_mv[name] for name in ordered]
 
 
-def refresh_all_mvs(bind: "sa.engine.Connection | sa.engine.Engine", mv_classes: list[type[MaterializedViewMixin]]) -> None:
+def resolve_mv_refresh_levels(mv_classes: list[type[MaterializedViewMixin]]) -> list[list[type]]:
+    """
+    `resolve_mv_refresh_levels`
+
+    Group materialized views into dependency levels.
+
+    Every view in a level depends only on views in earlier levels, so the
+    views within one level can be refreshed in parallel.
+
+    Raises
+    ------
+    RuntimeError
+        If a dependency cycle is detected.
+    """
+    name_to_mv = {cls.__mv_name__: cls for cls in mv_classes}
+    remaining = {
+        cls.__mv_name__: {dep for dep in cls.__mv_dependencies__ if dep in name_to_mv}
+        for cls in mv_classes
+    }
+
+    levels: list[list[type]] = []
+    done: set[str] = set()
+    while remaining:
+        ready = [name for name, deps in remaining.items() if deps <= done]
+        if not ready:
+            raise RuntimeError(
+                "Cycle detected in materialized view dependencies"
+            )
+        levels.append([name_to_mv[name] for name in ready])
+        done.update(ready)
+        for name in ready:
+            del remaining[name]
+
+    return levels
+
+
+def refresh_all_mvs(
+    bind: "sa.engine.Connection | sa.engine.Engine",
+    mv_classes: list[type[MaterializedViewMixin]],
+    *,
+    workers: int = 1,
+    concurrently: bool | None = False,
+    skip_fresh: bool = False,
+) -> dict[str, float]:
 
     """
     `refresh_all_mvs`
     
     Handle refreshing multiple materialized views in dependency order.
 
+    Views are refreshed level by level (see `resolve_mv_refresh_levels`).
+    With ``workers > 1`` and an Engine bind, the views within a level are
+    refreshed in parallel, each on its own pooled connection, so the total
+    time approaches the critical path of the dependency graph. A level
+    only starts once every view in the previous level has been refreshed;
+    a failure stops the remaining levels.
+
+    Parameters
+    ----------
+    bind
+        A SQLAlchemy Engine or Connection. A Connection is always refreshed
+        serially.
+    mv_classes
+        Materialized view classes to refresh.
+    workers
+        Maximum number of views refreshed at once within a level.
+    concurrently
+        Passed to `MaterializedViewMixin.refresh_mv`; ``None`` refreshes
+        concurrently wherever the view has a unique index.
+    skip_fresh
+        Skip views whose ``__mv_dependencies__`` have not changed since the
+        view was last refreshed, using the change counters bumped by
+        ``load_csv(track_changes=True)``. Refreshing a view bumps its own
+        counter, so staleness propagates to the views that depend on it.
+        Views without dependencies, or with a dependency whose counter has
+        never been bumped, are always refreshed.
+
+    Returns
+    -------
+    dict[str, float]
+        Refresh time in seconds per refreshed view.
+
     Examples
     --------
     ```python
@@ -293,10 +631,51 @@ def refresh_all_mvs(bind: "sa.engine.Connection | sa.engine.Engine", mv_classes:
             DailyObservationCountsMV,
         ]
 
-        refresh_all_mvs(engine, ALL_MVS)
+        refresh_all_mvs(engine, ALL_MVS, workers=4)
     ```
     """
-    ordered: list[type[MaterializedViewMixin]] = resolve_mv_refresh_order(mv_classes)  # ty: ignore[invalid-assignment]
+    levels: list[list[type[MaterializedViewMixin]]] = resolve_mv_refresh_levels(mv_classes)  # ty: ignore[invalid-assignment]
+    parallel = workers > 1 and isinstance(bind, sa.Engine) and not bind.dialect.is_async
+    timings: dict[str, float] = {}
+    if skip_fresh:
+        ensure_tracking_tables(bind)
+
+    def _refresh(mv: type[MaterializedViewMixin]) -> float:
+        started = perf_counter()
+        # Inputs are read before the refresh, so a load that lands while it
+        # runs leaves the view stale for the next run rather than skipped.
+        inputs = table_versions(bind, mv.__mv_dependencies__) if skip_fresh else {}
+        mv.refresh_mv(bind, concurrently=concurrently)
+        if skip_fresh:
+            record_refresh(bind, mv.__mv_name__, inputs)
+        return perf_counter() - started
+
+    for depth, level in enumerate(levels):
+        level_started = perf_counter()
+        if skip_fresh:
+            stale = [
+                mv for mv in level
+                if not is_fresh(table_versions(bind, mv.__mv_dependencies__), mv_watermarks(bind, mv.__mv_name__))
+            ]
+            for mv in level:
+                if mv not in stale:
+                    logger.info(f"Materialized view `{mv.__mv_name__}`: Inputs unchanged; skipping refresh.")
+            level = stale
+
+        if parallel and len(level) > 1:
+            with ThreadPoolExecutor(max_workers=min(workers, len(level)), thread_name_prefix="mv-refresh") as pool:
+                futures = {pool.submit(_refresh, mv): mv for mv in level}
+                for future in as_completed(futures):
+                    timings[futures[future].__mv_name__] = future.result()
+        else:
+            for mv in level:
+                timings[mv.__mv_name__] = _refresh(mv)
+
+        for mv in level:
+            logger.info(f"Materialized view `{mv.__mv_name__}`: Refreshed in {timings[mv.__mv_name__]:.2f}s.")
+        logger.info(
+            f"Refreshed materialized view level {depth} ({len(level)} views) in "
+            f"{perf_counter() - level_started:.2f}s."
+        )
 
-    for mv in ordered:
-        mv.refresh_mv(bind)
+    return timings
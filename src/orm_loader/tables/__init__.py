@@ -1,14 +1,18 @@
-from .allocators import IdAllocator
+from .allocators import BlockIdAllocator, IdAllocator
 from .loadable_table import CSVLoadableTableInterface
-from .orm_table import ORMTableBase
+from .orm_table import ORMTableBase, TableShape
 from .serialisable_table import SerialisableTableInterface
+from .staging_pool import StagingTablePool
 from .typing import ORMTableProtocol, CSVTableProtocol
 
 __all__ = [
     "ORMTableBase",
+    "TableShape",
     "CSVLoadableTableInterface",
     "SerialisableTableInterface",
     "IdAllocator",
+    "BlockIdAllocator",
+    "StagingTablePool",
     "ORMTableProtocol",
     "CSVTableProtocol",
 ]
\ No newline at end of file
@@ -4,18 +4,29 @@ import sqlalchemy.orm as so
 import logging
 from sqlalchemy.exc import InvalidRequestError, UnboundExecutionError
 
-from typing import Type, Any, Iterator
+from typing import Type, Any, Iterator, TYPE_CHECKING
 from pathlib import Path
 from contextlib import contextmanager
 from time import perf_counter
 
 from .orm_table import ORMTableBase
 from .typing import CSVTableProtocol
+from ..backends.base import BucketFingerprint, IndexCostModel
+from ..helpers.errors import IngestError
+from .staging_pool import StagingTablePool
+from .allocators import IdAllocator, BlockIdAllocator
+from ..mappers.materialised_view_mixin import IncrementalMaterializedViewMixin, incremental_views_for
+from ..mappers.change_tracking import bump_table_version, record_refresh
 from ..backends.resolve import resolve_backend
 from ..loaders.loader_interface import LoaderInterface, LoaderContext, PandasLoader, ParquetLoader
 
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
+
 logger = logging.getLogger(__name__)
 
+_FK_VALIDATION_MODES = {None, "anti_join", "revalidate"}
+
 
 def _format_elapsed(seconds: float) -> str:
     """Return a compact, human-readable duration for phase logging."""
@@ -66,6 +77,15 @@ class CSVLoadableTableInterface(ORMTableBase):
 
     __abstract__ = True
 
+    #: Optional name of a nullable text column holding a SQL-computed hash
+    #: of the row's content. When set, staging rows are hashed during merge
+    #: so incoming data can be classified against the target in SQL.
+    __row_hash_column__: str | None = None
+
+    #: Optional per-table cost model for ``index_strategy="auto"``; ``None``
+    #: uses the :class:`~orm_loader.backends.IndexCostModel` defaults.
+    __index_cost_model__: IndexCostModel | None = None
+
     @classmethod
     def create_staging_table(
         cls: Type[CSVTableProtocol],
@@ -106,6 +126,10 @@ class CSVLoadableTableInterface(ORMTableBase):
         index_strategy: str = "auto",
         *,
         staging_schema: str | None = None,
+        rebuild_workers: int = 1,
+        maintenance_work_mem: str | None = None,
+        max_parallel_maintenance_workers: int | None = None,
+        staging_rows: int | None = None,
     ) -> Iterator[None]:
         """
         Manage non-primary-key indexes around a staged merge.
@@ -113,10 +137,24 @@ class CSVLoadableTableInterface(ORMTableBase):
         ``index_strategy`` may be ``"auto"``, ``"drop_rebuild"``, or
         ``"keep"``. The backend decides what ``"auto"`` means. At the
         moment SQLite keeps indexes by default, while PostgreSQL drops
-        and rebuilds them.
+        and rebuilds them. When ``staging_rows`` is given, ``"auto"``
+        instead weighs it against the target's estimated size using the
+        table's ``__index_cost_model__``.
+
+        ``rebuild_workers`` sets how many indexes are rebuilt at once on
+        separate pooled connections (PostgreSQL only).
+        ``maintenance_work_mem`` (e.g. ``"2GB"``) and
+        ``max_parallel_maintenance_workers`` are applied to each rebuild
+        transaction where the backend supports them.
         """
         backend = resolve_backend(session, staging_schema=staging_schema)
-        resolved_index_strategy = backend.resolve_index_strategy(index_strategy)
+        resolved_index_strategy = backend.resolve_index_strategy(
+            index_strategy,
+            table_cls=cls,
+            session=session,
+            staging_rows=staging_rows,
+            cost_model=getattr(cls, "__index_cost_model__", None),
+        )
         table_name = cls.__tablename__
 
         indices = list(cls.__table__.indexes) if resolved_index_strategy == "drop_rebuild" else []
@@ -181,34 +219,114 @@ class CSVLoadableTableInterface(ORMTableBase):
                 rebuild_started = perf_counter()
                 inspector.clear_cache() # Required to ensure we get the current state of the database after potential changes
                 existing_idx_names = {idx['name'] for idx in inspector.get_indexes(table_name)}
-               
                 for idx in indices:
-                    if idx.name not in existing_idx_names:
-                        try:
-                            logger.info(f"Table `{table_name}`: Restoring missing index: {idx.name}")
-                            create_started = perf_counter()
-                            session.execute(sa.schema.CreateIndex(idx))
-                            logger.info(
-                                f"Table `{table_name}`: Restored missing index `{idx.name}` in "
-                                f"{_format_elapsed(perf_counter() - create_started)}."
-                            )
-                            logger.info(f"Table `{table_name}`: Committing restored index `{idx.name}`.")
-                            commit_started = perf_counter()
-                            session.commit()
-                            logger.info(
-                                f"Table `{table_name}`: Commit after restoring index `{idx.name}` "
-                                f"completed in {_format_elapsed(perf_counter() - commit_started)}."
-                           )
-                        except Exception as e:
-                            session.rollback()
-                            logger.error(f"Table `{table_name}`: Failed to restore {idx.name}: {e}")
-                    else:
+                    if idx.name in existing_idx_names:
                         logger.debug(f"Table `{table_name}`: Index {idx.name} already exists on disk. Skipping.")
+                missing = [idx for idx in indices if idx.name not in existing_idx_names]
+                cls._rebuild_indices(
+                    session,
+                    missing,
+                    rebuild_workers=rebuild_workers,
+                    maintenance_work_mem=maintenance_work_mem,
+                    max_parallel_maintenance_workers=max_parallel_maintenance_workers,
+                    staging_schema=staging_schema,
+                )
                 logger.info(
                     f"Table `{table_name}`: Index verification/rebuild completed in "
                     f"{_format_elapsed(perf_counter() - rebuild_started)}."
                 )
 
+    @classmethod
+    def _rebuild_indices(
+        cls: Type['CSVTableProtocol'],
+        session: so.Session,
+        indices: list[sa.Index],
+        *,
+        rebuild_workers: int = 1,
+        maintenance_work_mem: str | None = None,
+        max_parallel_maintenance_workers: int | None = None,
+        staging_schema: str | None = None,
+    ) -> dict[str, float]:
+        """
+        Create the given indexes, concurrently where the backend allows it.
+
+        With ``rebuild_workers > 1`` on a backend that supports concurrent
+        index builds and an engine-bound session, each ``CREATE INDEX`` runs
+        in its own transaction on a separate pooled connection. Otherwise
+        indexes are created one at a time on the session. Failures are
+        logged and do not stop the remaining builds.
+
+        Returns
+        -------
+        dict[str, float]
+            Build time in seconds per successfully created index.
+        """
+        table_name = cls.__tablename__
+        backend = resolve_backend(session, staging_schema=staging_schema)
+        build_settings = {
+            "maintenance_work_mem": maintenance_work_mem,
+            "max_parallel_maintenance_workers": max_parallel_maintenance_workers,
+        }
+        timings: dict[str, float] = {}
+        bind = _require_bind(session)
+
+        # Worker threads cannot drive an async dialect (they run outside the
+        # greenlet), so async engines rebuild sequentially.
+        if rebuild_workers > 1 and len(indices) > 1 and isinstance(bind, sa.Engine) \
+                and not bind.dialect.is_async and backend.capabilities.supports_concurrent_index_build:
+            from concurrent.futures import ThreadPoolExecutor, as_completed
+
+            def _build(idx: sa.Index) -> float:
+                with bind.connect() as conn:
+                    backend.configure_index_build(conn, **build_settings)
+                    started = perf_counter()
+                    conn.execute(sa.schema.CreateIndex(idx))
+                    conn.commit()
+                    return perf_counter() - started
+
+            workers = min(rebuild_workers, len(indices))
+            logger.info(
+                f"Table `{table_name}`: Restoring {len(indices)} missing indices on {workers} connections."
+            )
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix=f"rebuild-{table_name}") as pool:
+                futures = {pool.submit(_build, idx): idx for idx in indices}
+                for future in as_completed(futures):
+                    idx = futures[future]
+                    try:
+                        timings[str(idx.name)] = future.result()
+                    except Exception as e:
+                        logger.error(f"Table `{table_name}`: Failed to restore {idx.name}: {e}")
+                        continue
+                    logger.info(
+                        f"Table `{table_name}`: Restored missing index `{idx.name}` in "
+                        f"{_format_elapsed(timings[str(idx.name)])}."
+                    )
+            return timings
+
+        for idx in indices:
+            try:
+                logger.info(f"Table `{table_name}`: Restoring missing index: {idx.name}")
+                backend.configure_index_build(session.connection(), **build_settings)
+                create_started = perf_counter()
+                session.execute(sa.schema.CreateIndex(idx))
+                timings[str(idx.name)] = perf_counter() - create_started
+                logger.info(
+                    f"Table `{table_name}`: Restored missing index `{idx.name}` in "
+                    f"{_format_elapsed(timings[str(idx.name)])}."
+                )
+                logger.info(f"Table `{table_name}`: Committing restored index `{idx.name}`.")
+                commit_started = perf_counter()
+                session.commit()
+                logger.info(
+                    f"Table `{table_name}`: Commit after restoring index `{idx.name}` "
+                    f"completed in {_format_elapsed(perf_counter() - commit_started)}."
+                )
+            except Exception as e:
+                session.rollback()
+                timings.pop(str(idx.name), None)
+                logger.error(f"Table `{table_name}`: Failed to restore {idx.name}: {e}")
+        return timings
+
 
     @classmethod
     def get_staging_table(
@@ -218,7 +336,11 @@ class CSVLoadableTableInterface(ORMTableBase):
         staging_schema: str | None = None,
     ) -> sa.Table:
         """
-        Return the reflected staging table, creating it if necessary.
+        Return the staging table definition.
+
+        The table is built from the model's columns and memoised per
+        backend and schema; no catalog queries are issued and the table is
+        not created. :meth:`load_staging` creates it before loading.
 
         Parameters
         ----------
@@ -231,29 +353,19 @@ class CSVLoadableTableInterface(ORMTableBase):
         Returns
         -------
         sqlalchemy.Table
-            The reflected staging table.
+            The staging table.
         """
-        engine = _require_bind(session)
+        _require_bind(session)
         backend = resolve_backend(session, staging_schema=staging_schema)
-        inspector = sa.inspect(engine)
-        staging_name = backend.staging_name_for_table(cls.__tablename__)
-
-        if not inspector.has_table(staging_name, schema=backend.staging_schema):
-            logger.debug(f"Staging table {staging_name} does not exist; recreating",)
-            cls.create_staging_table(session, staging_schema=staging_schema)
-
-        return sa.Table(
-            staging_name,
-            sa.MetaData(),  # throwaway — keeps staging table out of Base.metadata
-            autoload_with=engine,
-            schema=backend.staging_schema,
-        )
+        return backend.staging_table_for(cls)
 
     @classmethod
     def load_staging(
         cls: Type[CSVTableProtocol],
         loader: LoaderInterface,
         loader_context: LoaderContext,
+        *,
+        create_staging: bool = True,
     ) -> int:
         """
         Load data into the staging table.
@@ -267,6 +379,9 @@ class CSVLoadableTableInterface(ORMTableBase):
             Loader implementation used for ORM-based loading.
         loader_context
             Context object containing session, path, and load options.
+        create_staging
+            Re-create the staging table before loading. Pass ``False`` when
+            ``loader_context.staging_table`` is an already-empty pooled table.
 
         Returns
         -------
@@ -278,21 +393,43 @@ class CSVLoadableTableInterface(ORMTableBase):
         backend = resolve_backend(loader_context.session, staging_schema=loader_context.staging_schema)
         total = 0
 
-        cls.create_staging_table(loader_context.session, staging_schema=loader_context.staging_schema)
+        if create_staging:
+            cls.create_staging_table(loader_context.session, staging_schema=loader_context.staging_schema)
+
+        id_column = loader_context.id_column
+        if id_column and (loader_context.id_allocator is not None or loader_context.id_sequence):
+            backend.prepare_staging_ids(cls, loader_context.session, id_column)
 
+        fast_loaded = False
         try:
-            total = backend.load_staging_fast(loader_context=loader_context)
-            if total is not None:
-                return total
+            fast_total = backend.load_staging_fast(loader_context=loader_context)
+            if fast_total is not None:
+                total, fast_loaded = fast_total, True
         except Exception as e:
             loader_context.session.rollback()
             logger.warning(f"Fast-path load failed for {cls.__tablename__}: {e}")
             logger.info('Falling back to ORM-based load functionality')
 
-        total = cls.orm_staging_load(
-            loader=loader,
-            loader_context=loader_context
-        )
+        if not fast_loaded:
+            total = cls.orm_staging_load(
+                loader=loader,
+                loader_context=loader_context
+            )
+        elif id_column and loader_context.id_allocator is not None:
+            # COPY bypasses the loaders, so missing keys are filled in staging instead.
+            assigned = backend.fill_staging_ids(
+                cls, loader_context.session, id_column, allocator=loader_context.id_allocator
+            )
+            logger.info(f"Table `{cls.__tablename__}`: Assigned {assigned} surrogate keys in staging.")
+
+        if id_column and loader_context.id_sequence:
+            assigned = backend.fill_staging_ids(
+                cls, loader_context.session, id_column, sequence=loader_context.id_sequence
+            )
+            logger.info(
+                f"Table `{cls.__tablename__}`: Assigned {assigned} surrogate keys from sequence "
+                f"{loader_context.id_sequence}."
+            )
         return total
 
     @classmethod
@@ -304,12 +441,17 @@ class CSVLoadableTableInterface(ORMTableBase):
         """
         Load data into the staging table using an ORM-based loader.
 
+        The chunk sizes chosen for the load are recorded on
+        ``loader.chunk_sizing``, since ``loader_context`` is not returned.
+
         Returns
         -------
         int
             Number of rows loaded.
         """
-        return loader.orm_file_load(ctx=loader_context)
+        total = loader.orm_file_load(ctx=loader_context)
+        loader.chunk_sizing = loader_context.chunk_sizing
+        return total
 
     @classmethod
     def _select_loader(cls: Type[CSVTableProtocol], path: Path) -> LoaderInterface:
@@ -348,6 +490,22 @@ class CSVLoadableTableInterface(ORMTableBase):
         index_strategy: str = "auto",
         merge_batch_size: int | None = None,
         staging_schema: str | None = None,
+        rebuild_workers: int = 1,
+        maintenance_work_mem: str | None = None,
+        max_parallel_maintenance_workers: int | None = None,
+        fk_validation: str | None = None,
+        fk_validation_workers: int = 1,
+        reuse_staging: bool = False,
+        id_column: str | None = None,
+        id_allocator: IdAllocator | BlockIdAllocator | None = None,
+        id_sequence: str | None = None,
+        incremental_mvs: bool = False,
+        track_changes: bool = False,
+        pipeline_depth: int = 0,
+        pipeline_memory_mb: float | None = None,
+        cast_workers: int = 1,
+        memory_budget_mb: float | None = None,
+        allow_empty: bool = False,
     ) -> int:
 
         """
@@ -374,18 +532,99 @@ class CSVLoadableTableInterface(ORMTableBase):
         chunksize
             Optional chunk size for incremental loading.
         merge_strategy
-            Merge strategy to apply (e.g. ``replace``, ``upsert``, or
-            ``insert_if_empty``).
+            Merge strategy to apply (e.g. ``replace``, ``upsert``,
+            ``sync``, or ``insert_if_empty``). Use ``sync`` for full
+            snapshots: rows missing from the file are deleted and only
+            changed rows are rewritten. ``swap`` (PostgreSQL) builds a new
+            indexed copy of the table from the file and renames it into
+            place, which avoids the delete/insert bloat of a full reload.
+            ``replace_partitions`` (partitioned PostgreSQL tables) does the
+            same per affected partition via ``ATTACH PARTITION``.
+            ``replace`` on a partitioned table deletes per partition.
         quote_mode
             Quoting mode used by the PostgreSQL fast-path loader.
         index_strategy
             Index handling strategy during merge. Use ``"auto"`` to let
-            the backend choose a sensible default.
+            the backend choose from the staged row count, the target's
+            estimated size and ``__index_cost_model__``. Ignored for ``swap``,
+            which builds indexes on the new table itself.
         staging_schema
             Schema the staging table lives in. ``None`` means no schema
             qualification (backend-default behavior). Threaded through
             every internal step of the load lifecycle so they all resolve
             the same backend/schema.
+        rebuild_workers
+            Number of dropped indexes to rebuild concurrently after the
+            merge, each on its own pooled connection (PostgreSQL only).
+        maintenance_work_mem
+            ``maintenance_work_mem`` for each index rebuild, e.g. ``"2GB"``.
+        max_parallel_maintenance_workers
+            ``max_parallel_maintenance_workers`` for each index rebuild.
+        fk_validation
+            How to check foreign keys that were not enforced during the
+            merge. ``None`` skips the check. ``"anti_join"`` counts orphaned
+            references among the merged rows before commit and rolls the
+            merge back if any are found; it is rejected together with
+            ``merge_batch_size``, ``swap`` or ``replace_partitions``, which
+            commit part-way through the merge. ``"revalidate"`` (PostgreSQL)
+            re-adds each FK as ``NOT VALID`` after commit and validates it
+            without blocking concurrent writes.
+        fk_validation_workers
+            Number of constraints validated concurrently with
+            ``fk_validation="revalidate"``.
+        reuse_staging
+            Keep the staging table between loads and empty it with
+            ``TRUNCATE`` (``DELETE`` on SQLite) instead of dropping and
+            re-creating it. The staging table is cached per engine and
+            re-created automatically when the model's columns change.
+            Worth enabling when loading many small files.
+        id_column
+            Surrogate key column filled for rows that arrive without one.
+            Defaults to the single primary key column.
+        id_allocator
+            Allocator that fills missing keys. Each loader batch reserves
+            one block and assigns it with an ``arange``; rows loaded by
+            PostgreSQL ``COPY`` are numbered in staging with a single
+            ``UPDATE``. Existing keys are kept.
+        id_sequence
+            Name of a PostgreSQL sequence used instead of an allocator;
+            missing keys are set with ``nextval`` in one ``UPDATE`` over the
+            staging table before the merge.
+        incremental_mvs
+            Update every :class:`IncrementalMaterializedViewMixin` view fed
+            by this table after the merge, recomputing only the groups the
+            merged rows touch.
+        track_changes
+            Bump this table's change counter in ``_orm_loader_table_versions``
+            when the merge modifies rows, so ``refresh_all_mvs(...,
+            skip_fresh=True)`` can skip views whose inputs are unchanged.
+            ``sync`` and hashed ``replace`` merges count the rows they
+            actually changed, so reloading an unchanged file does not bump
+            the counter; other strategies bump whenever rows were staged.
+        pipeline_depth
+            Prepare up to this many chunks ahead on a background thread
+            while the current one is written, so parsing and casting
+            overlap with inserts. ``0`` keeps the sequential loader. Has no
+            effect on the PostgreSQL ``COPY`` fast path.
+        pipeline_memory_mb
+            Pause the background thread while prepared chunks in flight
+            exceed this many MiB.
+        cast_workers
+            Cast chunks on this many worker processes. Workers are not
+            forked, so the table class and column cast rules must be
+            picklable (module-level, not lambdas). Only useful with
+            ``chunksize`` set, so there are several chunks to spread.
+        memory_budget_mb
+            Size chunks to fit this many MiB while each is cast and
+            written. The loader measures bytes per row on the first rows
+            of the file and derives the rows per chunk (and, for the
+            PyArrow CSV reader, the read block size); ``chunksize`` then
+            acts as an upper bound. Useful for wide tables with free text.
+            The chosen sizes are left on ``loader.chunk_sizing``.
+        allow_empty
+            With ``merge_strategy="sync"``, accept a file with no rows and
+            empty the target. By default an empty file raises
+            ``IngestError`` instead of deleting every row.
 
         Returns
         -------
@@ -420,40 +659,203 @@ class CSVLoadableTableInterface(ORMTableBase):
                     f"'insert_if_empty'"
                 )
 
+        if fk_validation not in _FK_VALIDATION_MODES:
+            raise ValueError(
+                f"Unknown fk_validation '{fk_validation}'; expected one of "
+                f"{sorted(m for m in _FK_VALIDATION_MODES if m)}"
+            )
+        if fk_validation == "anti_join" and (
+            merge_batch_size is not None or merge_strategy in {"swap", "replace_partitions"}
+        ):
+            # These merges commit part-way, so a failed check could no longer undo them.
+            raise ValueError(
+                f"Table `{cls.__tablename__}`: fk_validation='anti_join' cannot be combined with "
+                f"merge_batch_size or merge strategy '{merge_strategy}' because the merge commits "
+                "before the check runs; use fk_validation='revalidate' instead"
+            )
+
+        if pipeline_depth < 0:
+            raise ValueError(f"pipeline_depth must be non-negative, got {pipeline_depth}")
+        if cast_workers < 1:
+            raise ValueError(f"cast_workers must be at least 1, got {cast_workers}")
+        if memory_budget_mb is not None and memory_budget_mb <= 0:
+            raise ValueError(f"memory_budget_mb must be positive, got {memory_budget_mb}")
+
+        if id_allocator is not None and id_sequence is not None:
+            raise ValueError("id_allocator and id_sequence are mutually exclusive")
+        if id_allocator is not None or id_sequence is not None:
+            id_column = cls._resolve_id_column(id_column)
+            if id_sequence is not None:
+                backend = resolve_backend(session, staging_schema=staging_schema)
+                if not backend.capabilities.supports_staging_id_fill:
+                    raise NotImplementedError(
+                        f"Backend '{backend.name}' does not support sequence-based key assignment"
+                    )
+
+        staging_pool: StagingTablePool | None = None
+        if reuse_staging:
+            staging_pool = StagingTablePool.for_bind(_require_bind(session))
+            staging_table = staging_pool.acquire(
+                cls, session, resolve_backend(session, staging_schema=staging_schema)
+            )
+        else:
+            staging_table = cls.get_staging_table(session, staging_schema=staging_schema)
+
         loader_context = LoaderContext(
             tableclass=cls,
             session=session,
             path=path,
-            staging_table=cls.get_staging_table(session, staging_schema=staging_schema),
+            staging_table=staging_table,
             chunksize=chunksize,
             normalise=normalise,
             dedupe=dedupe,
             quote_mode=quote_mode,
             staging_schema=staging_schema,
+            id_allocator=id_allocator,
+            id_column=id_column if id_allocator is not None or id_sequence is not None else None,
+            id_sequence=id_sequence,
+            offload_parsing=_require_bind(session).dialect.is_async,
+            pipeline_depth=pipeline_depth,
+            pipeline_memory_mb=pipeline_memory_mb,
+            cast_workers=cast_workers,
+            memory_budget_mb=memory_budget_mb,
         )
 
         if loader is None:
             loader = cls._select_loader(path)
 
+        if merge_strategy in {"swap", "replace_partitions"}:
+            # Replaced tables are built with their indexes, so dropping them first is wasted work.
+            index_strategy = "keep"
+
         # Load to staging (Indices are already excluded via updated create_staging_table)
         logger.info(f"Table `{cls.__tablename__}`: Loading data into staging table")
-        total = cls.load_staging(loader=loader, loader_context=loader_context)
+        total = cls.load_staging(
+            loader=loader, loader_context=loader_context, create_staging=staging_pool is None
+        )
+
+        mv_deltas: list[tuple[type[IncrementalMaterializedViewMixin], set[tuple] | None]] = []
+        if incremental_mvs:
+            for view in incremental_views_for(cls.__table__):
+                mv_deltas.append(
+                    (view, view.affected_groups(session, cls, staging_table, merge_strategy=merge_strategy))
+                )
 
         # Merge staging to target (Wrapped in our index dropper!)
         logger.info(f"Table `{cls.__tablename__}`: Merging staging data into target table")
-        with cls.manage_indices(session, index_strategy=index_strategy, staging_schema=staging_schema):
-            cls.merge_from_staging(
+        with cls.manage_indices(
+            session,
+            index_strategy=index_strategy,
+            staging_schema=staging_schema,
+            rebuild_workers=rebuild_workers,
+            maintenance_work_mem=maintenance_work_mem,
+            max_parallel_maintenance_workers=max_parallel_maintenance_workers,
+            staging_rows=total,
+        ):
+            counts = cls.merge_from_staging(
                 session,
                 merge_strategy=merge_strategy,
                 merge_batch_size=merge_batch_size,
                 staging_schema=staging_schema,
+                allow_empty=allow_empty,
             )
+            if fk_validation == "anti_join":
+                cls.validate_foreign_keys(session, staging_schema=staging_schema)
+
+        version: int | None = None
+        # Without per-row counts, any staged row may have changed the target.
+        changed = sum(counts.values()) if counts is not None else total
+        if track_changes and changed:
+            version = bump_table_version(session.connection(), cls.__tablename__)
+            session.commit()
+            logger.info(f"Table `{cls.__tablename__}`: Change counter bumped to {version}.")
+
+        for view, groups in mv_deltas:
+            delta_started = perf_counter()
+            if groups is None:
+                view.refresh_mv(session.connection())
+            else:
+                view.apply_delta(session.connection(), groups)
+            if version is not None:
+                record_refresh(session.connection(), view.__mv_name__, {cls.__tablename__: version})
+            session.commit()
+            logger.info(
+                f"Table `{cls.__tablename__}`: Updated materialized view `{view.__mv_name__}` "
+                f"({'full refresh' if groups is None else f'{len(groups)} groups'}) in "
+                f"{_format_elapsed(perf_counter() - delta_started)}."
+            )
+
+        if staging_pool is not None:
+            staging_pool.release(cls, session, resolve_backend(session, staging_schema=staging_schema))
+        else:
+            cls.drop_staging_table(session, staging_schema=staging_schema)
 
-        cls.drop_staging_table(session, staging_schema=staging_schema)
+        if fk_validation == "revalidate":
+            logger.info(f"Table `{cls.__tablename__}`: Revalidating foreign keys.")
+            validate_started = perf_counter()
+            resolve_backend(session, staging_schema=staging_schema).revalidate_foreign_keys(
+                session, cls.__tablename__, workers=fk_validation_workers
+            )
+            logger.info(
+                f"Table `{cls.__tablename__}`: Foreign key revalidation completed in "
+                f"{_format_elapsed(perf_counter() - validate_started)}."
+            )
 
         logger.info(f"Table `{cls.__tablename__}`: Successfully finished ingestion. Total rows: {total}")
         return total
-        
+
+    @classmethod
+    async def load_csv_async(
+        cls: Type[CSVTableProtocol],
+        session: "AsyncSession",
+        path: Path,
+        **kwargs: Any,
+    ) -> int:
+        """
+        Awaitable ``load_csv`` for an ``AsyncSession``.
+
+        The lifecycle runs through ``AsyncSession.run_sync``, so every
+        statement is awaited on the async driver rather than blocking the
+        event loop. File parsing, casting and dedupe run on a worker
+        thread, and the PostgreSQL fast path streams through psycopg's
+        async ``COPY``. Concurrent index rebuilds, foreign key validation
+        and view refreshes fall back to running sequentially, since worker
+        threads cannot drive an async connection.
+
+        Parameters
+        ----------
+        session
+            An active ``AsyncSession`` (requires the ``async`` extra).
+        path
+            Path to the input CSV or Parquet file.
+        **kwargs
+            Keyword arguments forwarded to ``load_csv``.
+
+        Returns
+        -------
+        int
+            Number of rows loaded into staging.
+        """
+        return await session.run_sync(lambda sync_session: cls.load_csv(sync_session, path, **kwargs))
+
+
+    @classmethod
+    def _resolve_id_column(cls: Type[CSVTableProtocol], id_column: str | None) -> str:
+        """
+        Return the column that receives surrogate keys, defaulting to the
+        single primary key column.
+        """
+        if id_column is None:
+            pk_names = cls.pk_names()
+            if len(pk_names) != 1:
+                raise ValueError(
+                    f"Table `{cls.__tablename__}` has a composite primary key {pk_names}; "
+                    f"pass id_column explicitly"
+                )
+            return pk_names[0]
+        if id_column not in cls.model_columns():
+            raise ValueError(f"Table `{cls.__tablename__}` has no column '{id_column}'")
+        return id_column
 
     @classmethod
     def _target_has_rows(
@@ -485,7 +887,8 @@ class CSVLoadableTableInterface(ORMTableBase):
         *,
         merge_batch_size: int | None = None,
         staging_schema: str | None = None,
-    ):
+        allow_empty: bool = False,
+    ) -> dict[str, int] | None:
         """
         Merge data from the staging table into the target table.
 
@@ -495,18 +898,40 @@ class CSVLoadableTableInterface(ORMTableBase):
             An active SQLAlchemy session.
         merge_strategy
             Merge strategy to apply (for example ``replace``,
-            ``upsert``, or ``insert_if_empty``).
+            ``upsert``, ``sync``, ``swap``, ``replace_partitions``, or
+            ``insert_if_empty``). ``sync`` also deletes target rows that
+            are absent from staging; ``swap`` replaces the whole table via
+            rename and ``replace_partitions`` rebuilds only the partitions
+            staging rows fall into, where supported.
+        merge_batch_size
+            Optional batch size for paginated merges. For ``sync`` this is
+            the number of staged keys per page.
         staging_schema
             Schema the staging table lives in. ``None`` means no schema
             qualification (backend-default behavior).
+        allow_empty
+            Let ``sync`` run with an empty staging table, deleting every
+            target row. Otherwise an empty staging table raises
+            ``IngestError``.
+
+        Returns
+        -------
+        dict[str, int] | None
+            ``deleted``/``updated``/``inserted`` row counts for merges that
+            compare rows (``sync``, and ``replace`` on tables with a row
+            hash); ``None`` when the strategy does not tell which rows
+            changed.
         """
         target = cls.__tablename__
         pk_cols = cls.pk_names()
 
         _require_bind(session)
         backend = resolve_backend(session, staging_schema=staging_schema)
+        # Hashes are computed inside the merge statements; staging is never rewritten.
+        hashed = backend.row_hash_column(cls) is not None
         target_empty_confirmed = False
-        if merge_strategy in {"replace", "upsert"}:
+        counts: dict[str, int] | None = None
+        if merge_strategy in {"replace", "upsert", "sync"}:
             logger.info(
                 f"Table `{target}`: Checking whether target table is empty for merge optimisation."
             )
@@ -527,7 +952,19 @@ class CSVLoadableTableInterface(ORMTableBase):
                 target_empty_confirmed = True
                 merge_strategy = "insert_if_empty"
 
-        if merge_strategy == "replace":
+        if merge_strategy == "replace" and hashed:
+            # With row hashes, replacing matching rows only needs to touch the changed ones.
+            logger.info(f"Table `{target}`: Merge replace of changed rows starting.")
+            replace_started = perf_counter()
+            counts = backend.merge_sync(
+                cls, session, target, pk_cols, merge_batch_size=merge_batch_size, delete_missing=False
+            )
+            logger.info(
+                f"Table `{target}`: Merge replace of changed rows completed in "
+                f"{_format_elapsed(perf_counter() - replace_started)} "
+                f"(updated={counts['updated']}, inserted={counts['inserted']})."
+            )
+        elif merge_strategy == "replace":
             logger.info(f"Table `{target}`: Merge replace delete phase starting.")
             delete_started = perf_counter()
             backend.merge_replace(cls, session, target, pk_cols, merge_batch_size=merge_batch_size)
@@ -550,6 +987,33 @@ class CSVLoadableTableInterface(ORMTableBase):
                 f"Table `{target}`: Merge upsert phase completed in "
                 f"{_format_elapsed(perf_counter() - upsert_started)}."
             )
+        elif merge_strategy == "sync":
+            logger.info(f"Table `{target}`: Merge sync phase starting.")
+            sync_started = perf_counter()
+            counts = backend.merge_sync(
+                cls, session, target, pk_cols, merge_batch_size=merge_batch_size, allow_empty=allow_empty
+            )
+            logger.info(
+                f"Table `{target}`: Merge sync phase completed in "
+                f"{_format_elapsed(perf_counter() - sync_started)} "
+                f"(deleted={counts['deleted']}, updated={counts['updated']}, inserted={counts['inserted']})."
+            )
+        elif merge_strategy == "swap":
+            logger.info(f"Table `{target}`: Merge swap phase starting.")
+            swap_started = perf_counter()
+            backend.merge_swap(cls, session, target, pk_cols, merge_batch_size=merge_batch_size)
+            logger.info(
+                f"Table `{target}`: Merge swap phase completed in "
+                f"{_format_elapsed(perf_counter() - swap_started)}."
+            )
+        elif merge_strategy == "replace_partitions":
+            logger.info(f"Table `{target}`: Merge partition rebuild phase starting.")
+            rebuild_started = perf_counter()
+            backend.merge_replace_partitions(cls, session, target, pk_cols, merge_batch_size=merge_batch_size)
+            logger.info(
+                f"Table `{target}`: Merge partition rebuild phase completed in "
+                f"{_format_elapsed(perf_counter() - rebuild_started)}."
+            )
         elif merge_strategy == "insert_if_empty":
             if not target_empty_confirmed:
                 logger.info(f"Table `{target}`: Checking whether target table is empty.")
@@ -578,7 +1042,192 @@ class CSVLoadableTableInterface(ORMTableBase):
             )
         else:
             raise ValueError(f"Unknown merge strategy '{merge_strategy}'")
+        return counts
     
+    @classmethod
+    def validate_foreign_keys(
+        cls: Type[CSVTableProtocol],
+        session: so.Session,
+        *,
+        staging_schema: str | None = None,
+    ) -> None:
+        """
+        Check merged rows against the model's foreign keys.
+
+        Runs one anti-join per constraint, restricted to target rows whose
+        key is present in staging, so it can be used inside the merge
+        transaction while constraint enforcement is disabled.
+
+        Raises
+        ------
+        IngestError
+            If any merged row references a missing parent row.
+        """
+        backend = resolve_backend(session, staging_schema=staging_schema)
+        check_started = perf_counter()
+        violations = {
+            name: count
+            for name, count in backend.check_foreign_keys(
+                cls, session, cls.__tablename__, cls.pk_names()
+            ).items()
+            if count
+        }
+        logger.info(
+            f"Table `{cls.__tablename__}`: Foreign key anti-join check completed in "
+            f"{_format_elapsed(perf_counter() - check_started)}."
+        )
+        if violations:
+            details = ", ".join(f"{name}: {count}" for name, count in violations.items())
+            raise IngestError(
+                f"Table `{cls.__tablename__}`: merged rows violate foreign keys ({details})"
+            )
+
+    @classmethod
+    def classify_staging(
+        cls: Type[CSVTableProtocol],
+        session: so.Session,
+        *,
+        staging_schema: str | None = None,
+    ) -> dict[str, int]:
+        """
+        Classify the current staging rows against the target table.
+
+        Requires ``__row_hash_column__``. Staging hashes are computed in
+        the query, leaving the staging table untouched, and compared to the
+        target's stored hashes with a single join on the primary key.
+
+        Parameters
+        ----------
+        session
+            An active SQLAlchemy session bound to an engine.
+        staging_schema
+            Schema the staging table lives in. ``None`` means no schema
+            qualification (backend-default behavior).
+
+        Returns
+        -------
+        dict[str, int]
+            Row counts keyed by ``new``, ``changed``, ``unchanged`` and
+            ``deleted``.
+        """
+        _require_bind(session)
+        backend = resolve_backend(session, staging_schema=staging_schema)
+        return backend.classify_staging_rows(cls, session, cls.__tablename__, cls.pk_names())
+
+    @classmethod
+    def compute_row_hashes(
+        cls: Type[CSVTableProtocol],
+        session: so.Session,
+        *,
+        only_missing: bool = True,
+    ) -> None:
+        """
+        Compute the row-hash column on the target table in SQL.
+
+        Use this to backfill hashes after adding ``__row_hash_column__`` to
+        a populated table, or with ``only_missing=False`` after rows were
+        modified outside the loader.
+
+        Parameters
+        ----------
+        session
+            An active SQLAlchemy session bound to an engine.
+        only_missing
+            Only update rows whose hash is currently ``NULL``.
+        """
+        _require_bind(session)
+        backend = resolve_backend(session)
+        target_ref = backend.identifier_preparer.quote_identifier(cls.__tablename__)
+        backend.update_row_hashes(cls, session, target_ref, only_missing=only_missing)
+
+    @classmethod
+    def bucket_fingerprints(
+        cls: Type[CSVTableProtocol],
+        session: so.Session,
+        *,
+        bucket_size: int = 1_000_000,
+        use_stored_hash: bool = False,
+    ) -> dict[int, BucketFingerprint]:
+        """
+        Fingerprint the table in SQL, one aggregate hash per primary-key bucket.
+
+        Each row is hashed in the database and the hashes are summed per
+        ``pk / bucket_size`` bucket, so no rows leave the database. To
+        reconcile two copies of a table, compare the results with
+        :meth:`mismatched_buckets` and drill into the differing buckets
+        with :meth:`row_fingerprints`. Requires a single integer primary
+        key; results are only comparable between databases of the same
+        backend.
+
+        Parameters
+        ----------
+        session
+            An active SQLAlchemy session bound to an engine.
+        bucket_size
+            Width of each primary-key bucket.
+        use_stored_hash
+            Aggregate the stored ``__row_hash_column__`` instead of hashing
+            every row. Much cheaper, but only as current as the stored
+            hashes.
+
+        Returns
+        -------
+        dict[int, BucketFingerprint]
+            Fingerprints keyed by bucket number. Empty buckets are absent.
+        """
+        _require_bind(session)
+        backend = resolve_backend(session)
+        target_ref = backend.identifier_preparer.quote_identifier(cls.__tablename__)
+        started = perf_counter()
+        buckets = backend.bucket_fingerprints(
+            cls, session, target_ref, bucket_size=bucket_size, use_stored_hash=use_stored_hash
+        )
+        logger.info(
+            f"Table `{cls.__tablename__}`: Fingerprinted {len(buckets)} buckets in "
+            f"{_format_elapsed(perf_counter() - started)}."
+        )
+        return {b.bucket: b for b in buckets}
+
+    @classmethod
+    def row_fingerprints(
+        cls: Type[CSVTableProtocol],
+        session: so.Session,
+        bucket: int,
+        *,
+        bucket_size: int = 1_000_000,
+        use_stored_hash: bool = False,
+    ) -> dict[int, str]:
+        """
+        Return the per-row hashes of one bucket, keyed by primary key.
+
+        Use the same ``bucket_size`` and ``use_stored_hash`` as the
+        :meth:`bucket_fingerprints` call being drilled into.
+        """
+        _require_bind(session)
+        backend = resolve_backend(session)
+        target_ref = backend.identifier_preparer.quote_identifier(cls.__tablename__)
+        return backend.row_fingerprints(
+            cls, session, target_ref, bucket=bucket, bucket_size=bucket_size, use_stored_hash=use_stored_hash
+        )
+
+    @staticmethod
+    def mismatched_buckets(
+        ours: dict[int, BucketFingerprint],
+        theirs: dict[int, BucketFingerprint],
+    ) -> list[int]:
+        """
+        Return the buckets whose fingerprints differ or exist on one side only.
+
+        Only ``rows`` and ``hash_sum`` are compared.
+        """
+        return sorted(
+            bucket
+            for bucket in ours.keys() | theirs.keys()
+            if bucket not in ours
+            or bucket not in theirs
+            or (ours[bucket].rows, ours[bucket].hash_sum) != (theirs[bucket].rows, theirs[bucket].hash_sum)
+        )
+
     @classmethod
     def drop_staging_table(
         cls: Type[CSVTableProtocol],
@@ -589,6 +1238,9 @@ class CSVLoadableTableInterface(ORMTableBase):
         """
         Drop the staging table if it exists.
 
+        Any pooled copy of the staging table (see ``reuse_staging``) is
+        forgotten as well.
+
         Parameters
         ----------
         session
@@ -599,20 +1251,23 @@ class CSVLoadableTableInterface(ORMTableBase):
         """
         backend = resolve_backend(session, staging_schema=staging_schema)
         backend.drop_staging_table(cls, session)
+        StagingTablePool.for_bind(_require_bind(session)).invalidate(cls, backend)
 
     @classmethod
     def csv_columns(cls) -> dict[str, sa.ColumnElement[Any]]:
         """
         Return a mapping of CSV column names to model columns.
 
-        By default this is equivalent to :meth:`model_columns`.
-        Override this method to implement custom column mappings.
+        By default this is :meth:`model_columns` without computed
+        columns or the ``__row_hash_column__``, which are derived in the
+        database rather than read from the file. Override this method to
+        implement custom column mappings.
 
         Returns
         -------
         dict[str, sqlalchemy.ColumnElement]
             Mapping of input column names to SQLAlchemy columns.
         """
-        cols = cls.model_columns()
-        computed_names = {c.name for c in cls.__table__.columns if c.computed is not None}  # type: ignore
-        return {k: v for k, v in cols.items() if k not in computed_names}
+        shape = cls.table_shape()
+        excluded = shape.computed | {cls.__row_hash_column__}
+        return {k: v for k, v in shape.columns.items() if k not in excluded}
@@ -1,9 +1,13 @@
 import sqlalchemy as sa
 import sqlalchemy.orm as so
 from sqlalchemy.exc import NoInspectionAvailable, StatementError
-from typing import Any
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any, Iterable, Iterator, Mapping
 import logging
-from .allocators import IdAllocator
+import threading
+import weakref
+from .allocators import BlockIdAllocator, IdAllocator
 from ..helpers import normalise_null
 
 logger = logging.getLogger(__name__)
@@ -28,6 +32,76 @@ def _resolves_to_autoincrement(c: sa.Column) -> bool:
     pk_columns = list(c.table.primary_key.columns)
     return len(pk_columns) == 1 and pk_columns[0] is c and isinstance(c.type, sa.Integer)
 
+
+@dataclass(frozen=True)
+class TableShape:
+    """
+    Immutable snapshot of a mapped class's column structure.
+
+    Built once per class by :meth:`ORMTableBase.table_shape` and reused by
+    the introspection helpers, which previously re-inspected the mapper on
+    every call.
+
+    Attributes
+    ----------
+    columns
+        Read-only mapping of attribute key to mapped column, in mapper order.
+    pk_columns
+        Primary key columns in mapper order.
+    pk_names
+        Primary key attribute keys in mapper order.
+    required
+        Column keys that must be present in inbound data.
+    insertable
+        Table column names that accept inserted values (non-computed).
+    computed
+        Table column names whose values are computed by the database.
+    """
+
+    columns: Mapping[str, sa.ColumnElement[Any]]
+    pk_columns: tuple[sa.ColumnElement[Any], ...]
+    pk_names: tuple[str, ...]
+    required: frozenset[str]
+    insertable: tuple[str, ...]
+    computed: frozenset[str]
+
+    @classmethod
+    def from_mapper(cls, mapper: so.Mapper[Any]) -> "TableShape":
+        """Build the shape for a mapper."""
+        mapped_columns = list(mapper.columns)
+        pk_columns = tuple(mapper.primary_key)
+        table_columns = list(mapper.local_table.columns)
+        return cls(
+            columns=MappingProxyType({c.key: c for c in mapped_columns}),
+            pk_columns=pk_columns,
+            pk_names=tuple(c.key for c in pk_columns if c.key is not None),
+            required=frozenset(
+                c.key
+                for c in mapped_columns
+                if not c.nullable
+                and not c.default
+                and not c.server_default
+                and not _resolves_to_autoincrement(c)
+            ),
+            insertable=tuple(c.name for c in table_columns if c.computed is None),
+            computed=frozenset(c.name for c in table_columns if c.computed is not None),
+        )
+
+
+_TABLE_SHAPES: "weakref.WeakKeyDictionary[type, TableShape]" = weakref.WeakKeyDictionary()
+_TABLE_SHAPES_LOCK = threading.Lock()
+
+
+def _invalidate_shape(mapper: so.Mapper[Any], class_: type) -> None:
+    with _TABLE_SHAPES_LOCK:
+        _TABLE_SHAPES.pop(class_, None)
+
+
+# A mapper that is (re)constructed or (re)configured may have gained
+# columns or inherited ones, so any cached shape for its class is dropped.
+sa.event.listen(so.Mapper, "after_mapper_constructed", _invalidate_shape)
+sa.event.listen(so.Mapper, "mapper_configured", _invalidate_shape)
+
 """
 ORMTableBase
 ============
@@ -88,6 +162,34 @@ class ORMTableBase:
         except NoInspectionAvailable:
             raise TypeError(f"{cls.__name__} is not a mapped ORM class")
 
+    @classmethod
+    def table_shape(cls: type[Any]) -> TableShape:
+        """
+        Return the cached :class:`TableShape` for this class.
+
+        The shape is built on first use and dropped automatically when the
+        mapper is constructed or configured again. Call
+        :meth:`invalidate_table_shape` after adding columns to an
+        already-configured mapper.
+
+        Returns
+        -------
+        TableShape
+            The column structure of the mapped class.
+        """
+        shape = _TABLE_SHAPES.get(cls)
+        if shape is None:
+            shape = TableShape.from_mapper(cls.mapper_for())
+            with _TABLE_SHAPES_LOCK:
+                _TABLE_SHAPES[cls] = shape
+        return shape
+
+    @classmethod
+    def invalidate_table_shape(cls) -> None:
+        """Discard the cached :class:`TableShape` so it is rebuilt on next use."""
+        with _TABLE_SHAPES_LOCK:
+            _TABLE_SHAPES.pop(cls, None)
+
     @classmethod
     def pk_columns(cls) -> list[sa.ColumnElement[Any]]:
         """
@@ -105,10 +207,10 @@ class ORMTableBase:
         ValueError
             If the table has no primary key defined.
         """
-        pks = list(cls.mapper_for().primary_key)
+        pks = cls.table_shape().pk_columns
         if not pks:
             raise ValueError(f"{cls.__name__} has no primary key")
-        return pks
+        return list(pks)
 
     @classmethod
     def pk_names(cls) -> list[str]:
@@ -120,7 +222,9 @@ class ORMTableBase:
         list[str]
             A list of primary key column names.
         """
-        return [c.key for c in cls.pk_columns() if c.key is not None]
+        if not cls.table_shape().pk_columns:
+            raise ValueError(f"{cls.__name__} has no primary key")
+        return list(cls.table_shape().pk_names)
 
     @classmethod
     def pk_values(cls, obj: Any) -> dict[str, Any]:
@@ -137,7 +241,7 @@ class ORMTableBase:
         dict[str, Any]
             A dictionary mapping primary key column names to values.
         """
-        return {c.key: getattr(obj, c.key) for c in cls.pk_columns() if c.key is not None}
+        return {name: getattr(obj, name) for name in cls.table_shape().pk_names}
     
     @classmethod
     def pk_tuple(cls, obj: Any) -> tuple[Any, ...]:
@@ -156,11 +260,7 @@ class ORMTableBase:
         tuple
             A tuple of primary key values.
         """
-        return tuple(
-            getattr(obj, c.key)
-            for c in cls.pk_columns()
-            if c.key is not None
-        )
+        return tuple(getattr(obj, name) for name in cls.table_shape().pk_names)
 
     @classmethod
     def model_columns(cls) -> dict[str, sa.ColumnElement[Any]]:
@@ -172,8 +272,7 @@ class ORMTableBase:
         dict[str, sqlalchemy.ColumnElement]
             A mapping of column name to column object.
         """
-        mapper = cls.mapper_for()
-        return {c.key: c for c in mapper.columns}
+        return dict(cls.table_shape().columns)
     
     @classmethod
     def required_columns(cls) -> set[str]:
@@ -195,15 +294,7 @@ class ORMTableBase:
         set[str]
             A set of required column names.
         """
-        mapper = cls.mapper_for()
-        return {
-            c.key
-            for c in mapper.columns
-            if not c.nullable
-            and not c.default
-            and not c.server_default
-            and not _resolves_to_autoincrement(c)
-        }
+        return set(cls.table_shape().required)
 
     @classmethod
     def max_id(cls, session: so.Session) -> int:
@@ -259,6 +350,53 @@ class ORMTableBase:
         """
         return IdAllocator(cls.max_id(session))
 
+    @classmethod
+    def block_allocator(
+        cls,
+        bind: sa.Engine | so.Session,
+        *,
+        block_size: int = 10_000,
+    ) -> BlockIdAllocator:
+        """
+        Create a concurrency-safe allocator for this table's primary key.
+
+        IDs are leased in blocks from a shared high-water-mark table, so
+        allocators in different threads or processes never hand out the
+        same ID. The mark is seeded from the current maximum primary key
+        the first time the table is seen.
+
+        Parameters
+        ----------
+        bind
+            An engine, or a session bound to one.
+        block_size
+            Number of IDs leased per database round-trip.
+
+        Returns
+        -------
+        BlockIdAllocator
+            An allocator keyed on this table's name.
+
+        Raises
+        ------
+        ValueError
+            If the table has a composite primary key.
+        """
+        pks = cls.pk_columns()
+        if len(pks) != 1:
+            raise ValueError(
+                f"{cls.__name__} has composite PK; block_allocator() not supported"
+            )
+        engine = bind.get_bind() if isinstance(bind, so.Session) else bind
+        if isinstance(engine, sa.Connection):
+            engine = engine.engine
+        return BlockIdAllocator(
+            engine,
+            cls.__tablename__,
+            block_size=block_size,
+            seed_column=pks[0],
+        )
+
 
     @classmethod
     def clean_kwargs(
@@ -274,7 +412,22 @@ class ORMTableBase:
         - optionally drop nulls
         - optionally validate required columns
         """
-        cols = cls.model_columns()
+        return cls._clean_fields(data, cls.table_shape(), drop_nulls=drop_nulls, strict=strict)
+
+    @classmethod
+    def _clean_fields(
+        cls,
+        data: dict[str, Any],
+        shape: TableShape,
+        *,
+        drop_nulls: bool,
+        strict: bool,
+    ) -> dict[str, Any]:
+        """
+        Per-record body of :meth:`clean_kwargs`, taking the resolved shape
+        so :meth:`from_records` looks it up once per call.
+        """
+        cols = shape.columns
 
         cleaned: dict[str, Any] = {}
         for k, v in data.items():
@@ -289,7 +442,7 @@ class ORMTableBase:
             cleaned[k] = v2
 
         if strict:
-            missing = cls.required_columns() - cleaned.keys()
+            missing = shape.required - cleaned.keys()
             if missing:
                 raise ValueError(
                     f"Missing required fields for {cls.__name__}: {sorted(missing)}"
@@ -313,16 +466,24 @@ class ORMTableBase:
             strict=strict,
         )
 
+        return cls._construct(data, cleaned)
+
+    @classmethod
+    def _construct(cls, data: dict[str, Any], cleaned: dict[str, Any]):
+        """
+        Instantiate the class from cleaned kwargs, wrapping construction
+        errors with the offending input.
+        """
         try:
             return cls(**cleaned)
 
         except TypeError as e:
             # bad keyword, missing arg, etc
-            unknown_keys = set(data.keys()) - set(cls.model_columns().keys())
+            unknown_keys = set(data.keys()) - cls.table_shape().columns.keys()
             msg = (
                 f"Failed to construct {cls.__name__} from dict.\n"
                 f"Error: {e}\n"
-                f"Known columns: {sorted(cls.model_columns().keys())}\n"
+                f"Known columns: {sorted(cls.table_shape().columns)}\n"
                 f"Unknown keys: {sorted(unknown_keys)}\n"
                 f"Cleaned kwargs: {cleaned}"
             )
@@ -341,4 +502,57 @@ class ORMTableBase:
                 f"Unexpected error constructing {cls.__name__}.\n"
                 f"Cleaned kwargs: {cleaned}\n"
             )
-            raise RuntimeError(msg) from e
\ No newline at end of file
+            raise RuntimeError(msg) from e
+
+    @classmethod
+    def from_records(
+        cls,
+        records: Iterable[dict[str, Any]],
+        *,
+        drop_nulls: bool = True,
+        strict: bool = False,
+        as_dicts: bool = False,
+    ) -> Iterator[Any]:
+        """
+        Build many instances (or insert-ready dicts) from an iterable of records.
+
+        Equivalent to calling :meth:`from_dict` per record, but the column
+        filter and required set are resolved once and records are streamed,
+        so arbitrarily large inputs can be processed lazily.
+
+        Parameters
+        ----------
+        records
+            Iterable of mappings, e.g. decoded API payloads.
+        drop_nulls
+            Omit keys whose value normalises to ``None``.
+        strict
+            Raise ``ValueError`` if a record is missing required columns.
+        as_dicts
+            Yield cleaned dicts instead of ORM instances. With
+            ``drop_nulls=False`` every non-computed mapped column is present
+            in every dict (``None`` where the record has no value), so the
+            output can be passed in batches to
+            ``session.execute(sa.insert(cls), rows)``.
+
+        Yields
+        ------
+        Any
+            ORM instances, or cleaned dicts when ``as_dicts`` is set.
+        """
+        shape = cls.table_shape()
+        columns = shape.columns
+        clean = cls._clean_fields
+        construct = cls._construct
+        # Uniform keys let executemany batch every row into one statement.
+        template: dict[str, None] | None = None
+        if as_dicts and not drop_nulls:
+            template = dict.fromkeys(
+                k for k, c in columns.items() if getattr(c, "name", k) not in shape.computed
+            )
+
+        for data in records:
+            cleaned = clean(data, shape, drop_nulls=drop_nulls, strict=strict)
+            if template is not None:
+                cleaned = {**template, **cleaned}
+            yield cleaned if as_dicts else construct(data, cleaned)
@@ -1,10 +1,21 @@
-from typing import Any, Unpack
-from collections.abc import Iterator
+from typing import Any, Callable, Unpack
+from collections.abc import Iterable, Iterator, Mapping
+from pathlib import Path
 import json
 import hashlib
 import datetime
+import decimal
+import threading
+import weakref
+from json.encoder import encode_basestring_ascii
 
-from .orm_table import ORMTableBase
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+import pyarrow.parquet as pq
+import sqlalchemy as sa
+import sqlalchemy.orm as so
+
+from .orm_table import ORMTableBase, TableShape
 from .typing import ToDictKwargs
 
 
@@ -34,6 +45,146 @@ def json_default(obj: Any) -> str:
         return obj.isoformat()
     raise TypeError(f"Object of type {type(obj)} is not JSON serialisable")
 
+
+def _export_json_default(obj: Any) -> str:
+    # Exports also write times as ISO-8601 and decimals as exact strings;
+    # to_json keeps raising for them so its output is unchanged.
+    if isinstance(obj, datetime.time):
+        return obj.isoformat()
+    if isinstance(obj, decimal.Decimal):
+        return str(obj)
+    return json_default(obj)
+
+
+def _encode_float(value: float) -> str:
+    # mirrors json.encoder.floatstr with allow_nan=True
+    if value != value:
+        return "NaN"
+    if value == float("inf"):
+        return "Infinity"
+    if value == float("-inf"):
+        return "-Infinity"
+    return float.__repr__(value)
+
+
+def _encode_isoformat(value: datetime.date | datetime.time) -> str:
+    return encode_basestring_ascii(value.isoformat())
+
+
+# Encoders keyed on exact type; anything else (subclasses, containers,
+# enums) falls back to json.dumps so the output stays identical.
+_JSON_ENCODERS: dict[type, Callable[[Any], str]] = {
+    str: encode_basestring_ascii,
+    int: int.__repr__,
+    bool: lambda v: "true" if v else "false",
+    float: _encode_float,
+    type(None): lambda _: "null",
+    datetime.date: _encode_isoformat,
+    datetime.datetime: _encode_isoformat,
+}
+
+_EXPORT_JSON_ENCODERS: dict[type, Callable[[Any], str]] = {
+    **_JSON_ENCODERS,
+    datetime.time: _encode_isoformat,
+    decimal.Decimal: lambda v: encode_basestring_ascii(str(v)),
+}
+
+
+def _encode_fallback(value: Any) -> str:
+    return json.dumps(value, default=json_default, sort_keys=True)
+
+
+def _encode_export_fallback(value: Any) -> str:
+    return json.dumps(value, default=_export_json_default, sort_keys=True)
+
+
+class _CompiledSerialiser:
+    """
+    Per-class JSON encoder producing the same text as
+    ``json.dumps(row.to_dict(...), default=json_default, sort_keys=True)``.
+
+    Key order and the encoded ``"key": `` prefixes are computed once;
+    values are encoded through an exact-type dispatch table. With
+    ``export=True`` the exporters' rules for times and decimals apply.
+    """
+
+    __slots__ = ("shape", "keys")
+
+    def __init__(self, shape: TableShape) -> None:
+        self.shape = shape
+        self.keys: tuple[tuple[str, str], ...] = tuple(
+            (key, encode_basestring_ascii(key) + ": ") for key in sorted(shape.columns)
+        )
+
+    def encode(
+        self,
+        get: Callable[[str], Any],
+        *,
+        include_nulls: bool = False,
+        only: set[str] | None = None,
+        exclude: set[str] | None = None,
+        export: bool = False,
+    ) -> str:
+        encoders = _EXPORT_JSON_ENCODERS if export else _JSON_ENCODERS
+        fallback = _encode_export_fallback if export else _encode_fallback
+        parts: list[str] = []
+        append = parts.append
+        for key, prefix in self.keys:
+            if only and key not in only:
+                continue
+            if exclude and key in exclude:
+                continue
+            value = get(key)
+            if value is None and not include_nulls:
+                continue
+            encoder = encoders.get(type(value), fallback)
+            append(prefix + encoder(value))
+        return "{" + ", ".join(parts) + "}"
+
+
+_SERIALISERS: "weakref.WeakKeyDictionary[type, _CompiledSerialiser]" = weakref.WeakKeyDictionary()
+_SERIALISERS_LOCK = threading.Lock()
+
+
+def _arrow_field(column: sa.Column[Any]) -> tuple[pa.DataType | None, Callable[[Any], Any] | None]:
+    """
+    Return the Arrow type for an exported column and an optional
+    per-value converter applied before building the array.
+
+    ``None`` as the type lets pyarrow infer it from the values.
+    """
+    col_type = column.type
+    if isinstance(col_type, sa.Boolean):
+        return pa.bool_(), None
+    if isinstance(col_type, sa.Integer):
+        return pa.int64(), None
+    if isinstance(col_type, sa.Float):
+        return pa.float64(), None
+    if isinstance(col_type, sa.Numeric):
+        if col_type.asdecimal and col_type.precision is not None:
+            return pa.decimal128(col_type.precision, col_type.scale or 0), None
+        # Unbounded numerics may exceed any fixed decimal; keep the exact text.
+        return pa.string(), str
+    if isinstance(col_type, sa.DateTime):
+        return pa.timestamp("us", tz="UTC" if col_type.timezone else None), None
+    if isinstance(col_type, sa.Date):
+        return pa.date32(), None
+    if isinstance(col_type, sa.Time):
+        return pa.time64("us"), None
+    if isinstance(col_type, sa.LargeBinary):
+        return pa.binary(), None
+    if isinstance(col_type, sa.JSON):
+        return pa.string(), _encode_export_fallback
+    if isinstance(col_type, (sa.String, sa.Enum)):
+        return pa.string(), None
+    return None, None
+
+
+def _to_array(values: tuple[Any, ...], arrow_type: pa.DataType | None, convert: Callable[[Any], Any] | None) -> pa.Array:
+    if convert is not None:
+        values = tuple(None if v is None else convert(v) for v in values)
+    return pa.array(values, type=arrow_type)
+
     
 class SerialisableTableInterface(ORMTableBase):
     """
@@ -53,6 +204,212 @@ class SerialisableTableInterface(ORMTableBase):
 
     __abstract__ = True
 
+    @classmethod
+    def _export_columns(cls, columns: list[str] | None) -> list[sa.Column[Any]]:
+        table_columns = {c.name: c for c in cls.__table__.columns}  # type: ignore[attr-defined]
+        if columns is None:
+            return list(table_columns.values())
+        unknown = [c for c in columns if c not in table_columns]
+        if unknown:
+            raise ValueError(f"Unknown columns for {cls.__name__}: {unknown}")
+        return [table_columns[c] for c in columns]
+
+    @classmethod
+    def export_schema(cls, columns: list[str] | None = None) -> pa.Schema:
+        """
+        Return the Arrow schema used by the bulk exporters.
+
+        Parameters
+        ----------
+        columns
+            Table column names to export. ``None`` exports every column.
+
+        Returns
+        -------
+        pyarrow.Schema
+            One field per exported column. Columns whose type has no
+            fixed Arrow mapping are typed from the first batch.
+        """
+        fields = []
+        for col in cls._export_columns(columns):
+            arrow_type, _ = _arrow_field(col)
+            fields.append(pa.field(col.name, arrow_type if arrow_type is not None else pa.null()))
+        return pa.schema(fields)
+
+    @classmethod
+    def iter_record_batches(
+        cls,
+        session: so.Session,
+        *,
+        columns: list[str] | None = None,
+        where: sa.ColumnElement[bool] | None = None,
+        batch_size: int = 50_000,
+    ) -> Iterator[pa.RecordBatch]:
+        """
+        Stream the table as Arrow record batches.
+
+        A Core ``select`` is executed with ``yield_per``, which uses a
+        server-side cursor where the driver supports one, and each
+        partition of rows is converted column-wise. No ORM instances are
+        created. Enum columns are exported as their stored database value.
+
+        Parameters
+        ----------
+        session
+            An active SQLAlchemy session.
+        columns
+            Table column names to export. ``None`` exports every column.
+        where
+            Optional filter applied to the select.
+        batch_size
+            Rows fetched per batch.
+
+        Yields
+        ------
+        pyarrow.RecordBatch
+            Batches of at most ``batch_size`` rows.
+        """
+        export_columns = cls._export_columns(columns)
+        fields = [_arrow_field(c) for c in export_columns]
+        stmt = sa.select(
+            *(
+                sa.type_coerce(c, sa.String()).label(c.name) if isinstance(c.type, sa.Enum) else c
+                for c in export_columns
+            )
+        )
+        if where is not None:
+            stmt = stmt.where(where)
+
+        names = [c.name for c in export_columns]
+        result = session.execute(stmt.execution_options(yield_per=batch_size))
+        for rows in result.partitions(batch_size):
+            values = list(zip(*rows))
+            yield pa.RecordBatch.from_arrays(
+                [_to_array(values[i], t, conv) for i, (t, conv) in enumerate(fields)],
+                names=names,
+            )
+
+    @classmethod
+    def export_parquet(
+        cls,
+        session: so.Session,
+        path: Path,
+        *,
+        columns: list[str] | None = None,
+        where: sa.ColumnElement[bool] | None = None,
+        batch_size: int = 50_000,
+        compression: str = "zstd",
+    ) -> int:
+        """
+        Export the table to a parquet file, one row group per batch.
+
+        Returns
+        -------
+        int
+            Number of rows written.
+        """
+        total = 0
+        writer: pq.ParquetWriter | None = None
+        try:
+            for batch in cls.iter_record_batches(session, columns=columns, where=where, batch_size=batch_size):
+                if writer is None:
+                    writer = pq.ParquetWriter(path, batch.schema, compression=compression)
+                elif batch.schema != writer.schema:
+                    batch = batch.cast(writer.schema)
+                writer.write_batch(batch)
+                total += batch.num_rows
+            if writer is None:
+                pq.write_table(cls.export_schema(columns).empty_table(), path, compression=compression)
+        finally:
+            if writer is not None:
+                writer.close()
+        return total
+
+    @classmethod
+    def export_csv(
+        cls,
+        session: so.Session,
+        path: Path,
+        *,
+        columns: list[str] | None = None,
+        where: sa.ColumnElement[bool] | None = None,
+        batch_size: int = 50_000,
+        delimiter: str = "\t",
+    ) -> int:
+        """
+        Export the table to a delimited text file with a header row.
+
+        The default tab delimiter matches the files :meth:`load_csv`
+        reads; nulls are written as empty fields.
+
+        Returns
+        -------
+        int
+            Number of rows written.
+        """
+        options = pa_csv.WriteOptions(delimiter=delimiter, quoting_style="needed")
+        total = 0
+        writer: pa_csv.CSVWriter | None = None
+        schema: pa.Schema | None = None
+        try:
+            for batch in cls.iter_record_batches(session, columns=columns, where=where, batch_size=batch_size):
+                if writer is None:
+                    writer = pa_csv.CSVWriter(str(path), batch.schema, write_options=options)
+                    schema = batch.schema
+                elif batch.schema != schema:
+                    batch = batch.cast(schema)
+                writer.write_batch(batch)
+                total += batch.num_rows
+            if writer is None:
+                pa_csv.write_csv(cls.export_schema(columns).empty_table(), str(path), write_options=options)
+        finally:
+            if writer is not None:
+                writer.close()
+        return total
+
+    @classmethod
+    def export_ndjson(
+        cls,
+        session: so.Session,
+        path: Path,
+        *,
+        columns: list[str] | None = None,
+        where: sa.ColumnElement[bool] | None = None,
+        batch_size: int = 50_000,
+    ) -> int:
+        """
+        Export the table as newline-delimited JSON, one object per row.
+
+        Rows are read with a Core ``select`` (no ORM instances) and each
+        line is byte-identical to ``to_json(include_nulls=True)`` for the
+        same row, including the sorted key order. Unlike :meth:`to_json`,
+        times are written as ISO-8601 strings and decimals as their exact
+        string form. A :meth:`to_dict` override is not applied, since no
+        instances are built.
+
+        Returns
+        -------
+        int
+            Number of rows written.
+        """
+        export_columns = cls._export_columns(columns)
+        keys = {col.name: key for key, col in cls.table_shape().columns.items()}
+        stmt = sa.select(*(c.label(keys.get(c.name, c.name)) for c in export_columns))
+        if where is not None:
+            stmt = stmt.where(where)
+        only = {keys.get(c.name, c.name) for c in export_columns}
+        encode = cls._json_serialiser().encode
+
+        total = 0
+        with open(path, "w", encoding="utf-8") as fh:
+            result = session.execute(stmt.execution_options(yield_per=batch_size))
+            for rows in result.partitions(batch_size):
+                fh.writelines(
+                    encode(row._mapping.get, include_nulls=True, only=only, export=True) + "\n" for row in rows
+                )
+                total += len(rows)
+        return total
+
     def to_dict(
         self,
         *,
@@ -84,7 +441,7 @@ class SerialisableTableInterface(ORMTableBase):
             A dictionary representation of the ORM row.
         """
         data: dict[str, Any] = {}
-        for key, _ in self.model_columns().items():
+        for key in self.table_shape().columns:
             if only and key not in only:
                 continue
             if exclude and key in exclude:
@@ -99,8 +456,10 @@ class SerialisableTableInterface(ORMTableBase):
         """
         Serialise the ORM instance to a JSON string.
 
-        This method delegates to :meth:`to_dict` and applies a stable,
-        deterministic JSON encoding with sorted keys.
+        The output is ``json.dumps(self.to_dict(**kwargs), sort_keys=True)``
+        with :func:`json_default` for dates. Unless a subclass
+        overrides :meth:`to_dict`, it is produced by a compiled per-class
+        encoder that skips building the intermediate dict.
 
         Parameters
         ----------
@@ -111,13 +470,16 @@ class SerialisableTableInterface(ORMTableBase):
         -------
         str
             A JSON representation of the ORM row.
+
+        Raises
+        ------
+        TypeError
+            If a value has no JSON form, e.g. a ``Decimal`` or ``time``.
         """
-        return json.dumps(
-            self.to_dict(**kwargs),
-            default=json_default,
-            sort_keys=True,
-        )
-    
+        if self._overrides_to_dict():
+            return json.dumps(self.to_dict(**kwargs), default=json_default, sort_keys=True)
+        return self._json_serialiser().encode(self.__getattribute__, **kwargs)
+
     def fingerprint(self) -> str:
         """
         Compute a stable fingerprint for the ORM instance.
@@ -136,6 +498,57 @@ class SerialisableTableInterface(ORMTableBase):
         """
         payload = self.to_json(include_nulls=True)
         return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    @classmethod
+    def _overrides_to_dict(cls) -> bool:
+        return cls.to_dict is not SerialisableTableInterface.to_dict
+
+    @classmethod
+    def _json_serialiser(cls) -> _CompiledSerialiser:
+        """Return the compiled serialiser, rebuilding it if the table shape changed."""
+        shape = cls.table_shape()
+        serialiser = _SERIALISERS.get(cls)
+        if serialiser is None or serialiser.shape is not shape:
+            serialiser = _CompiledSerialiser(shape)
+            with _SERIALISERS_LOCK:
+                _SERIALISERS[cls] = serialiser
+        return serialiser
+
+    @classmethod
+    def fingerprint_many(cls, rows: Iterable[Any]) -> list[str]:
+        """
+        Compute :meth:`fingerprint` for many rows at once.
+
+        Rows may be instances of this class or mappings keyed by mapped
+        column key, i.e. the keys :meth:`to_dict` produces (e.g.
+        ``Row._mapping`` from a select of the table's columns, or dicts
+        from ``from_records``); missing keys are treated as ``None``.
+        Mappings are encoded from their values as given, so they bypass
+        any :meth:`to_dict` override; instances always honour it. The
+        serialiser is resolved once for the whole batch.
+
+        Parameters
+        ----------
+        rows
+            Instances or mappings to fingerprint.
+
+        Returns
+        -------
+        list[str]
+            SHA-256 hex digests, in input order.
+        """
+        encode = cls._json_serialiser().encode
+        sha256 = hashlib.sha256
+        digests: list[str] = []
+        for row in rows:
+            if isinstance(row, Mapping):
+                payload = encode(row.get, include_nulls=True)
+            elif row._overrides_to_dict():
+                payload = row.to_json(include_nulls=True)
+            else:
+                payload = encode(row.__getattribute__, include_nulls=True)
+            digests.append(sha256(payload.encode("utf-8")).hexdigest())
+        return digests
     
     def __iter__(self) -> Iterator[tuple[str, Any]]:
         """
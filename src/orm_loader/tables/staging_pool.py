@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+import hashlib
+import logging
+import threading
+import weakref
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Type
+
+import sqlalchemy as sa
+import sqlalchemy.orm as so
+
+if TYPE_CHECKING:
+    from ..backends.base import DatabaseBackend
+    from .typing import CSVTableProtocol
+
+logger = logging.getLogger(__name__)
+
+
+def schema_fingerprint(table_cls: Type["CSVTableProtocol"]) -> str:
+    """
+    Return a stable fingerprint of the target table's column layout.
+
+    Column names, types, nullability and computed expressions are hashed,
+    so any change to the model that would change the staging table
+    invalidates a pooled copy.
+    """
+    table = table_cls.__table__
+    parts = [
+        f"{c.name}|{c.type!r}|{c.nullable}|{c.computed.sqltext if c.computed is not None else ''}"
+        for c in table.columns
+    ]
+    return hashlib.sha1("\n".join([table.fullname, *parts]).encode("utf-8")).hexdigest()
+
+
+@dataclass
+class _PooledStaging:
+    fingerprint: str
+    table: sa.Table
+    dirty: bool = True
+
+
+class StagingTablePool:
+    """
+    Per-engine cache of prepared staging tables.
+
+    Instead of dropping and re-creating the staging table for every load,
+    the pool keeps one staging table per target and empties it between
+    loads (``TRUNCATE ... RESTART IDENTITY`` on PostgreSQL, ``DELETE`` on
+    SQLite). The staging ``sa.Table`` is cached in-process and reused as
+    long as the target's schema fingerprint is unchanged, so repeated
+    loads of small files skip both the DDL and the catalog round-trip.
+
+    Pools are keyed weakly on the engine; use :meth:`for_bind` rather than
+    constructing one directly.
+    """
+
+    _pools: "weakref.WeakKeyDictionary[sa.Engine, StagingTablePool]" = weakref.WeakKeyDictionary()
+    _pools_lock = threading.Lock()
+
+    def __init__(self) -> None:
+        self._entries: dict[tuple[str | None, str], _PooledStaging] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def for_bind(cls, bind: sa.Engine | sa.Connection) -> "StagingTablePool":
+        """Return the pool for the engine behind ``bind``, creating it on first use."""
+        engine = bind.engine if isinstance(bind, sa.Connection) else bind
+        with cls._pools_lock:
+            pool = cls._pools.get(engine)
+            if pool is None:
+                pool = cls._pools[engine] = cls()
+            return pool
+
+    @staticmethod
+    def _key(table_cls: Type["CSVTableProtocol"], backend: "DatabaseBackend") -> tuple[str | None, str]:
+        return backend.staging_schema, backend.staging_name_for_table(table_cls.__tablename__)
+
+    def acquire(
+        self,
+        table_cls: Type["CSVTableProtocol"],
+        session: so.Session,
+        backend: "DatabaseBackend",
+    ) -> sa.Table:
+        """
+        Return an empty staging table for ``table_cls``.
+
+        A pooled table whose fingerprint still matches is emptied if a
+        previous load did not release it cleanly; otherwise the staging
+        table is (re)created once.
+        """
+        key = self._key(table_cls, backend)
+        fingerprint = schema_fingerprint(table_cls)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.fingerprint == fingerprint:
+                if entry.dirty:
+                    backend.truncate_staging_table(table_cls, session)
+                entry.dirty = True
+                logger.debug(f"Table `{table_cls.__tablename__}`: Reusing pooled staging table {key[1]}")
+                return entry.table
+
+            if entry is not None:
+                logger.info(
+                    f"Table `{table_cls.__tablename__}`: Schema changed; recreating pooled staging table {key[1]}"
+                )
+            backend.create_staging_table(table_cls, session)
+            table = backend.staging_table_for(table_cls)
+            self._entries[key] = _PooledStaging(fingerprint=fingerprint, table=table)
+            return table
+
+    def release(
+        self,
+        table_cls: Type["CSVTableProtocol"],
+        session: so.Session,
+        backend: "DatabaseBackend",
+    ) -> None:
+        """Empty the staging table after a successful load and keep it for reuse."""
+        key = self._key(table_cls, backend)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return
+            backend.truncate_staging_table(table_cls, session)
+            entry.dirty = False
+
+    def invalidate(
+        self,
+        table_cls: Type["CSVTableProtocol"] | None = None,
+        backend: "DatabaseBackend | None" = None,
+    ) -> None:
+        """
+        Forget pooled staging tables.
+
+        With no arguments every entry is dropped from the cache; the
+        database tables themselves are left alone.
+        """
+        with self._lock:
+            if table_cls is None or backend is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(self._key(table_cls, backend), None)
@@ -5,6 +5,10 @@ from pathlib import Path
 from contextlib import AbstractContextManager
 if TYPE_CHECKING:
     from ..loaders import LoaderContext, LoaderInterface
+    from .orm_table import TableShape
+    from ..backends.base import BucketFingerprint
+    from .allocators import IdAllocator, BlockIdAllocator
+    from sqlalchemy.ext.asyncio import AsyncSession
 
 class ToDictKwargs(TypedDict, total=False):
     include_nulls: bool
@@ -47,6 +51,9 @@ class ORMTableProtocol(Protocol):
     @classmethod
     def required_columns(cls) -> set[str]: ...
 
+    @classmethod
+    def table_shape(cls) -> "TableShape": ...
+
 @runtime_checkable
 class CSVTableProtocol(ORMTableProtocol, Protocol):
     """
@@ -70,7 +77,13 @@ class CSVTableProtocol(ORMTableProtocol, Protocol):
     def create_staging_table(cls, session: so.Session, *, staging_schema: str | None = None) -> None: ...
 
     @classmethod
-    def load_staging(cls: Type["CSVTableProtocol"], loader: "LoaderInterface", loader_context: "LoaderContext") -> int: ...
+    def load_staging(
+        cls: Type["CSVTableProtocol"],
+        loader: "LoaderInterface",
+        loader_context: "LoaderContext",
+        *,
+        create_staging: bool = True,
+    ) -> int: ...
 
     @classmethod
     def load_csv(
@@ -87,8 +100,26 @@ class CSVTableProtocol(ORMTableProtocol, Protocol):
         index_strategy: str = "auto",
         merge_batch_size: int | None = None,
         staging_schema: str | None = None,
+        rebuild_workers: int = 1,
+        maintenance_work_mem: str | None = None,
+        max_parallel_maintenance_workers: int | None = None,
+        fk_validation: str | None = None,
+        fk_validation_workers: int = 1,
+        reuse_staging: bool = False,
+        id_column: str | None = None,
+        id_allocator: "IdAllocator | BlockIdAllocator | None" = None,
+        id_sequence: str | None = None,
+        incremental_mvs: bool = False,
+        track_changes: bool = False,
+        pipeline_depth: int = 0,
+        pipeline_memory_mb: float | None = None,
+        cast_workers: int = 1,
+        memory_budget_mb: float | None = None,
     ) -> int: ...
 
+    @classmethod
+    async def load_csv_async(cls, session: "AsyncSession", path: Path, **kwargs: Any) -> int: ...
+
     @classmethod
     def orm_staging_load(cls, loader: "LoaderInterface", loader_context: "LoaderContext") -> int: ...
 
@@ -103,17 +134,60 @@ class CSVTableProtocol(ORMTableProtocol, Protocol):
         *,
         merge_batch_size: int | None = None,
         staging_schema: str | None = None,
-    ) -> None: ...
+        allow_empty: bool = False,
+    ) -> dict[str, int] | None: ...
+
+    @classmethod
+    def validate_foreign_keys(cls, session: so.Session, *, staging_schema: str | None = None) -> None: ...
+
+    @classmethod
+    def classify_staging(cls, session: so.Session, *, staging_schema: str | None = None) -> dict[str, int]: ...
+
+    @classmethod
+    def compute_row_hashes(cls, session: so.Session, *, only_missing: bool = True) -> None: ...
+
+    @classmethod
+    def bucket_fingerprints(
+        cls, session: so.Session, *, bucket_size: int = 1_000_000, use_stored_hash: bool = False
+    ) -> dict[int, "BucketFingerprint"]: ...
+
+    @classmethod
+    def row_fingerprints(
+        cls, session: so.Session, bucket: int, *, bucket_size: int = 1_000_000, use_stored_hash: bool = False
+    ) -> dict[int, str]: ...
 
     @classmethod
     def drop_staging_table(cls, session: so.Session, *, staging_schema: str | None = None) -> None: ...
 
+    @classmethod
+    def _rebuild_indices(
+        cls,
+        session: so.Session,
+        indices: list[sa.Index],
+        *,
+        rebuild_workers: int = 1,
+        maintenance_work_mem: str | None = None,
+        max_parallel_maintenance_workers: int | None = None,
+        staging_schema: str | None = None,
+    ) -> dict[str, float]: ...
+
+    @classmethod
+    def csv_columns(cls) -> dict[str, sa.ColumnElement[Any]]: ...
+
     @classmethod
     def _target_has_rows(cls, session: so.Session, target: str) -> bool: ...
 
     @classmethod
     def manage_indices(
-        cls, session: so.Session, index_strategy: str = "auto", *, staging_schema: str | None = None
+        cls,
+        session: so.Session,
+        index_strategy: str = "auto",
+        *,
+        staging_schema: str | None = None,
+        rebuild_workers: int = 1,
+        maintenance_work_mem: str | None = None,
+        max_parallel_maintenance_workers: int | None = None,
+        staging_rows: int | None = None,
     ) -> AbstractContextManager[None]:
         ...
     
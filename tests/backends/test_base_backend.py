@@ -16,6 +16,7 @@ from orm_loader.backends import (
     BackendCapabilities,
     DatabaseBackend,
     Dialect,
+    IndexCostModel,
     resolve_backend,
 )
 
@@ -202,6 +203,65 @@ def test_resolve_index_strategy_raises_for_invalid_value():
         backend.resolve_index_strategy("not-valid")
 
 
+class _IndexedTable:
+    __tablename__ = "indexed_table"
+    __table__ = sa.Table(
+        "indexed_table",
+        sa.MetaData(),
+        sa.Column("id", sa.Integer, primary_key=True),
+        sa.Column("name", sa.String, index=True),
+    )
+
+
+class _EstimatingBackend(FakeBackend):
+    def __init__(self, rows: int | None, index_bytes: int | None = None) -> None:
+        super().__init__()
+        self.rows = rows
+        self.bytes = index_bytes
+
+    def estimate_row_count(self, session, table_name):
+        return self.rows
+
+    def index_size_bytes(self, session, table_name):
+        return self.bytes
+
+
+def _auto(backend: DatabaseBackend, staging_rows: int, **kwargs) -> str:
+    return backend.resolve_index_strategy(
+        "auto",
+        table_cls=cast("Type[CSVTableProtocol]", _IndexedTable),
+        session=cast(so.Session, object()),
+        staging_rows=staging_rows,
+        **kwargs,
+    )
+
+
+def test_index_cost_model_prefers_keep_for_small_incremental_loads():
+    model = IndexCostModel()
+
+    assert model.choose(staging_rows=1_000, target_rows=500_000_000) == "keep"
+    assert model.choose(staging_rows=1_000, target_rows=500_000_000, index_bytes=50 << 30) == "keep"
+    assert model.choose(staging_rows=100_000_000, target_rows=500_000_000, index_bytes=50 << 30) == "drop_rebuild"
+    assert model.choose(staging_rows=100_000_000, target_rows=500_000_000) == "keep"
+
+
+def test_resolve_index_strategy_auto_uses_cost_model(caplog):
+    caplog.set_level("INFO")
+
+    assert _auto(_EstimatingBackend(rows=500_000_000, index_bytes=50 << 30), 1_000) == "keep"
+    assert _auto(_EstimatingBackend(rows=1_000_000, index_bytes=50 << 30), 900_000) == "drop_rebuild"
+    assert "estimated target rows=500000000, staging rows=1000" in caplog.text
+
+
+def test_resolve_index_strategy_auto_falls_back_to_backend_default():
+    assert _auto(_EstimatingBackend(rows=None), 1_000) == "drop_rebuild"
+    assert _auto(_EstimatingBackend(rows=50_000), 1_000) == "drop_rebuild"
+    assert _auto(
+        _EstimatingBackend(rows=50_000), 1_000, cost_model=IndexCostModel(min_target_rows=0)
+    ) == "keep"
+    assert _EstimatingBackend(rows=500_000_000).resolve_index_strategy("auto") == "drop_rebuild"
+
+
 def test_insertable_column_names_exclude_computed_columns():
     backend = FakeBackend()
 
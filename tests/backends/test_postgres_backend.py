@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import pytest
 import sqlalchemy.event as sae
 from typing import TYPE_CHECKING, Type, cast
 
@@ -8,8 +9,10 @@ import sqlalchemy.orm as so
 from sqlalchemy.dialects import postgresql
 from sqlalchemy.engine import Connection, Engine
 
-from orm_loader.backends import STAGING_SCHEMA, Dialect, PostgresBackend
+from orm_loader.backends import STAGING_SCHEMA, Dialect, PostgresBackend, ViewIndex
+from orm_loader.helpers.errors import IngestError
 from orm_loader.helpers.sql import qualify_identifier
+from orm_loader.tables import IdAllocator
 
 _TARGET_TABLE = "target_table"
 _STAGING_TABLE = f"_staging_{_TARGET_TABLE}"
@@ -55,6 +58,8 @@ class _FakeSession:
             def scalar_one(self):
                 return self._value
 
+        if "pg_partitioned_table" in sql:
+            return _Result(None)  # targets are plain tables unless a test says otherwise
         return _Result(self.scalar_result)
 
     def commit(self) -> None:
@@ -82,6 +87,10 @@ def test_postgres_backend_identity_and_capabilities():
     assert backend.capabilities.supports_unlogged_staging is True
     assert backend.capabilities.supports_fk_toggle is True
     assert backend.capabilities.supports_materialized_views is True
+    assert backend.capabilities.supports_table_swap is True
+    assert backend.capabilities.supports_partitioning is True
+    assert backend.capabilities.supports_concurrent_index_build is True
+    assert backend.capabilities.supports_fk_revalidation is True
 
 
 def test_qualify_identifier_escapes_embedded_quotes():
@@ -142,7 +151,7 @@ def test_postgres_backend_merge_replace_uses_using_delete():
 
     backend.merge_replace(_ComputedTableCls, _sess(session), _TARGET_TABLE, ["id", "name"])
 
-    sql = session.statements[0]
+    sql = next(s for s in session.statements if s.startswith("DELETE"))
     assert f'DELETE FROM "{_TARGET_TABLE}" t' in sql
     assert f'USING {_STAGING_TABLE_WITH_SCHEMA} s' in sql
     assert 't."id" = s."id" AND t."name" = s."name"' in sql
@@ -221,11 +230,26 @@ def test_postgres_backend_materialized_view_methods_emit_expected_sql():
     session = _FakeSession()
     selectable = sa.select(sa.literal(1).label("n"))
 
-    backend.create_materialized_view(_as_engine(session), "mv_test", selectable)
+    backend.create_materialized_view(
+        _as_engine(session), "mv_test", selectable, indexes=(ViewIndex(("n",), unique=True),)
+    )
     backend.refresh_materialized_view(_as_engine(session), "mv_test")
 
     assert any("CREATE MATERIALIZED VIEW IF NOT EXISTS mv_test as SELECT" in sql for sql in session.statements)
     assert any("REFRESH MATERIALIZED VIEW mv_test;" == sql for sql in session.statements)
+    assert 'CREATE UNIQUE INDEX IF NOT EXISTS ux_mv_test_n ON mv_test (n)' in session.statements
+
+
+def test_postgres_backend_concurrent_refresh_and_unique_index_check():
+    backend = PostgresBackend()
+    session = _FakeSession(scalar_result=True)
+
+    backend.refresh_materialized_view(_as_engine(session), "mv_test", concurrently=True)
+    has_index = backend.has_unique_index(_as_engine(session), "mv_test")
+
+    assert session.statements[0] == "REFRESH MATERIALIZED VIEW CONCURRENTLY mv_test;"
+    assert has_index is True
+    assert "indisunique AND indisvalid AND indpred IS NULL" in session.statements[1]
 
 
 def test_postgres_backend_normalize_fk_check_state():
@@ -328,3 +352,456 @@ def test_postgres_backend_engine_with_replica_role_unregisters_listener(monkeypa
         "SET session_replication_role = DEFAULT",
         "SHOW session_replication_role",
     ]
+
+
+class _HashedTable:
+    __tablename__ = _TARGET_TABLE
+    __row_hash_column__ = "row_hash"
+    __table__ = sa.Table(
+        _TARGET_TABLE,
+        sa.MetaData(),
+        sa.Column("id", sa.Integer, primary_key=True),
+        sa.Column("name", sa.String),
+        sa.Column("slug", sa.String, sa.Computed("lower(name)")),
+        sa.Column("row_hash", sa.String(32)),
+    )
+
+
+_HashedTableCls = cast("Type[CSVTableProtocol]", _HashedTable)
+
+
+def test_postgres_backend_update_row_hashes_uses_md5_row():
+    backend = PostgresBackend(staging_schema=STAGING_SCHEMA)
+    session = _FakeSession()
+
+    backend.update_row_hashes(_HashedTableCls, _sess(session), _STAGING_TABLE_WITH_SCHEMA)
+
+    assert session.statements == [
+        f'UPDATE {_STAGING_TABLE_WITH_SCHEMA} SET "row_hash" = md5(ROW("id", "name")::text)'
+    ]
+
+
+def test_postgres_backend_row_hash_column_must_exist():
+    class _Missing(_HashedTable):
+        __row_hash_column__ = "nope"
+
+    backend = PostgresBackend()
+    with pytest.raises(ValueError, match="not a column"):
+        backend.row_hash_column(cast("Type[CSVTableProtocol]", _Missing))
+
+
+def test_postgres_backend_merge_sync_uses_is_distinct_from_without_hash():
+    backend = PostgresBackend(staging_schema=STAGING_SCHEMA)
+    session = _FakeSession(scalar_result=0)
+
+    backend.merge_sync(_ComputedTableCls, _sess(session), _TARGET_TABLE, ["id"])
+
+    probe_sql, delete_sql, update_sql, insert_sql = session.statements
+    assert probe_sql == f"SELECT 1 FROM {_STAGING_TABLE_WITH_SCHEMA} LIMIT 1"
+    assert f'DELETE FROM "{_TARGET_TABLE}" AS t WHERE NOT EXISTS' in delete_sql
+    assert f'UPDATE "{_TARGET_TABLE}" AS t SET "name" = s."name"' in update_sql
+    assert 't."name" IS DISTINCT FROM s."name"' in update_sql
+    assert '"slug"' not in update_sql
+    assert f'INSERT INTO "{_TARGET_TABLE}" ("id", "name")' in insert_sql
+
+
+def test_postgres_backend_merge_sync_compares_row_hash():
+    backend = PostgresBackend(staging_schema=STAGING_SCHEMA)
+    session = _FakeSession(scalar_result=0)
+
+    backend.merge_sync(_HashedTableCls, _sess(session), _TARGET_TABLE, ["id"])
+
+    update_sql = session.statements[2]
+    assert '(t."row_hash" IS NULL OR t."row_hash" <> md5(ROW(s."id", s."name")::text))' in update_sql
+    assert '"row_hash" = md5(ROW(s."id", s."name")::text)' in update_sql
+    assert "IS DISTINCT FROM" not in update_sql
+    # Staging itself is never rewritten to fill the hash.
+    assert not any(sql.startswith(f"UPDATE {_STAGING_TABLE_WITH_SCHEMA}") for sql in session.statements)
+
+
+def test_postgres_backend_merge_insert_hashes_inside_insert_select():
+    backend = PostgresBackend(staging_schema=STAGING_SCHEMA)
+    session = _FakeSession()
+
+    backend.merge_insert(_HashedTableCls, _sess(session), _TARGET_TABLE)
+
+    assert session.statements == [
+        f'INSERT INTO "{_TARGET_TABLE}" ("id", "name", "row_hash")'
+        f' SELECT "id", "name", md5(ROW("id", "name")::text) FROM {_STAGING_TABLE_WITH_SCHEMA}'
+    ]
+
+
+class _CatalogSession:
+    """Fake session that answers catalog queries by SQL substring."""
+
+    def __init__(self, answers: dict[str, list[tuple]]) -> None:
+        self.answers = answers
+        self.statements: list[str] = []
+        self.commits = 0
+
+    def execute(self, statement, parameters=None):
+        sql = str(statement)
+        self.statements.append(sql)
+        rows = next((rows for key, rows in self.answers.items() if key in sql), [])
+
+        class _Result:
+            rowcount = len(rows)
+
+            def one(self):
+                return rows[0]
+
+            def scalar_one(self):
+                return rows[0][0]
+
+            def all(self):
+                return rows
+
+            def scalar(self):
+                return rows[0][0] if rows else None
+
+            def scalars(self):
+                return _Scalars()
+
+        class _Scalars:
+            def all(self):
+                return [r[0] for r in rows]
+
+        return _Result()
+
+    def commit(self) -> None:
+        self.statements.append("COMMIT")
+        self.commits += 1
+
+    def rollback(self) -> None:
+        self.statements.append("ROLLBACK")
+
+    def connection(self):
+        return self
+
+    def get_bind(self):
+        return None
+
+
+def _swap_answers(**overrides: list[tuple]) -> dict[str, list[tuple]]:
+    answers: dict[str, list[tuple]] = {
+        "SELECT c.oid, c.relkind": [(4242, "r", "public", "public.target_table")],
+        "pg_rewrite": [],
+        "contype IN ('p', 'u', 'x')": [("target_table_pkey", "PRIMARY KEY (id)")],
+        "pg_get_indexdef": [
+            ("ix_name", "CREATE INDEX ix_name ON public.target_table USING btree (name)", 5151),
+        ],
+        "conrelid = CAST(:target AS regclass) AND contype = 'f'": [
+            ("fk_parent", "FOREIGN KEY (id) REFERENCES parent(id)"),
+        ],
+        "confrelid = CAST(:target AS regclass)": [
+            ("child", "fk_child_target", "FOREIGN KEY (target_id) REFERENCES target_table(id)"),
+        ],
+        "pg_depend d JOIN pg_class s": [("id", "target_table_id_seq", "a")],
+    }
+    answers.update(overrides)
+    return answers
+
+
+def test_postgres_backend_merge_swap_builds_renames_and_revalidates():
+    backend = PostgresBackend(staging_schema=STAGING_SCHEMA)
+    session = _CatalogSession(_swap_answers())
+
+    backend.merge_swap(_ComputedTableCls, _sess(session), _TARGET_TABLE, ["id"])
+
+    sql = [s for s in session.statements if not s.lstrip().startswith("SELECT")]
+    new_ref = '"public"."_swap_target_table"'
+    target_ref = '"public"."target_table"'
+    assert sql[:7] == [
+        f"DROP TABLE IF EXISTS {new_ref}",
+        '''DROP TABLE IF EXISTS "public"."_old_target_table"''',
+        f"CREATE TABLE {new_ref} (LIKE {target_ref} INCLUDING ALL EXCLUDING INDEXES)",
+        f'INSERT INTO {new_ref} ("id", "name") SELECT "id", "name" FROM {_STAGING_TABLE_WITH_SCHEMA}',
+        f'ALTER TABLE {new_ref} ADD CONSTRAINT "_swap_4242_c0" PRIMARY KEY (id)',
+        f'CREATE INDEX "_swap_5151" ON {new_ref} USING btree (name)',
+        f"ANALYZE {new_ref}",
+    ]
+    swap = sql[sql.index("COMMIT") + 1:]
+    assert swap == [
+        "SET LOCAL lock_timeout = '5000ms'",
+        f"LOCK TABLE {target_ref} IN ACCESS EXCLUSIVE MODE",
+        "ALTER TABLE child DROP CONSTRAINT fk_child_target",
+        f'ALTER TABLE {target_ref} RENAME TO "_old_target_table"',
+        f'ALTER TABLE {new_ref} RENAME TO "target_table"',
+        f'ALTER SEQUENCE target_table_id_seq OWNED BY {target_ref}."id"',
+        f"ALTER TABLE {target_ref} ADD CONSTRAINT fk_parent FOREIGN KEY (id) REFERENCES parent(id) NOT VALID",
+        "ALTER TABLE child ADD CONSTRAINT fk_child_target FOREIGN KEY (target_id) REFERENCES target_table(id) NOT VALID",
+        "COMMIT",
+        '''DROP TABLE "public"."_old_target_table"''',
+        f'ALTER TABLE {target_ref} RENAME CONSTRAINT "_swap_4242_c0" TO target_table_pkey',
+        '''ALTER INDEX "public"."_swap_5151" RENAME TO ix_name''',
+        "COMMIT",
+        f"ALTER TABLE {target_ref} VALIDATE CONSTRAINT fk_parent",
+        "COMMIT",
+        "ALTER TABLE child VALIDATE CONSTRAINT fk_child_target",
+        "COMMIT",
+    ]
+
+
+def test_postgres_backend_merge_swap_escapes_catalog_definitions():
+    backend = PostgresBackend(lock_timeout_ms=250)
+    answers = _swap_answers(
+        **{
+            "pg_get_indexdef": [
+                (
+                    "ix_recent",
+                    "CREATE INDEX ix_recent ON public.target_table USING btree (name)"
+                    " WHERE (name <> ':draft'::text)",
+                    5151,
+                ),
+            ],
+            "conrelid = CAST(:target AS regclass) AND contype = 'f'": [
+                ("fk_parent", "FOREIGN KEY (id) REFERENCES \":parent\"(id)"),
+            ],
+        }
+    )
+    session = _CatalogSession(answers)
+    bound: list[str] = []
+    execute = session.execute
+
+    def _execute(statement, parameters=None):
+        bound.extend(getattr(statement, "_bindparams", {}))
+        return execute(statement, parameters)
+
+    session.execute = _execute
+
+    backend.merge_swap(_ComputedTableCls, _sess(session), _TARGET_TABLE, ["id"])
+
+    assert set(bound) <= {"target", "table", "column"}
+    assert 'CREATE INDEX "_swap_5151" ON "public"."_swap_target_table" USING btree (name)' \
+        " WHERE (name <> ':draft'::text)" in session.statements
+    assert any('REFERENCES ":parent"(id) NOT VALID' in s for s in session.statements)
+    lock = next(i for i, s in enumerate(session.statements) if s.startswith("LOCK TABLE"))
+    assert session.statements[lock - 1] == "SET LOCAL lock_timeout = '250ms'"
+
+
+def test_postgres_backend_merge_swap_cleans_up_before_reporting_failed_validation():
+    backend = PostgresBackend()
+    session = _CatalogSession(_swap_answers())
+    execute = session.execute
+
+    def _execute(statement, parameters=None):
+        if "VALIDATE CONSTRAINT fk_parent" in str(statement):
+            session.statements.append(str(statement))
+            raise RuntimeError("orphaned rows")
+        return execute(statement, parameters)
+
+    session.execute = _execute
+
+    with pytest.raises(IngestError, match="fk_parent") as excinfo:
+        backend.merge_swap(_ComputedTableCls, _sess(session), _TARGET_TABLE, ["id"])
+
+    assert "fk_child_target" not in str(excinfo.value)
+    tail = session.statements[session.statements.index('''DROP TABLE "public"."_old_target_table"'''):]
+    assert tail[1].endswith('RENAME CONSTRAINT "_swap_4242_c0" TO target_table_pkey')
+    assert tail[-4:] == [
+        '''ALTER TABLE "public"."target_table" VALIDATE CONSTRAINT fk_parent''',
+        "ROLLBACK",
+        "ALTER TABLE child VALIDATE CONSTRAINT fk_child_target",
+        "COMMIT",
+    ]
+
+
+def test_postgres_backend_merge_swap_rejects_dependent_views():
+    backend = PostgresBackend()
+    session = _CatalogSession(_swap_answers(pg_rewrite=[("report_view",)]))
+
+    with pytest.raises(ValueError, match="report_view"):
+        backend.merge_swap(_ComputedTableCls, _sess(session), _TARGET_TABLE, ["id"])
+    assert not any(s.startswith("CREATE TABLE") for s in session.statements)
+
+
+_JAN = (
+    '"public"."m_2024_01"', "public", "m_2024_01", "target_table",
+    "FOR VALUES FROM ('2024-01-01') TO ('2024-02-01')",
+    "((d IS NOT NULL) AND (d >= '2024-01-01'::date) AND (d < '2024-02-01'::date))",
+)
+_FEB = (
+    '"public"."m_2024_02"', "public", "m_2024_02", "target_table",
+    "FOR VALUES FROM ('2024-02-01') TO ('2024-03-01')",
+    "((d IS NOT NULL) AND (d >= '2024-02-01'::date) AND (d < '2024-03-01'::date))",
+)
+
+
+def _partition_answers(counts: tuple) -> dict[str, list[tuple]]:
+    return {
+        "pg_partitioned_table": [("r",)],
+        "pg_partition_tree": [_JAN, _FEB],
+        "SELECT COUNT(*), COALESCE": [counts],
+    }
+
+
+def test_postgres_backend_merge_replace_routes_deletes_to_affected_partitions():
+    backend = PostgresBackend()
+    session = _CatalogSession(_partition_answers((3, 0, 3)))
+
+    backend.merge_replace(_ComputedTableCls, _sess(session), _TARGET_TABLE, ["id"])
+
+    deletes = [s for s in session.statements if s.startswith("DELETE")]
+    assert deletes == [
+        'DELETE FROM "public"."m_2024_02" t USING (SELECT * FROM "_staging_target_table" WHERE '
+        "((d IS NOT NULL) AND (d >= '2024-02-01'::date) AND (d < '2024-03-01'::date))) s "
+        'WHERE t."id" = s."id"'
+    ]
+
+
+def test_postgres_backend_merge_replace_partitions_detaches_and_attaches():
+    backend = PostgresBackend()
+    session = _CatalogSession(_partition_answers((2, 2, 0)))
+
+    backend.merge_replace_partitions(_ComputedTableCls, _sess(session), _TARGET_TABLE, ["id"])
+
+    sql = [s for s in session.statements if not s.startswith("SELECT")]
+    new_ref = '"public"."_load_m_2024_01"'
+    assert sql[0:2] == [
+        f"DROP TABLE IF EXISTS {new_ref}",
+        f'CREATE TABLE {new_ref} (LIKE "public"."m_2024_01" INCLUDING ALL)',
+    ]
+    assert sql[2].startswith(f'INSERT INTO {new_ref} ("id", "name") SELECT "id", "name" FROM "_staging_target_table" WHERE ((d IS NOT NULL)')
+    assert sql[3].startswith(f'ALTER TABLE {new_ref} ADD CONSTRAINT "_load_m_2024_01_bound" CHECK (')
+    assert sql[5:] == [
+        "COMMIT",
+        "SET LOCAL lock_timeout = '5000ms'",
+        'ALTER TABLE target_table DETACH PARTITION "public"."m_2024_01"',
+        'DROP TABLE "public"."m_2024_01"',
+        f'ALTER TABLE {new_ref} RENAME TO "m_2024_01"',
+        """ALTER TABLE target_table ATTACH PARTITION "public"."m_2024_01" FOR VALUES FROM ('2024-01-01') TO ('2024-02-01')""",
+        'ALTER TABLE "public"."m_2024_01" DROP CONSTRAINT "_load_m_2024_01_bound"',
+        "COMMIT",
+    ]
+    assert not any("m_2024_02" in s for s in sql)
+
+
+def test_postgres_backend_merge_replace_partitions_rejects_unrouted_rows():
+    backend = PostgresBackend()
+    session = _CatalogSession(_partition_answers((5, 2, 2)))
+
+    with pytest.raises(ValueError, match="1 staging rows do not fall into any existing partition"):
+        backend.merge_replace_partitions(_ComputedTableCls, _sess(session), _TARGET_TABLE, ["id"])
+
+
+_FK_ANSWERS = {
+    "contype = 'f' ORDER BY conname": [
+        ("fk_a", "FOREIGN KEY (a_id) REFERENCES a(id)"),
+        ("fk_b", "FOREIGN KEY (b_id) REFERENCES b(id)"),
+    ],
+}
+
+
+def test_postgres_revalidate_foreign_keys_readds_not_valid_then_validates():
+    session = _CatalogSession(_FK_ANSWERS)
+
+    timings = PostgresBackend().revalidate_foreign_keys(cast(so.Session, session), "target_table")
+
+    assert set(timings) == {"fk_a", "fk_b"}
+    assert (
+        'ALTER TABLE "target_table" DROP CONSTRAINT fk_a, '
+        "ADD CONSTRAINT fk_a FOREIGN KEY (a_id) REFERENCES a(id) NOT VALID"
+    ) in session.statements
+    first_validate = session.statements.index('ALTER TABLE "target_table" VALIDATE CONSTRAINT fk_a')
+    assert session.statements.index("COMMIT") < first_validate
+
+
+def test_postgres_revalidate_foreign_keys_commits_through_the_session():
+    class _NoRawConnection(_CatalogSession):
+        def connection(self):
+            raise AssertionError("validation must go through the session")
+
+    session = _NoRawConnection(_FK_ANSWERS)
+
+    PostgresBackend().revalidate_foreign_keys(cast(so.Session, session), "target_table")
+
+    assert session.statements[-4:] == [
+        'ALTER TABLE "target_table" VALIDATE CONSTRAINT fk_a',
+        "COMMIT",
+        'ALTER TABLE "target_table" VALIDATE CONSTRAINT fk_b',
+        "COMMIT",
+    ]
+
+
+def test_postgres_revalidate_foreign_keys_reports_failures():
+    class _FailingSession(_CatalogSession):
+        def execute(self, statement, parameters=None):
+            if "VALIDATE CONSTRAINT fk_a" in str(statement):
+                raise RuntimeError("insert or update violates foreign key constraint")
+            return super().execute(statement, parameters)
+
+    session = _FailingSession(_FK_ANSWERS)
+
+    with pytest.raises(IngestError, match="fk_a"):
+        PostgresBackend().revalidate_foreign_keys(cast(so.Session, session), "target_table")
+    assert 'ALTER TABLE "target_table" VALIDATE CONSTRAINT fk_b' in session.statements
+
+
+def test_postgres_truncate_staging_table_restarts_identity():
+    session = _CatalogSession({})
+
+    PostgresBackend().truncate_staging_table(_HashedTableCls, cast(so.Session, session))
+
+    assert session.statements == [
+        f'TRUNCATE TABLE "_staging_{_TARGET_TABLE}" RESTART IDENTITY',
+        "COMMIT",
+    ]
+
+
+def test_postgres_fill_staging_ids_numbers_missing_keys_from_one_block():
+    session = _CatalogSession({"SELECT COUNT(*)": [(3,)]})
+    allocator = IdAllocator(100)
+
+    assigned = PostgresBackend().fill_staging_ids(
+        _HashedTableCls, cast(so.Session, session), "id", allocator=allocator
+    )
+
+    assert assigned == 3
+    assert allocator.next() == 104
+    update = session.statements[1]
+    assert update.startswith(f'UPDATE "_staging_{_TARGET_TABLE}" AS s SET "id" = :start - 1 + n.rn')
+    assert "row_number() OVER (ORDER BY _rownum)" in update
+    assert session.statements[-1] == "COMMIT"
+
+
+def test_postgres_fill_staging_ids_uses_sequence_nextval():
+    session = _CatalogSession({"nextval": [(1,), (2,)]})
+
+    assigned = PostgresBackend().fill_staging_ids(
+        _HashedTableCls, cast(so.Session, session), "id", sequence="target_id_seq"
+    )
+
+    assert assigned == 2
+    assert session.statements == [
+        f'UPDATE "_staging_{_TARGET_TABLE}" SET "id" = nextval(CAST(:sequence AS regclass)) WHERE "id" IS NULL',
+        "COMMIT",
+    ]
+
+
+def test_postgres_prepare_staging_ids_drops_not_null():
+    session = _CatalogSession({})
+
+    PostgresBackend().prepare_staging_ids(_HashedTableCls, cast(so.Session, session), "id")
+
+    assert session.statements == [
+        f'ALTER TABLE "_staging_{_TARGET_TABLE}" ALTER COLUMN "id" DROP NOT NULL',
+        "COMMIT",
+    ]
+
+
+def test_postgres_staging_table_for_mirrors_like_ddl():
+    staging = PostgresBackend(staging_schema=STAGING_SCHEMA).staging_table_for(_HashedTableCls)
+
+    assert staging.schema == STAGING_SCHEMA
+    assert staging.name == f"_staging_{_TARGET_TABLE}"
+    assert [c.name for c in staging.columns] == ["id", "name", "row_hash", "_rownum"]
+    assert staging.c._rownum.identity is not None
+    assert PostgresBackend().staging_table_for(_HashedTableCls) is not staging
+
+
+def test_postgres_insert_ignore_uses_on_conflict_do_nothing():
+    table = sa.Table("t", sa.MetaData(), sa.Column("name", sa.String, primary_key=True))
+
+    stmt = PostgresBackend().insert_ignore(table).values(name="x")
+
+    assert "ON CONFLICT DO NOTHING" in str(stmt.compile(dialect=postgresql.dialect()))
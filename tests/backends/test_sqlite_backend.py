@@ -4,10 +4,11 @@ import sqlite3
 from pathlib import Path
 from typing import TYPE_CHECKING, Type, cast
 
+import pytest
 import sqlalchemy as sa
 import sqlalchemy.orm as so
 
-from orm_loader.backends import Dialect, SQLiteBackend
+from orm_loader.backends import Dialect, SQLiteBackend, ViewIndex
 from orm_loader.helpers.sqlite import attach_sqlite_bulk_load_pragmas
 
 if TYPE_CHECKING:
@@ -63,6 +64,10 @@ def test_sqlite_backend_identity_and_capabilities():
     assert backend.capabilities.supports_unlogged_staging is False
     assert backend.capabilities.supports_fk_toggle is True
     assert backend.capabilities.supports_materialized_views is False
+    assert backend.capabilities.supports_table_swap is False
+    assert backend.capabilities.supports_partitioning is False
+    assert backend.capabilities.supports_concurrent_index_build is False
+    assert backend.capabilities.supports_fk_revalidation is False
     assert backend.resolve_index_strategy("auto") == "keep"
     assert backend.journal_mode == "WAL"
 
@@ -78,6 +83,17 @@ def test_sqlite_backend_create_staging_table(session, engine):
     assert all(c["nullable"] is True for c in cols)
 
 
+def test_sqlite_backend_staging_table_for_is_memoised_and_matches_ddl(session, engine):
+    backend = SQLiteBackend()
+
+    staging = backend.staging_table_for(_ComputedTableCls)
+    backend.create_staging_table(_ComputedTableCls, session)
+
+    assert SQLiteBackend().staging_table_for(_ComputedTableCls) is staging
+    assert staging.name == _STAGING_TABLE
+    assert [c.name for c in staging.columns] == [c["name"] for c in sa.inspect(engine).get_columns(_STAGING_TABLE)]
+
+
 def test_sqlite_backend_drop_staging_table():
     backend = SQLiteBackend()
     session = _FakeSession()
@@ -204,23 +220,88 @@ def test_sqlite_backend_merge_upsert_excludes_computed_columns():
     assert f'INSERT OR IGNORE INTO "{_TARGET_TABLE}" ("id", "name")' in sql
 
 
-def test_sqlite_backend_materialized_view_methods_raise(engine):
+def test_sqlite_backend_emulates_materialized_views(engine):
     backend = SQLiteBackend()
-    selectable = sa.select(sa.literal(1).label("n"))
+    metadata = sa.MetaData()
+    source = sa.Table("mv_source", metadata, sa.Column("k", sa.Integer), sa.Column("v", sa.String))
+    metadata.create_all(engine)
+    selectable = sa.select(source.c.k, sa.func.count().label("n")).where(source.c.v != "10:00").group_by(source.c.k)
 
-    try:
-        backend.create_materialized_view(engine, "mv_test", selectable)
-    except NotImplementedError as exc:
-        assert "does not support materialized views" in str(exc)
-    else:
-        raise AssertionError("Expected create_materialized_view() to raise NotImplementedError")
+    with engine.begin() as conn:
+        conn.execute(sa.insert(source), [{"k": 1, "v": "a"}, {"k": 1, "v": "b"}])
+        conn.exec_driver_sql("CREATE VIEW mv_test_report AS SELECT n FROM mv_test")
+
+    backend.create_materialized_view(engine, "mv_test", selectable, indexes=(ViewIndex(("k",), unique=True),))
+    with engine.begin() as conn:
+        conn.execute(sa.insert(source), [{"k": 2, "v": "c"}])
+    backend.refresh_materialized_view(engine, "mv_test")
+
+    assert backend.capabilities.supports_materialized_view_emulation is True
+    with engine.connect() as conn:
+        assert conn.execute(sa.text("SELECT k, n FROM mv_test ORDER BY k")).all() == [(1, 2), (2, 1)]
+        assert conn.execute(sa.text("SELECT count(*) FROM mv_test_report")).scalar() == 2
+    assert {ix["name"]: ix["unique"] for ix in sa.inspect(engine).get_indexes("mv_test")} == {"ux_mv_test_k": 1}
+
+
+def test_sqlite_backend_rebuilds_view_when_definition_changes(engine):
+    backend = SQLiteBackend()
+    metadata = sa.MetaData()
+    source = sa.Table("mv_source", metadata, sa.Column("k", sa.Integer), sa.Column("v", sa.Integer))
+    metadata.create_all(engine)
+    with engine.begin() as conn:
+        conn.execute(sa.insert(source), [{"k": 1, "v": 5}, {"k": 2, "v": 7}])
+
+    backend.create_materialized_view(engine, "mv_test", sa.select(source.c.k))
+    backend.create_materialized_view(engine, "mv_test", sa.select(source.c.k, source.c.v).where(source.c.k > 1))
+    backend.refresh_materialized_view(engine, "mv_test")
+
+    with engine.connect() as conn:
+        assert conn.execute(sa.text("SELECT k, v FROM mv_test")).all() == [(2, 7)]
+        stored = conn.execute(
+            sa.text("SELECT definition FROM _orm_loader_materialized_views WHERE name = 'mv_test'")
+        ).scalar()
+    assert "WHERE" in stored
+
+
+def test_sqlite_backend_refresh_on_connection_is_atomic(tmp_path: Path):
+    engine = sa.create_engine(f"sqlite:///{tmp_path / 'mv.db'}")
+    backend = SQLiteBackend()
+    metadata = sa.MetaData()
+    source = sa.Table("mv_source", metadata, sa.Column("k", sa.Integer))
+    metadata.create_all(engine)
+    with engine.begin() as conn:
+        conn.execute(sa.insert(source), [{"k": 1}])
+    backend.create_materialized_view(engine, "mv_test", sa.select(source.c.k))
+
+    def _fail_rename(conn, cursor, statement, parameters, context, executemany):
+        if "RENAME TO" in statement:
+            raise RuntimeError("rename failed")
+
+    with engine.connect() as conn:
+        sa.event.listen(conn, "before_cursor_execute", _fail_rename)
+        with pytest.raises(RuntimeError, match="rename failed"):
+            backend.refresh_materialized_view(conn, "mv_test")
+        conn.rollback()
+
+    with engine.connect() as conn:
+        assert conn.execute(sa.text("SELECT k FROM mv_test")).scalars().all() == [1]
+        assert "_orm_loader_mv_build_mv_test" not in sa.inspect(conn).get_table_names()
+
+
+def test_sqlite_backend_refresh_of_unknown_view_raises(engine):
+    with pytest.raises(ValueError, match="has not been created"):
+        SQLiteBackend().refresh_materialized_view(engine, "mv_missing")
+
+
+def test_sqlite_backend_merge_swap_raises():
+    backend = SQLiteBackend()
 
     try:
-        backend.refresh_materialized_view(engine, "mv_test")
+        backend.merge_swap(_ComputedTableCls, _sess(_FakeSession()), _TARGET_TABLE, ["id"])
     except NotImplementedError as exc:
-        assert "does not support materialized views" in str(exc)
+        assert "does not support swap-in table loads" in str(exc)
     else:
-        raise AssertionError("Expected refresh_materialized_view() to raise NotImplementedError")
+        raise AssertionError("Expected merge_swap() to raise NotImplementedError")
 
 
 def test_sqlite_backend_configures_bulk_load_pragmas(tmp_path: Path):
@@ -331,3 +412,14 @@ def test_sqlite_backend_fk_toggle_round_trip(session):
 
     backend.restore_fk_check(session, previous)
     assert session.execute(sa.text("PRAGMA foreign_keys")).scalar() == 1
+
+
+def test_sqlite_backend_estimate_row_count_reads_sqlite_stat1(session):
+    backend = SQLiteBackend()
+    assert backend.estimate_row_count(session, "test_table") is None
+
+    session.execute(sa.text("INSERT INTO test_table (id, name) VALUES (1, 'a'), (2, 'b'), (3, 'c')"))
+    session.execute(sa.text("ANALYZE"))
+
+    assert backend.estimate_row_count(session, "test_table") == 3
+    assert backend.estimate_row_count(session, "missing_table") is None
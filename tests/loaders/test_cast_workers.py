@@ -0,0 +1,93 @@
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+import sqlalchemy as sa
+
+from orm_loader.loaders.cast_workers import cast_in_processes
+from orm_loader.loaders.data.converters import _COLUMN_CAST_RULES, register_column_cast_rule
+from orm_loader.loaders.data_classes import LoaderContext, TableCastingStats
+from orm_loader.loaders.loader_interface import PandasLoader, ParquetLoader
+from tests.models import PandasLoaderTable
+
+@pytest.fixture(autouse=True)
+def _clear_column_cast_rules():
+    _COLUMN_CAST_RULES.clear()
+    yield
+    _COLUMN_CAST_RULES.clear()
+
+
+def _shout(value):
+    if value == "bad":
+        raise ValueError(value)
+    return value.upper()
+
+
+def test_table_casting_stats_merge_caps_examples():
+    left = TableCastingStats(table_name="t")
+    right = TableCastingStats(table_name="t")
+    for v in ("a", "b"):
+        left.record(column="c", value=v)
+    for v in ("x", "y"):
+        right.record(column="c", value=v)
+    right.record(column="d", value="z")
+
+    left.merge(right)
+
+    assert left.to_dict() == {"c": {"count": 4, "examples": ["a", "b", "x"]}, "d": {"count": 1, "examples": ["z"]}}
+
+
+def test_cast_in_processes_keeps_order_and_merges_stats():
+    register_column_cast_rule("test_pandas_loader", "value", _shout)
+    chunks = [pa.table({"id": [str(i)], "value": ["bad" if i == 2 else f"v{i}"]}) for i in range(5)]
+    stats = TableCastingStats(table_name="test_pandas_loader")
+
+    out = list(cast_in_processes(ParquetLoader, PandasLoaderTable, chunks, workers=2, stats=stats))
+
+    # The failed cast leaves a null in a required column, so that row is dropped.
+    assert [t["value"].to_pylist() for t in out] == [["V0"], ["V1"], [], ["V3"], ["V4"]]
+    assert stats.to_dict() == {"value": {"count": 1, "examples": ["bad"]}}
+
+
+def test_cast_in_processes_rejects_unpicklable_rules():
+    register_column_cast_rule("test_pandas_loader", "value", lambda v: v)
+    chunks = [pa.table({"id": ["1"], "value": ["a"]})]
+    stats = TableCastingStats(table_name="test_pandas_loader")
+
+    with pytest.raises(ValueError, match="test_pandas_loader.value"):
+        list(cast_in_processes(ParquetLoader, PandasLoaderTable, chunks, workers=2, stats=stats))
+
+
+def test_pandas_loader_casts_in_worker_processes(tmp_path, session):
+    register_column_cast_rule("test_pandas_loader", "value", _shout)
+    csv = tmp_path / "test_pandas_loader.csv"
+    csv.write_text("id,value\n" + "".join(f"{i},v{i}\n" for i in range(1, 7)))
+
+    ctx = LoaderContext(
+        tableclass=PandasLoaderTable,
+        session=session,
+        path=csv,
+        staging_table=PandasLoaderTable.__table__,
+        chunksize=2,
+        cast_workers=2,
+    )
+
+    n = PandasLoader.orm_file_load(ctx)
+
+    rows = session.execute(sa.text("SELECT id, value FROM test_pandas_loader ORDER BY id")).all()
+    assert n == 6
+    assert rows == [(i, f"V{i}") for i in range(1, 7)]
+
+
+def test_load_csv_parquet_with_cast_workers(tmp_path, session):
+    path = tmp_path / "test_pandas_loader.parquet"
+    pq.write_table(pa.table({"id": ["1", "2", "3"], "value": ["a", "b", "c"]}), path)
+
+    PandasLoaderTable.load_csv(session, path, chunksize=1, cast_workers=2)
+
+    rows = session.execute(sa.text("SELECT id, value FROM test_pandas_loader ORDER BY id")).all()
+    assert rows == [(1, "a"), (2, "b"), (3, "c")]
+
+
+def test_load_csv_rejects_non_positive_cast_workers(tmp_path, session):
+    with pytest.raises(ValueError, match="cast_workers"):
+        PandasLoaderTable.load_csv(session, tmp_path / "test_pandas_loader.csv", cast_workers=0)
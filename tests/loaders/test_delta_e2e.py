@@ -0,0 +1,241 @@
+from typing import Type, cast
+
+import pandas as pd
+import pytest
+import sqlalchemy as sa
+
+from orm_loader.backends import resolve_backend
+from orm_loader.helpers.errors import IngestError
+from orm_loader.loaders.data_classes import LoaderContext
+from orm_loader.loaders.loader_interface import PandasLoader
+from orm_loader.tables.typing import CSVTableProtocol
+from tests.models import HashedTable, SimpleTable
+
+_HashedTable = cast(Type[CSVTableProtocol], HashedTable)
+_SimpleTable = cast(Type[CSVTableProtocol], SimpleTable)
+
+
+def _write(tmp_path, rows):
+    csv_path = tmp_path / "hashed_table.csv"
+    pd.DataFrame(rows).to_csv(csv_path, index=False, sep="\t")
+    return csv_path
+
+
+def _context(session, path, staging):
+    return LoaderContext(
+        tableclass=_HashedTable,
+        session=session,
+        path=path,
+        staging_table=staging,
+        chunksize=None,
+        normalise=True,
+        dedupe=False,
+    )
+
+
+def _hashes(session) -> dict[int, str]:
+    return dict(session.execute(sa.select(HashedTable.id, HashedTable.row_hash)).all())  # type: ignore[arg-type]
+
+
+def test_row_hash_column_is_not_read_from_file():
+    assert "row_hash" not in HashedTable.csv_columns()
+    assert set(HashedTable.csv_columns()) == {"id", "name", "score"}
+
+
+def test_load_csv_populates_row_hashes(session, tmp_path):
+    csv_path = _write(tmp_path, [{"id": 1, "name": "a", "score": 1}, {"id": 2, "name": "b", "score": None}])
+
+    _HashedTable.load_csv(session, csv_path, loader=PandasLoader())
+
+    hashes = _hashes(session)
+    assert set(hashes) == {1, 2}
+    assert all(h is not None and len(h) == 32 for h in hashes.values())
+    assert hashes[1] != hashes[2]
+
+
+def test_row_hash_is_stable_and_content_sensitive(session, tmp_path):
+    _HashedTable.load_csv(
+        session, _write(tmp_path, [{"id": 1, "name": "a", "score": 1}, {"id": 2, "name": "b", "score": 2}]),
+        loader=PandasLoader(),
+    )
+    before = _hashes(session)
+
+    _HashedTable.load_csv(
+        session, _write(tmp_path, [{"id": 1, "name": "a", "score": 1}, {"id": 2, "name": "b", "score": 3}]),
+        loader=PandasLoader(),
+    )
+    after = _hashes(session)
+
+    assert after[1] == before[1]
+    assert after[2] != before[2]
+
+
+def test_classify_staging_reports_new_changed_unchanged_deleted(session, tmp_path):
+    _HashedTable.load_csv(
+        session,
+        _write(tmp_path, [
+            {"id": 1, "name": "a", "score": 1},
+            {"id": 2, "name": "b", "score": 2},
+            {"id": 3, "name": "c", "score": None},
+        ]),
+        loader=PandasLoader(),
+    )
+
+    csv_path = _write(tmp_path, [
+        {"id": 1, "name": "a", "score": 1},
+        {"id": 2, "name": "b", "score": None},
+        {"id": 4, "name": "d", "score": 4},
+    ])
+    _HashedTable.create_staging_table(session)
+    staging = _HashedTable.get_staging_table(session)
+    PandasLoader().orm_file_load(ctx=_context(session, csv_path, staging))
+
+    counts = _HashedTable.classify_staging(session)
+
+    assert counts == {"new": 1, "changed": 1, "unchanged": 1, "deleted": 1}
+    _HashedTable.drop_staging_table(session)
+
+
+def test_compute_row_hashes_backfills_missing(session):
+    session.execute(
+        sa.insert(HashedTable),
+        [{"id": 1, "name": "a", "score": 1, "row_hash": None}, {"id": 2, "name": "b", "score": 2, "row_hash": "keep"}],
+    )
+
+    _HashedTable.compute_row_hashes(session)
+
+    hashes = _hashes(session)
+    assert hashes[1] is not None and len(hashes[1]) == 32
+    assert hashes[2] == "keep"
+
+
+def test_row_hash_requires_opt_in(session):
+    with pytest.raises(ValueError, match="__row_hash_column__"):
+        _SimpleTable.compute_row_hashes(session)
+
+
+
+def _rows(session, table) -> list[tuple]:
+    return [tuple(r) for r in session.execute(sa.select(table.id, table.name).order_by(table.id)).all()]
+
+
+def test_sync_inserts_updates_and_deletes(session, tmp_path):
+    csv_path = tmp_path / "test_table.csv"
+    pd.DataFrame([{"id": i, "name": f"n{i}"} for i in range(1, 6)]).to_csv(csv_path, index=False, sep="\t")
+    _SimpleTable.load_csv(session, csv_path, loader=PandasLoader())
+
+    pd.DataFrame(
+        [{"id": 1, "name": "n1"}, {"id": 2, "name": "changed"}, {"id": 4, "name": "n4"}, {"id": 7, "name": "n7"}]
+    ).to_csv(csv_path, index=False, sep="\t")
+    _SimpleTable.load_csv(session, csv_path, loader=PandasLoader(), merge_strategy="sync")
+
+    assert _rows(session, SimpleTable) == [(1, "n1"), (2, "changed"), (4, "n4"), (7, "n7")]
+
+
+@pytest.mark.parametrize("merge_batch_size", [None, 2, 100])
+def test_sync_backend_counts_with_pk_ranges(session, tmp_path, merge_batch_size):
+    _HashedTable.load_csv(
+        session,
+        _write(tmp_path, [{"id": i, "name": f"n{i}", "score": i} for i in range(1, 8)]),
+        loader=PandasLoader(),
+    )
+
+    csv_path = _write(tmp_path, [
+        {"id": 1, "name": "n1", "score": 1},
+        {"id": 2, "name": "n2", "score": None},
+        {"id": 5, "name": "n5", "score": 5},
+        {"id": 9, "name": "n9", "score": 9},
+    ])
+    _HashedTable.create_staging_table(session)
+    PandasLoader().orm_file_load(ctx=_context(session, csv_path, _HashedTable.get_staging_table(session)))
+    backend = resolve_backend(session)
+
+    counts = backend.merge_sync(
+        _HashedTable, session, HashedTable.__tablename__, ["id"], merge_batch_size=merge_batch_size
+    )
+    session.commit()
+
+    assert counts == {"deleted": 4, "updated": 1, "inserted": 1}
+    assert [r[0] for r in _rows(session, HashedTable)] == [1, 2, 5, 9]
+    assert session.get(HashedTable, 2).score is None
+    assert _HashedTable.classify_staging(session) == {"new": 0, "changed": 0, "unchanged": 4, "deleted": 0}
+
+
+def test_replace_on_hashed_table_rewrites_only_changed_rows(session, tmp_path):
+    _HashedTable.load_csv(
+        session,
+        _write(tmp_path, [{"id": i, "name": f"n{i}", "score": i} for i in range(1, 5)]),
+        loader=PandasLoader(),
+    )
+    session.execute(sa.text("CREATE TABLE touched (op TEXT, id INTEGER)"))
+    session.execute(sa.text(
+        "CREATE TRIGGER log_update AFTER UPDATE ON hashed_table"
+        " BEGIN INSERT INTO touched VALUES ('update', NEW.id); END"
+    ))
+    session.execute(sa.text(
+        "CREATE TRIGGER log_delete AFTER DELETE ON hashed_table"
+        " BEGIN INSERT INTO touched VALUES ('delete', OLD.id); END"
+    ))
+    session.commit()
+
+    _HashedTable.load_csv(
+        session,
+        _write(tmp_path, [
+            {"id": 1, "name": "n1", "score": 1},
+            {"id": 2, "name": "changed", "score": 2},
+            {"id": 9, "name": "n9", "score": 9},
+        ]),
+        loader=PandasLoader(),
+        merge_strategy="replace",
+    )
+
+    assert session.execute(sa.text("SELECT op, id FROM touched")).all() == [("update", 2)]
+    assert [r[0] for r in _rows(session, HashedTable)] == [1, 2, 3, 4, 9]
+    # The hash written by the merge matches one recomputed from the stored row.
+    merged = _hashes(session)
+    _HashedTable.compute_row_hashes(session, only_missing=False)
+    assert _hashes(session) == merged
+
+
+def test_sync_pages_sparse_keys_without_empty_batches(session, tmp_path, monkeypatch):
+    _HashedTable.load_csv(
+        session,
+        _write(tmp_path, [
+            {"id": 1, "name": "n1", "score": 1},
+            {"id": 5_000_000, "name": "n5", "score": 5},
+            {"id": 9_000_000, "name": "n9", "score": 9},
+        ]),
+        loader=PandasLoader(),
+    )
+    csv_path = _write(tmp_path, [
+        {"id": 1, "name": "n1", "score": 1},
+        {"id": 3_000_000, "name": "new", "score": 3},
+        {"id": 9_000_000, "name": "n9", "score": 9},
+    ])
+    _HashedTable.create_staging_table(session)
+    PandasLoader().orm_file_load(ctx=_context(session, csv_path, _HashedTable.get_staging_table(session)))
+    backend = resolve_backend(session)
+
+    commits = []
+    monkeypatch.setattr(session, "commit", lambda: commits.append(1))
+    counts = backend.merge_sync(_HashedTable, session, HashedTable.__tablename__, ["id"], merge_batch_size=2)
+
+    # Two pages of staged keys plus the trailing delete, however wide the key gaps are.
+    assert len(commits) == 3
+    assert counts == {"deleted": 1, "updated": 0, "inserted": 1}
+    assert [r[0] for r in _rows(session, HashedTable)] == [1, 3_000_000, 9_000_000]
+
+
+def test_sync_refuses_empty_file_unless_allowed(session, tmp_path):
+    csv_path = tmp_path / "test_table.csv"
+    pd.DataFrame([{"id": i, "name": f"n{i}"} for i in range(1, 4)]).to_csv(csv_path, index=False, sep="\t")
+    _SimpleTable.load_csv(session, csv_path, loader=PandasLoader())
+    csv_path.write_text("id\tname\n")
+
+    with pytest.raises(IngestError, match="allow_empty"):
+        _SimpleTable.load_csv(session, csv_path, loader=PandasLoader(), merge_strategy="sync")
+    session.rollback()
+    assert _rows(session, SimpleTable) == [(1, "n1"), (2, "n2"), (3, "n3")]
+
+    _SimpleTable.load_csv(session, csv_path, loader=PandasLoader(), merge_strategy="sync", allow_empty=True)
+    assert _rows(session, SimpleTable) == []
@@ -2,26 +2,25 @@ from pathlib import Path
 
 import pytest
 
-import io
+import threading
+import time
 
+import pandas as pd
+
+from orm_loader.helpers import IngestError
 from orm_loader.loaders.data_classes import ColumnCastingStats, TableCastingStats
 from orm_loader.loaders.loading_helpers import (
-    NormalisedCSVStream,
+    MappedCSVSource,
+    conservative_load_parquet,
     infer_delim,
     infer_encoding,
     infer_quote_mode,
+    pipeline_chunks,
     resolve_quote_mode,
+    rows_for_budget,
 )
 
 
-def test_normalised_csv_stream_strips_quoted_header_with_leading_whitespace():
-    # A space after the delimiter is ordinary, valid CSV ('"id", "name"') --
-    # stripping the quote before trimming whitespace leaves a stray leading
-    # quote on any token but the first.
-    raw = b'"id", "name"\n1,alpha\n'
-    stream = NormalisedCSVStream(io.BytesIO(raw), encoding="utf-8", delimiter=",")
-    assert stream.read() == b"id,name\n1,alpha\n"
-
 def test_column_casting_stats_records_examples():
     stats = ColumnCastingStats()
     stats.record("bad1")
@@ -133,3 +132,134 @@ def test_resolve_quote_mode_auto_clean_file_returns_csv(tmp_path):
 def test_resolve_quote_mode_unknown_raises(tmp_path):
     with pytest.raises(ValueError, match="Unknown quote_mode"):
         resolve_quote_mode("bogus", tmp_path / "x.csv", ",")
+
+
+def test_pipeline_chunks_preserves_order_and_bounds_queue():
+    produced: list[int] = []
+
+    def chunks():
+        for i in range(5):
+            produced.append(i)
+            yield pd.DataFrame({"i": [i]})
+
+    it = pipeline_chunks(chunks(), depth=1)
+    first = next(it)
+    time.sleep(0.05)
+
+    # One chunk handed over, one queued, one being prepared at most.
+    assert first["i"].tolist() == [0]
+    assert len(produced) <= 3
+    assert [c["i"].iloc[0] for c in it] == [1, 2, 3, 4]
+
+
+def test_pipeline_chunks_memory_budget_holds_producer():
+    produced: list[int] = []
+
+    def chunks():
+        for i in range(3):
+            produced.append(i)
+            yield pd.DataFrame({"v": ["x" * 1000] * 100})
+
+    it = pipeline_chunks(chunks(), depth=10, memory_budget_bytes=1)
+    next(it)
+    time.sleep(0.05)
+
+    # The first chunk is still being written, so the next one waits.
+    assert produced == [0, 1]
+    assert len(list(it)) == 2
+
+
+def test_pipeline_chunks_reraises_producer_errors():
+    def chunks():
+        yield pd.DataFrame({"i": [1]})
+        raise IngestError("bad chunk")
+
+    it = pipeline_chunks(chunks(), depth=2)
+    next(it)
+    with pytest.raises(IngestError, match="bad chunk"):
+        next(it)
+
+
+def test_pipeline_chunks_close_stops_producer():
+    def chunks():
+        while True:
+            yield pd.DataFrame({"i": [1]})
+
+    it = pipeline_chunks(chunks(), depth=1)
+    next(it)
+    it.close()
+
+    assert not any(t.name == "orm-loader-pipeline" for t in threading.enumerate())
+
+
+def test_rows_for_budget_allows_headroom():
+    assert rows_for_budget(1024, 3) == 1024
+    assert rows_for_budget(10**9, 1) == 1
+
+
+def test_conservative_load_parquet_treats_chunksize_as_rows(tmp_path):
+    path = tmp_path / "wide.csv"
+    path.write_text("id,text\n" + "".join(f"{i},{'x' * 500}\n" for i in range(2000)))
+
+    batches = list(conservative_load_parquet(path, ["id", "text"], chunksize=500))
+
+    # 500 rows of ~505 bytes is a ~250 KB block, not a 500 byte one.
+    assert sum(b.num_rows for b in batches) == 2000
+    assert 2 <= len(batches) <= 8
+
+
+def _mapped(path, block_size=8):
+    with MappedCSVSource(path, encoding="utf-8", delimiter=",", block_size=block_size) as source:
+        return [bytes(b) for b in source.blocks()]
+
+
+def test_mapped_csv_source_passes_lf_body_through_as_views(tmp_path):
+    path = tmp_path / "lf.csv"
+    path.write_bytes(b'"ID","Name_hash"\n1,a\r\n2,b\n')
+
+    with MappedCSVSource(path, encoding="utf-8", delimiter=",", block_size=4) as source:
+        blocks = list(source.blocks())
+        assert all(isinstance(b, memoryview) for b in blocks[1:])
+        data = [bytes(b) for b in blocks]
+        del blocks
+
+    # Header rewritten; body bytes untouched since the file is not CR/CRLF.
+    assert data[0] == b"id,name\n"
+    assert b"".join(data[1:]) == b"1,a\r\n2,b\n"
+
+
+def test_mapped_csv_source_strips_quoted_header_with_leading_whitespace(tmp_path):
+    # A space after the delimiter is ordinary, valid CSV ('"id", "name"') --
+    # stripping the quote before trimming whitespace leaves a stray leading
+    # quote on any token but the first.
+    path = tmp_path / "spaced.csv"
+    path.write_bytes(b'"id", "name"\n1,alpha\n')
+
+    assert b"".join(_mapped(path)) == b"id,name\n1,alpha\n"
+
+
+def test_mapped_csv_source_translates_crlf_across_block_boundaries(tmp_path):
+    path = tmp_path / "crlf.csv"
+    path.write_bytes(b"id,name\r\n1,abcd\r\n2,efg\r\n")
+
+    blocks = _mapped(path, block_size=7)
+
+    assert blocks[0] == b"id,name\n"
+    assert b"".join(blocks[1:]) == b"1,abcd\n2,efg\n"
+
+
+def test_mapped_csv_source_translates_bare_cr(tmp_path):
+    path = tmp_path / "cr.csv"
+    path.write_bytes(b"id,name\r1,a\r2,b\r")
+
+    blocks = _mapped(path)
+
+    assert blocks[0] == b"id,name\n"
+    assert b"".join(blocks[1:]) == b"1,a\n2,b\n"
+
+
+def test_mapped_csv_source_empty_file_yields_nothing(tmp_path):
+    path = tmp_path / "empty.csv"
+    path.write_bytes(b"")
+
+    assert _mapped(path) == []
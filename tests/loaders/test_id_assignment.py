@@ -0,0 +1,108 @@
+from pathlib import Path
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+import sqlalchemy as sa
+
+from orm_loader.loaders.data_classes import LoaderContext
+from orm_loader.loaders.loader_interface import PandasLoader, ParquetLoader
+from orm_loader.loaders.loading_helpers import assign_ids_arrow, assign_ids_pandas
+from orm_loader.tables import IdAllocator
+from tests.models import PandasLoaderTable
+
+
+def test_assign_ids_pandas_fills_only_missing_keys():
+    df = pd.DataFrame({"id": [None, "7", "NULL", ""], "value": ["a", "b", "c", "d"]}, dtype=object)
+
+    out = assign_ids_pandas(df, "id", IdAllocator(100))
+
+    assert out["id"].tolist() == [101, "7", 102, 103]
+
+
+def test_assign_ids_pandas_adds_missing_column():
+    df = pd.DataFrame({"value": ["a", "b"]})
+
+    out = assign_ids_pandas(df, "id", IdAllocator(0))
+
+    assert out["id"].tolist() == [1, 2]
+
+
+def test_assign_ids_arrow_fills_typed_and_string_columns():
+    allocator = IdAllocator(10)
+    typed = pa.table({"id": pa.array([None, 3, None], type=pa.int32())})
+    raw = pa.table({"id": pa.array(["", "4", None])})
+
+    assert assign_ids_arrow(typed, "id", allocator)["id"].to_pylist() == [11, 3, 12]
+    assert assign_ids_arrow(raw, "id", allocator)["id"].to_pylist() == ["13", "4", "14"]
+
+
+def test_assign_ids_arrow_adds_missing_column():
+    out = assign_ids_arrow(pa.table({"value": [1, 2, 3]}), "id", IdAllocator(0))
+
+    assert out["id"].to_pylist() == [1, 2, 3]
+
+
+def test_pandas_loader_assigns_ids_before_dedupe(tmp_path, session):
+    csv = tmp_path / "test_pandas_loader.csv"
+    csv.write_text("id,value\n,alpha\n5,beta\n,gamma\n")
+
+    ctx = LoaderContext(
+        tableclass=PandasLoaderTable,
+        session=session,
+        path=csv,
+        staging_table=PandasLoaderTable.__table__,
+        chunksize=2,
+        dedupe=True,
+        id_allocator=IdAllocator(100),
+        id_column="id",
+    )
+
+    n = PandasLoader.orm_file_load(ctx)
+
+    rows = session.execute(sa.text("SELECT id, value FROM test_pandas_loader ORDER BY value")).all()
+    assert n == 3
+    assert rows == [(101, "alpha"), (5, "beta"), (102, "gamma")]
+
+
+def test_parquet_loader_assigns_ids_for_missing_column(tmp_path, session):
+    path = tmp_path / "test_pandas_loader.parquet"
+    pq.write_table(pa.table({"value": ["x", "y"]}), path)
+
+    ctx = LoaderContext(
+        tableclass=PandasLoaderTable,
+        session=session,
+        path=path,
+        staging_table=PandasLoaderTable.__table__,
+        id_allocator=IdAllocator(0),
+        id_column="id",
+    )
+
+    n = ParquetLoader.orm_file_load(ctx)
+
+    rows = session.execute(sa.text("SELECT id, value FROM test_pandas_loader ORDER BY id")).all()
+    assert n == 2
+    assert rows == [(1, "x"), (2, "y")]
+
+
+def test_load_csv_assigns_surrogate_keys(tmp_path, session):
+    csv = tmp_path / "test_pandas_loader.csv"
+    csv.write_text("value\nalpha\nbeta\n")
+
+    PandasLoaderTable.load_csv(session, csv, id_allocator=IdAllocator(41))
+
+    rows = session.execute(sa.text("SELECT id, value FROM test_pandas_loader ORDER BY id")).all()
+    assert rows == [(42, "alpha"), (43, "beta")]
+
+
+def test_load_csv_rejects_conflicting_id_sources(session):
+    with pytest.raises(ValueError, match="mutually exclusive"):
+        PandasLoaderTable.load_csv(
+            session, Path("test_pandas_loader.csv"), id_allocator=IdAllocator(0), id_sequence="seq"
+        )
+
+
+def test_load_csv_id_sequence_requires_backend_support(session):
+    with pytest.raises(NotImplementedError, match="sequence-based key assignment"):
+        PandasLoaderTable.load_csv(session, Path("test_pandas_loader.csv"), id_sequence="seq")
@@ -176,3 +176,74 @@ def test_pandas_dedupe_internal(session, tmp_path):
 
     out = PandasLoader.dedupe(df, ctx)
     assert len(out) == 2
+
+
+def test_pandas_loader_prepared_chunks_do_not_touch_session(tmp_path):
+    csv = tmp_path / "test_pandas_loader.csv"
+    csv.write_text("id,value\n1,a\n2,b\n3,c\n")
+
+    ctx = LoaderContext(
+        tableclass=PandasLoaderTable,
+        session=None,  # ty: ignore[invalid-argument-type]
+        path=csv,
+        staging_table=PandasLoaderTable.__table__,
+        chunksize=2,
+    )
+
+    chunks = list(PandasLoader.prepared_chunks(ctx))
+
+    assert [len(c) for c in chunks] == [2, 1]
+    assert chunks[0]["value"].tolist() == ["a", "b"]
+
+
+def test_pandas_loader_pipelined_load_matches_sequential(tmp_path, session):
+    csv = tmp_path / "test_pandas_loader.csv"
+    csv.write_text("id,value\n" + "".join(f"{i},v{i}\n" for i in range(1, 11)))
+
+    ctx = LoaderContext(
+        tableclass=PandasLoaderTable,
+        session=session,
+        path=csv,
+        staging_table=PandasLoaderTable.__table__,
+        chunksize=3,
+        pipeline_depth=2,
+        pipeline_memory_mb=1,
+    )
+
+    n = PandasLoader.orm_file_load(ctx)
+
+    rows = session.execute(sa.text("SELECT id, value FROM test_pandas_loader ORDER BY id")).all()
+    assert n == 10
+    assert rows == [(i, f"v{i}") for i in range(1, 11)]
+
+
+def test_pandas_loader_sizes_chunks_from_memory_budget(tmp_path, session):
+    csv = tmp_path / "test_pandas_loader.csv"
+    csv.write_text("id,value\n" + "".join(f"{i},{'x' * 2000}\n" for i in range(1, 3001)))
+
+    ctx = LoaderContext(
+        tableclass=PandasLoaderTable,
+        session=session,
+        path=csv,
+        staging_table=PandasLoaderTable.__table__,
+        memory_budget_mb=1,
+    )
+
+    chunks = list(PandasLoader.prepared_chunks(ctx))
+
+    assert ctx.chunk_sizing.bytes_per_row is not None and ctx.chunk_sizing.bytes_per_row > 2000
+    assert ctx.chunk_sizing.rows is not None and ctx.chunk_sizing.rows < 200
+    assert all(len(c) <= max(ctx.chunk_sizing.rows, 1000) for c in chunks)
+    assert sum(len(c) for c in chunks) == 3000
+
+
+def test_load_csv_leaves_chunk_sizing_on_loader(tmp_path, session):
+    csv = tmp_path / "test_pandas_loader.csv"
+    csv.write_text("id\tvalue\n" + "".join(f"{i}\t{'x' * 2000}\n" for i in range(1, 501)))
+    loader = PandasLoader()
+
+    PandasLoaderTable.load_csv(session, csv, loader=loader, memory_budget_mb=1)
+
+    assert loader.chunk_sizing is not None
+    assert loader.chunk_sizing.rows is not None and loader.chunk_sizing.rows < 200
+    assert PandasLoader.chunk_sizing is None
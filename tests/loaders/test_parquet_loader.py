@@ -138,3 +138,59 @@ def test_arrow_path_nulls_float_nan(session, engine, tmp_path):
         FloatTable.__table__.c.score,
     )
     assert arr.to_pylist() == [1.5, None, None]
+
+
+def test_parquet_loader_sizes_batches_from_memory_budget(tmp_path, session):
+    from orm_loader.loaders.data_classes import LoaderContext
+    from tests.models import PandasLoaderTable
+
+    path = tmp_path / "test_pandas_loader.parquet"
+    pq.write_table(pa.table({"id": list(range(1, 2001)), "value": ["y" * 1000] * 2000}), path)
+
+    ctx = LoaderContext(
+        tableclass=PandasLoaderTable,
+        session=session,
+        path=path,
+        staging_table=PandasLoaderTable.__table__,
+        chunksize=50,
+        memory_budget_mb=4,
+    )
+
+    batches = list(ParquetLoader._scan_batches(ctx))
+
+    # The budget allows more rows than chunksize, so chunksize caps it.
+    assert ctx.chunk_sizing.rows == 50
+    assert max(b.num_rows for b in batches) == 50
+
+
+def test_parquet_loader_closes_csv_probe_reader(tmp_path, session, monkeypatch):
+    from orm_loader.loaders import loader_interface
+    from orm_loader.loaders.data_classes import LoaderContext
+    from tests.models import PandasLoaderTable
+
+    path = tmp_path / "test_pandas_loader.csv"
+    path.write_text("id,value\n" + "".join(f"{i},{'y' * 500}\n" for i in range(1, 2001)))
+    opened = []
+    real = loader_interface.conservative_load_parquet
+
+    def _tracking(*args, **kwargs):
+        gen = real(*args, **kwargs)
+        opened.append(gen)
+        return gen
+
+    monkeypatch.setattr(loader_interface, "conservative_load_parquet", _tracking)
+    ctx = LoaderContext(
+        tableclass=PandasLoaderTable,
+        session=session,
+        path=path,
+        staging_table=PandasLoaderTable.__table__,
+        memory_budget_mb=1,
+    )
+
+    batches = ParquetLoader._scan_batches(ctx)
+    next(batches)
+
+    probe, scan = opened
+    assert probe.gi_frame is None
+    assert scan.gi_frame is not None
+    batches.close()
@@ -73,3 +73,24 @@ class ImpliedEnumTable(Base, CSVLoadableTableInterface):
 
     id: so.Mapped[int] = so.mapped_column(sa.Integer, primary_key=True)
     flag: so.Mapped[str | None] = so.mapped_column(sa.String(1), nullable=True)
+
+
+class HashedTable(Base, CSVLoadableTableInterface):
+    """Opts in to a SQL-maintained content hash for delta detection."""
+
+    __tablename__ = "hashed_table"
+    __row_hash_column__ = "row_hash"
+
+    id: so.Mapped[int] = so.mapped_column(sa.Integer, primary_key=True)
+    name: so.Mapped[str] = so.mapped_column(sa.String, nullable=False)
+    score: so.Mapped[int | None] = so.mapped_column(sa.Integer, nullable=True)
+    row_hash: so.Mapped[str | None] = so.mapped_column(sa.String(32), nullable=True)
+
+
+class ChildTable(Base, CSVLoadableTableInterface):
+    """References ``test_table`` for foreign key validation tests."""
+
+    __tablename__ = "child_table"
+
+    id: so.Mapped[int] = so.mapped_column(sa.Integer, primary_key=True)
+    parent_id: so.Mapped[int | None] = so.mapped_column(sa.ForeignKey("test_table.id"), nullable=True)
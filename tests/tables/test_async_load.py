@@ -0,0 +1,50 @@
+import asyncio
+
+import pytest
+import sqlalchemy as sa
+
+pytest.importorskip("greenlet")
+pytest.importorskip("aiosqlite")
+
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine  # noqa: E402
+
+from tests.models import Base, PandasLoaderTable  # noqa: E402
+
+
+def _run(coro):
+    return asyncio.run(coro)
+
+
+def test_load_csv_async_offloads_parsing_and_merges(tmp_path, monkeypatch):
+    csv = tmp_path / "test_pandas_loader.csv"
+    csv.write_text("id,value\n1,alpha\n2,beta\n")
+
+    from orm_loader.loaders.data_classes import LoaderInterface
+
+    offloaded: list[bool] = []
+    original = LoaderInterface._iter_prepared.__func__
+
+    def _spy(cls, ctx):
+        offloaded.append(ctx.offload_parsing)
+        return original(cls, ctx)
+
+    monkeypatch.setattr(LoaderInterface, "_iter_prepared", classmethod(_spy))
+
+    async def main():
+        engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        async with AsyncSession(engine) as session:
+            total = await PandasLoaderTable.load_csv_async(session, csv)
+            rows = (await session.execute(
+                sa.text("SELECT id, value FROM test_pandas_loader ORDER BY id")
+            )).all()
+        await engine.dispose()
+        return total, rows
+
+    total, rows = _run(main())
+
+    assert total == 2
+    assert rows == [(1, "alpha"), (2, "beta")]
+    assert offloaded == [True]
+
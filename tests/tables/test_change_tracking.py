@@ -0,0 +1,100 @@
+from typing import Any
+
+import sqlalchemy as sa
+
+import orm_loader.mappers.materialised_view_mixin as mv_module
+from orm_loader.mappers.change_tracking import (
+    bump_table_version,
+    is_fresh,
+    mv_watermarks,
+    record_refresh,
+    table_versions,
+)
+from orm_loader.mappers.materialised_view_mixin import MaterializedViewMixin, refresh_all_mvs
+from tests.models import PandasLoaderTable
+
+
+def _mv(name: str, deps: set[str]) -> type[MaterializedViewMixin]:
+    return type(name, (MaterializedViewMixin,), {
+        "__mv_name__": name,
+        "__mv_select__": sa.select(sa.literal(1)),
+        "__mv_dependencies__": deps,
+    })
+
+
+class _RefreshRecorder:
+    def __init__(self) -> None:
+        self.refreshed: list[str] = []
+
+    def refresh_materialized_view(self, bind: Any, name: str, *, concurrently: bool = False) -> None:
+        self.refreshed.append(name)
+
+
+def test_change_counters_and_watermarks(engine):
+    assert bump_table_version(engine, "person") == 1
+    assert bump_table_version(engine, "person") == 2
+    assert table_versions(engine, ["person", "visit"]) == {"person": 2, "visit": 0}
+
+    assert record_refresh(engine, "mv_people", {"person": 2}) == 1
+    assert mv_watermarks(engine, "mv_people") == {"person": 2}
+    assert is_fresh({"person": 2}, {"person": 2}) is True
+    assert is_fresh({"person": 3}, {"person": 2}) is False
+    assert is_fresh({}, {}) is False
+    # An input that was never bumped is untracked, so it can never prove freshness.
+    assert is_fresh({"visit": 0}, {"visit": 0}) is False
+
+
+def test_load_csv_bumps_counter_only_when_rows_merge(session, tmp_path):
+    path = tmp_path / "test_pandas_loader.csv"
+    path.write_text("id,value\n1,a\n")
+    PandasLoaderTable.load_csv(session, path, track_changes=True)
+
+    path.write_text("id,value\n")
+    PandasLoaderTable.load_csv(session, path, track_changes=True)
+
+    assert table_versions(session.connection(), ["test_pandas_loader"]) == {"test_pandas_loader": 1}
+
+
+def test_load_csv_skips_bump_when_sync_changes_nothing(session, tmp_path):
+    path = tmp_path / "test_pandas_loader.csv"
+    path.write_text("id,value\n1,a\n2,b\n")
+    for _ in range(2):
+        PandasLoaderTable.load_csv(session, path, merge_strategy="sync", track_changes=True)
+    assert table_versions(session.connection(), ["test_pandas_loader"]) == {"test_pandas_loader": 1}
+
+    path.write_text("id,value\n1,a\n2,changed\n")
+    PandasLoaderTable.load_csv(session, path, merge_strategy="sync", track_changes=True)
+    assert table_versions(session.connection(), ["test_pandas_loader"]) == {"test_pandas_loader": 2}
+
+
+def test_refresh_all_mvs_skips_fresh_views_and_propagates_staleness(engine, monkeypatch):
+    recorder = _RefreshRecorder()
+    monkeypatch.setattr(mv_module, "resolve_backend", lambda *_a, **_k: recorder)
+    mv_a = _mv("mv_a", {"src_one"})
+    mv_b = _mv("mv_b", {"src_two"})
+    mv_c = _mv("mv_c", {"mv_a"})
+    views = [mv_a, mv_b, mv_c]
+    bump_table_version(engine, "src_one")
+    bump_table_version(engine, "src_two")
+
+    refresh_all_mvs(engine, views, skip_fresh=True)
+    assert sorted(recorder.refreshed) == ["mv_a", "mv_b", "mv_c"]
+
+    recorder.refreshed.clear()
+    assert refresh_all_mvs(engine, views, skip_fresh=True) == {}
+
+    bump_table_version(engine, "src_one")
+    timings = refresh_all_mvs(engine, views, skip_fresh=True)
+    assert recorder.refreshed == ["mv_a", "mv_c"]
+    assert set(timings) == {"mv_a", "mv_c"}
+
+
+def test_refresh_all_mvs_always_refreshes_views_over_untracked_tables(engine, monkeypatch):
+    recorder = _RefreshRecorder()
+    monkeypatch.setattr(mv_module, "resolve_backend", lambda *_a, **_k: recorder)
+    views = [_mv("mv_untracked", {"never_loaded_with_tracking"})]
+
+    refresh_all_mvs(engine, views, skip_fresh=True)
+    refresh_all_mvs(engine, views, skip_fresh=True)
+
+    assert recorder.refreshed == ["mv_untracked", "mv_untracked"]
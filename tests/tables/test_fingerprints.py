@@ -0,0 +1,80 @@
+from typing import Type, cast
+
+import pytest
+import sqlalchemy as sa
+import sqlalchemy.orm as so
+
+from orm_loader.backends import PostgresBackend
+from orm_loader.tables.loadable_table import CSVLoadableTableInterface
+from orm_loader.tables.typing import CSVTableProtocol
+from tests.models import Base, CompositeTable, HashedTable
+
+_HashedTable = cast(Type[CSVTableProtocol], HashedTable)
+
+
+def _populate(engine, rows):
+    Base.metadata.create_all(engine)
+    with so.Session(engine) as session:
+        session.execute(sa.insert(HashedTable), rows)
+        _HashedTable.compute_row_hashes(session)
+        session.commit()
+
+
+@pytest.fixture
+def two_copies():
+    rows = [{"id": i, "name": f"n{i}", "score": i % 7 or None} for i in range(-3, 50)]
+    ours, theirs = sa.create_engine("sqlite:///:memory:"), sa.create_engine("sqlite:///:memory:")
+    _populate(ours, rows)
+    _populate(theirs, list(reversed(rows)))
+    return ours, theirs
+
+
+def test_bucket_fingerprints_are_order_independent(two_copies):
+    ours, theirs = two_copies
+    with so.Session(ours) as a, so.Session(theirs) as b:
+        fa = _HashedTable.bucket_fingerprints(a, bucket_size=10)
+        fb = _HashedTable.bucket_fingerprints(b, bucket_size=10)
+
+    assert sorted(fa) == [0, 1, 2, 3, 4]
+    assert sum(f.rows for f in fa.values()) == 53
+    assert fa[0].min_pk == -3 and fa[0].max_pk == 9
+    assert CSVLoadableTableInterface.mismatched_buckets(fa, fb) == []
+
+
+def test_mismatch_is_located_to_bucket_and_row(two_copies):
+    ours, theirs = two_copies
+    with so.Session(theirs) as b:
+        b.execute(sa.update(HashedTable).where(HashedTable.id == 23).values(name="drift"))
+        b.execute(sa.delete(HashedTable).where(HashedTable.id == 41))
+        b.commit()
+
+    with so.Session(ours) as a, so.Session(theirs) as b:
+        buckets = CSVLoadableTableInterface.mismatched_buckets(
+            _HashedTable.bucket_fingerprints(a, bucket_size=10),
+            _HashedTable.bucket_fingerprints(b, bucket_size=10),
+        )
+        assert buckets == [2, 4]
+
+        rows_a = _HashedTable.row_fingerprints(a, 2, bucket_size=10)
+        rows_b = _HashedTable.row_fingerprints(b, 2, bucket_size=10)
+        assert sorted(rows_a) == list(range(20, 30))
+        assert [pk for pk in rows_a if rows_a[pk] != rows_b.get(pk)] == [23]
+
+        assert sorted(_HashedTable.row_fingerprints(a, 0, bucket_size=10)) == list(range(-3, 10))
+
+
+def test_stored_hashes_match_computed_hashes(two_copies):
+    ours, _ = two_copies
+    with so.Session(ours) as a:
+        assert _HashedTable.bucket_fingerprints(a, bucket_size=10, use_stored_hash=True) == (
+            _HashedTable.bucket_fingerprints(a, bucket_size=10)
+        )
+
+
+def test_bucket_fingerprints_require_single_integer_pk(session):
+    with pytest.raises(ValueError, match="single integer primary key"):
+        cast(Type[CSVTableProtocol], CompositeTable).bucket_fingerprints(session)
+
+
+def test_postgres_hash_to_int_uses_leading_32_bits():
+    assert PostgresBackend().hash_to_int_sql("h") == "('x' || substr(h, 1, 8))::bit(32)::bigint"
@@ -0,0 +1,92 @@
+from typing import Type, cast
+
+import pandas as pd
+import pytest
+import sqlalchemy as sa
+
+from orm_loader.backends import resolve_backend
+from orm_loader.helpers.errors import IngestError
+from orm_loader.loaders.loader_interface import PandasLoader
+from orm_loader.tables.typing import CSVTableProtocol
+from tests.models import ChildTable, SimpleTable
+
+_ChildTable = cast(Type[CSVTableProtocol], ChildTable)
+
+
+def _load_children(session, tmp_path, rows, **kwargs) -> int:
+    csv_path = tmp_path / "child_table.csv"
+    pd.DataFrame(rows).astype({"parent_id": "Int64"}).to_csv(csv_path, index=False, sep="\t")
+    return _ChildTable.load_csv(session, csv_path, loader=PandasLoader(), **kwargs)
+
+
+@pytest.fixture
+def parents(session):
+    session.execute(sa.insert(SimpleTable), [{"id": 1, "name": "a"}, {"id": 2, "name": "b"}])
+    session.commit()
+
+
+def test_anti_join_accepts_valid_and_null_references(session, tmp_path, parents):
+    _load_children(
+        session, tmp_path,
+        [{"id": 1, "parent_id": 1}, {"id": 2, "parent_id": None}],
+        fk_validation="anti_join",
+    )
+
+    assert session.execute(sa.select(sa.func.count()).select_from(ChildTable)).scalar_one() == 2
+
+
+def test_anti_join_rolls_back_orphaned_rows(session, tmp_path, parents):
+    _load_children(session, tmp_path, [{"id": 1, "parent_id": 1}])
+
+    with pytest.raises(IngestError, match="1"):
+        _load_children(
+            session, tmp_path,
+            [{"id": 1, "parent_id": 2}, {"id": 2, "parent_id": 99}],
+            merge_strategy="upsert",
+            fk_validation="anti_join",
+        )
+
+    rows = session.execute(sa.select(ChildTable.id, ChildTable.parent_id)).all()
+    assert [tuple(r) for r in rows] == [(1, 1)]
+
+
+def test_check_foreign_keys_only_scans_staged_keys(session, parents):
+    session.execute(sa.insert(ChildTable), [{"id": 1, "parent_id": 99}, {"id": 2, "parent_id": 1}])
+    _ChildTable.create_staging_table(session)
+    staging = _ChildTable.get_staging_table(session)
+    session.execute(sa.insert(staging), [{"id": 2, "parent_id": 1}])
+
+    counts = resolve_backend(session).check_foreign_keys(_ChildTable, session, "child_table", ["id"])
+
+    assert list(counts.values()) == [0]
+    _ChildTable.drop_staging_table(session)
+
+
+def test_unknown_fk_validation_mode_is_rejected(session, tmp_path):
+    with pytest.raises(ValueError, match="fk_validation"):
+        _load_children(session, tmp_path, [{"id": 1, "parent_id": None}], fk_validation="deferred")
+
+
+def test_revalidate_requires_backend_support(session, tmp_path, parents):
+    with pytest.raises(NotImplementedError):
+        _load_children(session, tmp_path, [{"id": 1, "parent_id": 1}], fk_validation="revalidate")
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"merge_strategy": "upsert", "merge_batch_size": 1},
+        {"merge_strategy": "sync", "merge_batch_size": 1},
+        {"merge_strategy": "swap"},
+    ],
+)
+def test_anti_join_rejects_merges_that_commit_part_way(session, tmp_path, parents, kwargs):
+    with pytest.raises(ValueError, match="anti_join"):
+        _load_children(
+            session, tmp_path,
+            [{"id": 1, "parent_id": 1}, {"id": 2, "parent_id": 99}],
+            fk_validation="anti_join",
+            **kwargs,
+        )
+
+    assert session.execute(sa.select(sa.func.count()).select_from(ChildTable)).scalar_one() == 0
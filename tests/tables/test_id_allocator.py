@@ -1,4 +1,10 @@
-from orm_loader.tables.allocators import IdAllocator
+import threading
+
+import sqlalchemy as sa
+import sqlalchemy.orm as so
+
+from orm_loader.tables.allocators import BlockIdAllocator, IdAllocator
+from tests.models import Base, SimpleTable
 
 def test_allocator_sequence():
     alloc = IdAllocator(start=5)
@@ -9,3 +15,61 @@ def test_allocator_reserve():
     alloc = IdAllocator(start=0)
     r = alloc.reserve(3)
     assert list(r) == [1, 2, 3]
+
+
+def _engine(tmp_path):
+    return sa.create_engine(f"sqlite:///{tmp_path / 'ids.db'}")
+
+
+def test_block_allocator_serves_ids_from_leased_blocks(tmp_path):
+    engine = _engine(tmp_path)
+    alloc = BlockIdAllocator(engine, "things", block_size=4)
+    statements: list[str] = []
+    sa.event.listen(engine, "before_cursor_execute", lambda *a: statements.append(a[2]))
+
+    ids = [alloc.next() for _ in range(6)]
+
+    assert ids == [1, 2, 3, 4, 5, 6]
+    assert sum(s.startswith("UPDATE") for s in statements) == 2
+
+
+def test_block_allocator_reserve_larger_than_block(tmp_path):
+    alloc = BlockIdAllocator(_engine(tmp_path), "things", block_size=4)
+    alloc.next()
+
+    r = alloc.reserve(10)
+
+    assert len(r) == 10 and r.start > 1
+    assert alloc.next() == r.stop
+
+
+def test_block_allocators_never_collide_across_instances(tmp_path):
+    engine = _engine(tmp_path)
+    allocators = [BlockIdAllocator(engine, "things", block_size=7) for _ in range(4)]
+    seen: list[int] = []
+    lock = threading.Lock()
+
+    def work(alloc):
+        got = [alloc.next() for _ in range(50)]
+        with lock:
+            seen.extend(got)
+
+    threads = [threading.Thread(target=work, args=(a,)) for a in allocators]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len(seen) == len(set(seen)) == 200
+
+
+def test_block_allocator_continues_after_existing_rows(tmp_path):
+    engine = _engine(tmp_path)
+    Base.metadata.create_all(engine)
+    with so.Session(engine) as session:
+        session.execute(sa.insert(SimpleTable), [{"id": 41, "name": "a"}, {"id": 7, "name": "b"}])
+        session.commit()
+        alloc = SimpleTable.block_allocator(session, block_size=3)
+
+    assert alloc.reserve(2) == range(42, 44)
+    assert SimpleTable.block_allocator(engine).next() == 45
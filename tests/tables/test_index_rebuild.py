@@ -0,0 +1,97 @@
+from dataclasses import replace
+from typing import Type, cast
+
+import sqlalchemy as sa
+import sqlalchemy.orm as so
+
+import orm_loader.tables.loadable_table as loadable_table
+from orm_loader.backends import PostgresBackend, SQLiteBackend
+from orm_loader.tables.loadable_table import CSVLoadableTableInterface
+from orm_loader.tables.typing import CSVTableProtocol
+
+Base = so.declarative_base()
+
+
+class WideTable(CSVLoadableTableInterface, Base):
+    __tablename__ = "wide_table"
+    __table_args__ = (
+        sa.Index("ix_wide_a", "a"),
+        sa.Index("ix_wide_b", "b"),
+        sa.Index("ix_wide_c", "c"),
+    )
+
+    id = sa.Column(sa.Integer, primary_key=True)
+    a = sa.Column(sa.Integer)
+    b = sa.Column(sa.Integer)
+    c = sa.Column(sa.Integer)
+
+
+_WideTable = cast(Type[CSVTableProtocol], WideTable)
+
+
+class _ConcurrentSQLiteBackend(SQLiteBackend):
+    """SQLite stand-in that opts into the concurrent rebuild path."""
+
+    configured: list[dict] = []
+
+    @property
+    def capabilities(self):
+        return replace(super().capabilities, supports_concurrent_index_build=True)
+
+    def configure_index_build(self, conn, **settings) -> None:
+        self.configured.append(settings)
+
+
+def _index_names(engine) -> set[str]:
+    return {idx["name"] for idx in sa.inspect(engine).get_indexes("wide_table")}
+
+
+def test_rebuild_indices_concurrently_on_pooled_connections(tmp_path, monkeypatch):
+    engine = sa.create_engine(f"sqlite:///{tmp_path / 'wide.db'}")
+    Base.metadata.create_all(engine)
+    monkeypatch.setattr(
+        loadable_table, "resolve_backend", lambda *_a, **_k: _ConcurrentSQLiteBackend()
+    )
+    _ConcurrentSQLiteBackend.configured = []
+
+    with so.Session(engine) as session:
+        with _WideTable.manage_indices(
+            session,
+            index_strategy="drop_rebuild",
+            rebuild_workers=3,
+            maintenance_work_mem="256MB",
+        ):
+            assert _index_names(engine) == set()
+
+    assert _index_names(engine) == {"ix_wide_a", "ix_wide_b", "ix_wide_c"}
+    assert len(_ConcurrentSQLiteBackend.configured) == 3
+    assert _ConcurrentSQLiteBackend.configured[0]["maintenance_work_mem"] == "256MB"
+
+
+def test_rebuild_indices_reports_per_index_timings(session, engine):
+    Base.metadata.create_all(engine)
+    for idx in WideTable.__table__.indexes:
+        session.execute(sa.schema.DropIndex(idx))
+    session.commit()
+
+    timings = _WideTable._rebuild_indices(session, list(WideTable.__table__.indexes), rebuild_workers=4)
+
+    assert set(timings) == {"ix_wide_a", "ix_wide_b", "ix_wide_c"}
+    assert all(t >= 0 for t in timings.values())
+
+
+def test_postgres_configure_index_build_uses_transaction_local_settings():
+    statements: list[tuple[str, dict]] = []
+
+    class _Conn:
+        def execute(self, statement, parameters=None):
+            statements.append((str(statement), parameters))
+
+    PostgresBackend().configure_index_build(
+        cast(sa.Connection, _Conn()), maintenance_work_mem="2GB", max_parallel_maintenance_workers=4
+    )
+
+    assert statements == [
+        ("SELECT set_config('maintenance_work_mem', :value, true)", {"value": "2GB"}),
+        ("SELECT set_config('max_parallel_maintenance_workers', :value, true)", {"value": "4"}),
+    ]
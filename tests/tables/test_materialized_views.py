@@ -0,0 +1,257 @@
+import gc
+import threading
+import time
+from typing import Any
+
+import pytest
+import sqlalchemy as sa
+import sqlalchemy.orm as so
+
+import orm_loader.mappers.materialised_view_mixin as mv_module
+from orm_loader.mappers.materialised_view_mixin import (
+    IncrementalMaterializedViewMixin,
+    MaterializedViewMixin,
+    incremental_views_for,
+    refresh_all_mvs,
+    resolve_mv_refresh_levels,
+)
+from orm_loader.backends import ViewIndex
+from orm_loader.tables.loadable_table import CSVLoadableTableInterface
+
+Base = so.declarative_base()
+
+
+class ObservationSrc(CSVLoadableTableInterface, Base):
+    __tablename__ = "observation_src"
+
+    id = sa.Column(sa.Integer, primary_key=True)
+    obs_date = sa.Column(sa.String)
+    concept_id = sa.Column(sa.Integer)
+
+
+class ObservationCountsMV(IncrementalMaterializedViewMixin):
+    __mv_name__ = "mv_observation_counts"
+    __mv_select__ = (
+        sa.select(
+            ObservationSrc.obs_date.label("obs_date"),
+            ObservationSrc.concept_id.label("concept"),
+            sa.func.count().label("n"),
+        )
+        .group_by(ObservationSrc.obs_date, ObservationSrc.concept_id)
+    )
+    __mv_group_by__ = ("obs_date", "concept")
+    __mv_delta_columns__ = {"observation_src": {"obs_date": "obs_date", "concept": "concept_id"}}
+    __mv_dependencies__ = {"observation_src"}
+
+
+def _mv(name: str, deps: set[str] = set()) -> type[MaterializedViewMixin]:
+    return type(name, (MaterializedViewMixin,), {
+        "__mv_name__": name,
+        "__mv_select__": sa.select(sa.literal(1)),
+        "__mv_dependencies__": deps,
+    })
+
+
+A = _mv("mv_a", {"person"})
+B = _mv("mv_b", {"mv_a"})
+C = _mv("mv_c", {"mv_a"})
+D = _mv("mv_d", {"mv_b", "mv_c"})
+E = _mv("mv_e")
+
+
+class _RecordingBackend:
+    def __init__(self, unique: set[str] = set()) -> None:
+        self.unique = unique
+        self.calls: list[tuple[str, bool]] = []
+        self.finished: list[str] = []
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def has_unique_index(self, bind: Any, name: str) -> bool:
+        return name in self.unique
+
+    def refresh_materialized_view(self, bind: Any, name: str, *, concurrently: bool = False) -> None:
+        with self._lock:
+            self.calls.append((name, concurrently))
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        time.sleep(0.05)
+        with self._lock:
+            self.active -= 1
+            self.finished.append(name)
+
+
+def test_resolve_mv_refresh_levels_groups_independent_views():
+    levels = resolve_mv_refresh_levels([D, C, B, A, E])
+
+    assert [sorted(mv.__mv_name__ for mv in level) for level in levels] == [
+        ["mv_a", "mv_e"],
+        ["mv_b", "mv_c"],
+        ["mv_d"],
+    ]
+
+
+def test_resolve_mv_refresh_levels_detects_cycles():
+    with pytest.raises(RuntimeError, match="Cycle"):
+        resolve_mv_refresh_levels([_mv("mv_x", {"mv_y"}), _mv("mv_y", {"mv_x"})])
+
+
+def test_refresh_all_mvs_refreshes_levels_in_parallel(monkeypatch):
+    backend = _RecordingBackend()
+    monkeypatch.setattr(mv_module, "resolve_backend", lambda *_a, **_k: backend)
+
+    timings = refresh_all_mvs(sa.create_engine("sqlite://"), [A, B, C, D, E], workers=4)
+
+    assert set(timings) == {"mv_a", "mv_b", "mv_c", "mv_d", "mv_e"}
+    assert all(t > 0 for t in timings.values())
+    assert backend.max_active == 2
+    assert backend.finished.index("mv_d") == 4
+    assert {backend.finished.index("mv_b"), backend.finished.index("mv_c")} == {2, 3}
+
+
+def test_refresh_all_mvs_is_serial_on_a_connection(monkeypatch):
+    backend = _RecordingBackend()
+    monkeypatch.setattr(mv_module, "resolve_backend", lambda *_a, **_k: backend)
+
+    with sa.create_engine("sqlite://").connect() as conn:
+        refresh_all_mvs(conn, [A, B, C], workers=4)
+
+    assert backend.max_active == 1
+
+
+def test_refresh_all_mvs_auto_concurrent_uses_unique_index(monkeypatch):
+    backend = _RecordingBackend(unique={"mv_a"})
+    monkeypatch.setattr(mv_module, "resolve_backend", lambda *_a, **_k: backend)
+
+    refresh_all_mvs(sa.create_engine("sqlite://"), [A, E], concurrently=None)
+
+    assert sorted(backend.calls) == [("mv_a", True), ("mv_e", False)]
+
+
+def _view_rows(session) -> list[tuple]:
+    return sorted(
+        session.execute(sa.text("SELECT obs_date, concept, n FROM mv_observation_counts")).all(),
+        key=repr,
+    )
+
+
+def _expected_rows(session) -> list[tuple]:
+    return sorted(session.execute(ObservationCountsMV.__mv_select__).all(), key=repr)
+
+
+@pytest.fixture
+def observations(session, tmp_path):
+    Base.metadata.create_all(session.get_bind())
+    path = tmp_path / "observation_src.csv"
+    path.write_text("id,obs_date,concept_id\n1,2025-01-01,10\n2,2025-01-01,10\n3,2025-01-02,11\n4,,11\n")
+    ObservationSrc.load_csv(session, path)
+    ObservationCountsMV.create_mv(session.connection())
+    session.commit()
+    return path
+
+
+def test_incremental_view_is_registered_for_its_sources():
+    assert ObservationCountsMV in incremental_views_for(ObservationSrc.__table__)
+    unrelated = sa.Table("unrelated", sa.MetaData(), sa.Column("id", sa.Integer))
+    assert incremental_views_for(unrelated) == []
+
+
+def _counts_view(source: sa.Table) -> type[IncrementalMaterializedViewMixin]:
+    return type("ObservationCountsMV", (IncrementalMaterializedViewMixin,), {
+        "__mv_name__": "mv_observation_counts",
+        "__mv_select__": sa.select(source.c.obs_date, sa.func.count().label("n")).group_by(source.c.obs_date),
+        "__mv_group_by__": ("obs_date",),
+        "__mv_delta_columns__": {"observation_src": {"obs_date": "obs_date"}},
+    })
+
+
+def test_incremental_views_are_scoped_to_the_loaded_table_and_held_weakly():
+    other = sa.Table(
+        "observation_src", sa.MetaData(), sa.Column("id", sa.Integer, primary_key=True), sa.Column("obs_date", sa.String)
+    )
+    local = _counts_view(other)
+
+    assert incremental_views_for(ObservationSrc.__table__) == [ObservationCountsMV]
+    assert incremental_views_for(other) == [local]
+
+    redefined = _counts_view(other)
+    assert incremental_views_for(other) == [redefined]
+
+    del local, redefined
+    gc.collect()
+    assert incremental_views_for(other) == []
+
+
+def test_incremental_refresh_honours_concurrently(session, observations):
+    session.execute(sa.text("UPDATE mv_observation_counts SET n = 99 WHERE obs_date = '2025-01-01'"))
+    session.execute(sa.text("INSERT INTO mv_observation_counts VALUES ('1999-01-01', 1, 1)"))
+
+    ObservationCountsMV.refresh_mv(session.connection(), concurrently=True)
+
+    assert _view_rows(session) == _expected_rows(session)
+    # Only the changed group is reinserted; untouched groups are left in place.
+    assert session.execute(sa.text("SELECT changes()")).scalar() == 1
+
+
+def test_incremental_view_requires_complete_delta_mapping():
+    with pytest.raises(ValueError, match="does not map group column"):
+        type("BrokenMV", (IncrementalMaterializedViewMixin,), {
+            "__mv_name__": "mv_broken",
+            "__mv_select__": ObservationCountsMV.__mv_select__,
+            "__mv_group_by__": ("obs_date", "concept"),
+            "__mv_delta_columns__": {"observation_src": {"obs_date": "obs_date"}},
+        })
+
+
+def test_load_csv_applies_merge_delta_to_incremental_view(session, observations):
+    assert _view_rows(session) == _expected_rows(session)
+
+    # Row 2 moves to a new concept, row 5 is new; 2025-01-02 is untouched.
+    observations.write_text("id,obs_date,concept_id\n2,2025-01-01,12\n5,,11\n")
+    ObservationSrc.load_csv(session, observations, incremental_mvs=True)
+
+    assert _view_rows(session) == _expected_rows(session)
+    assert ("2025-01-01", 12, 1) in _view_rows(session)
+    assert (None, 11, 2) in _view_rows(session)
+
+
+def test_sync_merge_recomputes_groups_of_deleted_rows(session, observations):
+    observations.write_text("id,obs_date,concept_id\n1,2025-01-01,10\n")
+    ObservationSrc.load_csv(session, observations, merge_strategy="sync", incremental_mvs=True)
+
+    assert _view_rows(session) == [("2025-01-01", 10, 1)]
+
+
+def test_affected_groups_reads_old_and_new_keys(session, observations):
+    staging = ObservationSrc.get_staging_table(session)
+    ObservationSrc.create_staging_table(session)
+    session.execute(sa.insert(staging).values(id=3, obs_date="2025-02-01", concept_id=11))
+
+    groups = ObservationCountsMV.affected_groups(session, ObservationSrc, staging, merge_strategy="replace")
+
+    assert groups == {("2025-02-01", 11), ("2025-01-02", 11)}
+    assert ObservationCountsMV.affected_groups(session, ObservationSrc, staging, merge_strategy="swap") is None
+
+
+def test_mixin_views_run_on_sqlite_emulation(session, observations):
+    class ConceptTotalsMV(MaterializedViewMixin):
+        __mv_name__ = "mv_concept_totals"
+        __mv_select__ = (
+            sa.select(ObservationSrc.concept_id.label("concept_id"), sa.func.count().label("n"))
+            .group_by(ObservationSrc.concept_id)
+        )
+        __mv_indexes__ = (ViewIndex(("concept_id",), unique=True),)
+
+    engine = session.get_bind()
+    session.close()
+    ConceptTotalsMV.create_mv(engine)
+    with engine.begin() as conn:
+        conn.execute(sa.insert(ObservationSrc.__table__).values(id=9, obs_date="2025-03-01", concept_id=12))
+    refresh_all_mvs(engine, [ConceptTotalsMV, ObservationCountsMV])
+
+    with engine.connect() as conn:
+        assert conn.execute(sa.text("SELECT concept_id, n FROM mv_concept_totals ORDER BY concept_id")).all() == [
+            (10, 2), (11, 2), (12, 1)
+        ]
+        assert conn.execute(sa.text("SELECT n FROM mv_observation_counts WHERE concept = 12")).scalar() == 1
@@ -21,3 +21,104 @@ def test_pk_missing_raises():
 
     with pytest.raises(TypeError, match="not a mapped ORM class"):
         T.pk_columns()
+
+
+def test_table_shape_is_cached_and_complete():
+    class S(ORMTableBase, Base):
+        __tablename__ = "shape_t"
+        id = sa.Column(sa.Integer, primary_key=True)
+        name = sa.Column(sa.String, nullable=False)
+        note = sa.Column(sa.String)
+        slug = sa.Column(sa.String, sa.Computed("lower(name)"))
+
+    shape = S.table_shape()
+
+    assert S.table_shape() is shape
+    assert list(shape.columns) == ["id", "name", "note", "slug"]
+    assert shape.pk_names == ("id",)
+    assert shape.required == frozenset({"name"})
+    assert shape.insertable == ("id", "name", "note")
+    assert shape.computed == frozenset({"slug"})
+    with pytest.raises(TypeError):
+        shape.columns["x"] = sa.Column("x")  # type: ignore[index]
+
+
+def test_table_shape_public_helpers_return_copies():
+    class C(ORMTableBase, Base):
+        __tablename__ = "shape_copy"
+        id = sa.Column(sa.Integer, primary_key=True)
+        name = sa.Column(sa.String, nullable=False)
+
+    C.model_columns().clear()
+    C.required_columns().clear()
+    C.pk_names().clear()
+
+    assert C.pk_names() == ["id"]
+    assert C.required_columns() == {"name"}
+    assert set(C.model_columns()) == {"id", "name"}
+
+
+def test_table_shape_invalidated_on_mapper_configuration():
+    class M(ORMTableBase, Base):
+        __tablename__ = "shape_mapper"
+        id = sa.Column(sa.Integer, primary_key=True)
+
+    before = M.table_shape()
+    M.extra = sa.Column(sa.String, nullable=False)
+    so.configure_mappers()
+
+    assert M.table_shape() is not before
+    assert "extra" in M.table_shape().columns
+
+    M.invalidate_table_shape()
+    assert M.table_shape() is not before
+
+
+class Rec(ORMTableBase, Base):
+    __tablename__ = "records_t"
+    id = sa.Column(sa.Integer, primary_key=True)
+    name = sa.Column(sa.String, nullable=False)
+    score = sa.Column(sa.Float)
+
+
+def test_from_records_matches_from_dict():
+    records = [
+        {"id": 1, "name": "a", "score": float("nan"), "unknown": 1},
+        {"id": 2, "name": "b", "score": " NULL "},
+        {"id": 3, "name": "c", "score": 1.5},
+    ]
+
+    built = list(Rec.from_records(records))
+
+    expected = [Rec.from_dict(r) for r in records]
+    assert [(r.id, r.name, r.score) for r in built] == [(r.id, r.name, r.score) for r in expected]
+
+
+def test_from_records_as_dicts_are_insert_ready():
+    engine = sa.create_engine("sqlite:///:memory:")
+    Rec.__table__.create(engine)
+    rows = list(
+        Rec.from_records(
+            [{"id": 1, "name": "a", "score": ""}, {"id": 2, "name": "b"}, {"id": 3, "name": "c", "score": 2.0}],
+            drop_nulls=False,
+            as_dicts=True,
+        )
+    )
+
+    assert rows == [
+        {"id": 1, "name": "a", "score": None},
+        {"id": 2, "name": "b", "score": None},
+        {"id": 3, "name": "c", "score": 2.0},
+    ]
+    with so.Session(engine) as session:
+        session.execute(sa.insert(Rec), rows)
+        assert session.execute(sa.select(sa.func.count()).select_from(Rec)).scalar_one() == 3
+
+
+def test_from_records_is_lazy_and_strict():
+    records = iter([{"id": 1, "name": "a"}, {"id": 2, "name": "nan"}])
+    stream = Rec.from_records(records, strict=True)
+
+    assert next(stream).id == 1
+    with pytest.raises(ValueError, match="Missing required fields"):
+        next(stream)
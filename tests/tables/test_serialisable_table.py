@@ -1,4 +1,14 @@
-from orm_loader.tables.serialisable_table import SerialisableTableInterface
+import datetime
+import hashlib
+import json
+from decimal import Decimal
+from enum import Enum
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+from orm_loader.tables.serialisable_table import SerialisableTableInterface, json_default
 import sqlalchemy as sa
 import sqlalchemy.orm as so
 from sqlalchemy.orm import declarative_base
@@ -59,3 +69,196 @@ def test_to_dict_only_and_exclude():
     assert obj.to_dict(exclude={"b"}) == {"id": 1, "a": 10}
 
 
+
+
+class ExportTable(SerialisableTableInterface, Base):
+    __tablename__ = "export_table"
+
+    id: so.Mapped[int] = so.mapped_column(sa.Integer, primary_key=True)
+    name: so.Mapped[str | None] = so.mapped_column(sa.String, nullable=True)
+    amount: so.Mapped[Decimal | None] = so.mapped_column(sa.Numeric(10, 2), nullable=True)
+    seen: so.Mapped[datetime.date | None] = so.mapped_column(sa.Date, nullable=True)
+
+
+@pytest.fixture
+def export_session():
+    engine = sa.create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    with so.Session(engine) as session:
+        session.execute(
+            sa.insert(ExportTable),
+            [
+                {"id": 1, "name": "a", "amount": Decimal("1.50"), "seen": datetime.date(2024, 1, 2)},
+                {"id": 2, "name": None, "amount": None, "seen": None},
+                {"id": 3, "name": "c, d", "amount": Decimal("3.00"), "seen": datetime.date(2024, 3, 4)},
+            ],
+        )
+        session.commit()
+        yield session
+
+
+def test_iter_record_batches_streams_typed_batches(export_session):
+    batches = list(ExportTable.iter_record_batches(export_session, batch_size=2))
+
+    assert [b.num_rows for b in batches] == [2, 1]
+    assert batches[0].schema == ExportTable.export_schema()
+    assert batches[0].schema.field("amount").type == pa.decimal128(10, 2)
+    assert pa.Table.from_batches(batches).column("name").to_pylist() == ["a", None, "c, d"]
+
+
+def test_iter_record_batches_columns_and_filter(export_session):
+    batches = list(
+        ExportTable.iter_record_batches(export_session, columns=["id"], where=ExportTable.id > 1)
+    )
+
+    assert pa.Table.from_batches(batches).to_pydict() == {"id": [2, 3]}
+
+
+def test_export_parquet_round_trips(export_session, tmp_path):
+    path = tmp_path / "export_table.parquet"
+
+    assert ExportTable.export_parquet(export_session, path, batch_size=2) == 3
+
+    table = pq.read_table(path)
+    assert table.column("id").to_pylist() == [1, 2, 3]
+    assert table.column("seen").to_pylist()[0] == datetime.date(2024, 1, 2)
+
+
+def test_export_parquet_empty_result_keeps_schema(export_session, tmp_path):
+    path = tmp_path / "export_table.parquet"
+
+    assert ExportTable.export_parquet(export_session, path, where=ExportTable.id > 99) == 0
+    assert pq.read_schema(path).names == ["id", "name", "amount", "seen"]
+
+
+def test_export_csv_writes_tab_delimited_with_header(export_session, tmp_path):
+    path = tmp_path / "export_table.csv"
+
+    assert ExportTable.export_csv(export_session, path) == 3
+
+    lines = path.read_text().splitlines()
+    assert lines[0] == '"id"\t"name"\t"amount"\t"seen"'
+    assert lines[1] == '1\t"a"\t1.50\t2024-01-02'
+    assert lines[2] == "2\t\t\t"
+
+
+def test_export_ndjson_matches_to_json_encoding(export_session, tmp_path):
+    path = tmp_path / "export_table.ndjson"
+
+    assert ExportTable.export_ndjson(export_session, path) == 3
+
+    first = json.loads(path.read_text().splitlines()[0])
+    assert first == {"id": 1, "name": "a", "amount": "1.50", "seen": "2024-01-02"}
+
+
+class WideExample(SerialisableTableInterface, Base):
+    __tablename__ = "wide_example"
+
+    id: so.Mapped[int] = so.mapped_column(sa.Integer, primary_key=True)
+    zeta: so.Mapped[str | None] = so.mapped_column(sa.String)
+    alpha: so.Mapped[float | None] = so.mapped_column(sa.Float)
+    flag: so.Mapped[bool | None] = so.mapped_column(sa.Boolean)
+    when: so.Mapped[datetime.datetime | None] = so.mapped_column(sa.DateTime)
+    amount: so.Mapped[Decimal | None] = so.mapped_column(sa.Numeric)
+    payload: so.Mapped[dict | None] = so.mapped_column(sa.JSON)
+
+
+class _Colour(str, Enum):
+    RED = "réd"
+
+
+def _reference_json(obj, **kwargs) -> str:
+    return json.dumps(obj.to_dict(**kwargs), default=json_default, sort_keys=True)
+
+
+@pytest.mark.parametrize(
+    "values",
+    [
+        {"id": 1, "zeta": "plain", "alpha": 1.5, "flag": True, "when": datetime.datetime(2024, 1, 2, 3, 4, 5)},
+        {"id": 2, "zeta": 'quote " ünï ☃ \n', "alpha": float("nan"), "flag": False},
+        {"id": 3, "alpha": float("-inf"), "payload": {"b": [1, 2.0, None], "a": "x"}},
+        {"id": 4, "zeta": _Colour.RED, "alpha": 1e20},
+    ],
+)
+def test_compiled_json_is_byte_identical_to_stdlib(values):
+    obj = WideExample(**values)
+
+    for kwargs in ({}, {"include_nulls": True}, {"only": {"zeta", "id"}}, {"exclude": {"id"}}):
+        assert obj.to_json(**kwargs) == _reference_json(obj, **kwargs)
+    expected = hashlib.sha256(_reference_json(obj, include_nulls=True).encode("utf-8")).hexdigest()
+    assert obj.fingerprint() == expected
+
+
+@pytest.mark.parametrize("value", [Decimal("1.10"), datetime.time(10, 30)])
+def test_to_json_still_rejects_decimals_and_times(value):
+    assert json_default(datetime.date(2024, 1, 2)) == "2024-01-02"
+    with pytest.raises(TypeError, match="not JSON serialisable"):
+        json_default(value)
+
+    obj = WideExample(id=1, payload={"v": value})
+    with pytest.raises(TypeError, match="not JSON serialisable"):
+        obj.to_json()
+    with pytest.raises(TypeError, match="not JSON serialisable"):
+        obj.fingerprint()
+    with pytest.raises(TypeError, match="not JSON serialisable"):
+        WideExample(id=1, amount=value).to_json()
+
+
+def test_fingerprint_many_accepts_instances_and_mappings():
+    objs = [WideExample(id=i, zeta=f"z{i}", alpha=i / 3) for i in range(5)]
+    mappings = [{"id": o.id, "zeta": o.zeta, "alpha": o.alpha} for o in objs]
+
+    assert WideExample.fingerprint_many(objs) == [o.fingerprint() for o in objs]
+    assert WideExample.fingerprint_many(mappings) == [o.fingerprint() for o in objs]
+
+
+def test_export_ndjson_lines_equal_to_json(export_session, tmp_path):
+    export_session.add(WideExample(id=1, zeta="z", alpha=float("nan"), payload={"b": 1, "a": [None]}))
+    export_session.commit()
+    path = tmp_path / "wide_example.ndjson"
+
+    assert WideExample.export_ndjson(export_session, path) == 1
+
+    obj = export_session.get(WideExample, 1)
+    assert path.read_text().splitlines() == [obj.to_json(include_nulls=True)]
+
+
+def test_export_ndjson_writes_decimals_as_exact_text(export_session, tmp_path):
+    export_session.add(WideExample(id=1, amount=Decimal("1.10"), payload={"t": "x"}))
+    export_session.commit()
+    path = tmp_path / "wide_example.ndjson"
+
+    WideExample.export_ndjson(export_session, path, columns=["id", "amount"])
+
+    (line,) = path.read_text().splitlines()
+    record = json.loads(line)
+    assert isinstance(record["amount"], str) and Decimal(record["amount"]) == Decimal("1.10")
+
+
+def test_unbounded_numeric_exports_exact_text(export_session):
+    export_session.add(WideExample(id=1, amount=Decimal("1.10")))
+    export_session.commit()
+
+    batch = next(WideExample.iter_record_batches(export_session, columns=["amount"]))
+
+    assert WideExample.export_schema(["amount"]).field("amount").type == pa.string()
+    (text,) = batch.column("amount").to_pylist()
+    assert text == str(export_session.get(WideExample, 1).amount)
+    assert Decimal(text) == Decimal("1.10")
+
+
+class RedactedExample(WideExample):
+    def to_dict(self, **kwargs):
+        data = super().to_dict(**kwargs)
+        data.pop("zeta", None)
+        return data
+
+
+def test_to_dict_override_is_honoured_by_json_and_fingerprints():
+    obj = RedactedExample(id=1, zeta="secret", alpha=2.0)
+
+    assert "secret" not in obj.to_json()
+    assert obj.to_json() == _reference_json(obj)
+    expected = hashlib.sha256(_reference_json(obj, include_nulls=True).encode("utf-8")).hexdigest()
+    assert obj.fingerprint() == expected
+    assert RedactedExample.fingerprint_many([obj]) == [expected]
@@ -0,0 +1,94 @@
+from typing import Type, cast
+
+import pandas as pd
+import sqlalchemy as sa
+
+from orm_loader.backends import resolve_backend
+from orm_loader.loaders.loader_interface import PandasLoader
+from orm_loader.tables import StagingTablePool
+from orm_loader.tables.staging_pool import schema_fingerprint
+from orm_loader.tables.typing import CSVTableProtocol
+from tests.models import HashedTable, SimpleTable
+
+_SimpleTable = cast(Type[CSVTableProtocol], SimpleTable)
+
+
+def _load(session, tmp_path, rows, **kwargs) -> int:
+    csv_path = tmp_path / "test_table.csv"
+    pd.DataFrame(rows).to_csv(csv_path, index=False, sep="\t")
+    return _SimpleTable.load_csv(session, csv_path, loader=PandasLoader(), reuse_staging=True, **kwargs)
+
+
+def _staging_rows(session) -> int:
+    return session.execute(sa.text("SELECT COUNT(*) FROM _staging_test_table")).scalar_one()
+
+
+def test_reused_staging_table_is_kept_empty_between_loads(session, engine, tmp_path):
+    _load(session, tmp_path, [{"id": 1, "name": "a"}, {"id": 2, "name": "b"}])
+    pooled = StagingTablePool.for_bind(engine).acquire(_SimpleTable, session, resolve_backend(session))
+
+    assert sa.inspect(engine).has_table("_staging_test_table")
+    assert _staging_rows(session) == 0
+
+    _load(session, tmp_path, [{"id": 2, "name": "B"}, {"id": 3, "name": "c"}], merge_strategy="replace")
+
+    rows = session.execute(sa.select(SimpleTable.id, SimpleTable.name).order_by(SimpleTable.id)).all()
+    assert [tuple(r) for r in rows] == [(1, "a"), (2, "B"), (3, "c")]
+    assert StagingTablePool.for_bind(engine).acquire(_SimpleTable, session, resolve_backend(session)) is pooled
+
+
+def test_reused_staging_skips_ddl(session, engine, tmp_path):
+    _load(session, tmp_path, [{"id": 1, "name": "a"}])
+    statements: list[str] = []
+    sa.event.listen(engine, "before_cursor_execute", lambda *a: statements.append(a[2]))
+
+    _load(session, tmp_path, [{"id": 2, "name": "b"}], merge_strategy="upsert")
+
+    assert not [s for s in statements if s.lstrip().upper().startswith(("CREATE", "DROP"))]
+    assert any(s.startswith("DELETE FROM") and "_staging_test_table" in s for s in statements)
+
+
+def test_dirty_pooled_table_is_emptied_on_acquire(session, engine, tmp_path):
+    _load(session, tmp_path, [{"id": 1, "name": "a"}])
+    pool = StagingTablePool.for_bind(engine)
+    backend = resolve_backend(session)
+    staging = pool.acquire(_SimpleTable, session, backend)
+    session.execute(sa.insert(staging), [{"id": 9, "name": "left over"}])
+    session.commit()
+
+    pool.acquire(_SimpleTable, session, backend)
+
+    assert _staging_rows(session) == 0
+
+
+def test_dropping_staging_table_invalidates_pool(session, engine, tmp_path):
+    _load(session, tmp_path, [{"id": 1, "name": "a"}])
+    _SimpleTable.drop_staging_table(session)
+
+    _load(session, tmp_path, [{"id": 2, "name": "b"}], merge_strategy="upsert")
+
+    assert session.execute(sa.select(sa.func.count()).select_from(SimpleTable)).scalar_one() == 2
+
+
+def test_schema_fingerprint_tracks_columns():
+    assert schema_fingerprint(_SimpleTable) == schema_fingerprint(_SimpleTable)
+    assert schema_fingerprint(_SimpleTable) != schema_fingerprint(cast(Type[CSVTableProtocol], HashedTable))
+
+
+def test_pools_are_per_engine(engine):
+    other = sa.create_engine("sqlite:///:memory:")
+    assert StagingTablePool.for_bind(engine) is StagingTablePool.for_bind(engine)
+    assert StagingTablePool.for_bind(engine) is not StagingTablePool.for_bind(other)
+
+
+def test_load_csv_creates_staging_once_without_reflection(session, engine, tmp_path):
+    statements: list[str] = []
+    sa.event.listen(engine, "before_cursor_execute", lambda *a: statements.append(a[2]))
+    csv_path = tmp_path / "test_table.csv"
+    pd.DataFrame([{"id": 1, "name": "a"}]).to_csv(csv_path, index=False, sep="\t")
+
+    _SimpleTable.load_csv(session, csv_path, loader=PandasLoader())
+
+    creates = [s for s in statements if "CREATE TABLE" in s and "_staging_test_table" in s]
+    assert len(creates) == 1
+    assert not [s for s in statements if "PRAGMA" in s and "_staging_test_table" in s]